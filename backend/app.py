@@ -6,15 +6,29 @@ from flask_cors import CORS
 from dotenv import load_dotenv
 import argparse, os
 
-from utils.auth_utils import configure_serializer, verify_token, generate_token
+from utils.auth_utils import (
+    configure_serializer, configure_token_state_cache, configure_session_store, verify_token, generate_token
+)
+from utils.session_store import create_session_store
+from utils.hash_pool import configure_hash_pool
+from utils.body_codec import configure_body_codec
+from utils.db_router import DBRouter, ReplicaPool, configure_stickiness
+from utils.llm_cache import configure_llm_cache
+from utils.single_flight import SingleFlight
 from globals import mysql, bcrypt, auth, swagger
 
 # import repositories
 from repositories.user_repository import UserRepository
 from repositories.project_repository import ProjectRepository
+from repositories.purge_repository import PurgeRepository
+from repositories.generation_job_repository import GenerationJobRepository
+from repositories.llm_cache_repository import LLMCacheRepository
+from repositories.generation_lock_repository import GenerationLockRepository
 # import services
 from services.user_service import UserService
 from services.project_service import ProjectService
+from services.purge_service import PurgeService, start_purge_worker
+from services.generation_service import GenerationJobService, start_generation_workers
 
 
 def load_environment():
@@ -59,16 +73,83 @@ def create_app():
     app.config['MYSQL_USER'] =  os.getenv("DB_USER")
     app.config['MYSQL_PASSWORD'] =  os.getenv("DB_PASSWORD")
     app.config['MYSQL_DB'] = os.getenv("DB_NAME")
+    app.config['DB_POOL_MIN_SIZE'] = int(os.getenv("DB_POOL_MIN_SIZE", 1))
+    app.config['DB_POOL_MAX_SIZE'] = int(os.getenv("DB_POOL_MAX_SIZE", 10))  # per process
+    app.config['DB_POOL_MAX_IDLE'] = int(os.getenv("DB_POOL_MAX_IDLE", 300))  # seconds before an idle connection is closed
+    app.config['DB_POOL_MAX_LIFETIME'] = int(os.getenv("DB_POOL_MAX_LIFETIME", 3600))
+    app.config['DB_POOL_TIMEOUT'] = int(os.getenv("DB_POOL_TIMEOUT", 5))  # seconds to wait for a free connection
+    app.config['DB_REPLICA_HOSTS'] = [h for h in os.getenv("DB_REPLICA_HOSTS", "").split(",") if h.strip()]  # host[:port],...
+    app.config['DB_STICKY_SECONDS'] = int(os.getenv("DB_STICKY_SECONDS", 5))  # reads go to the primary this long after a write
 
     app.config['SECRET_KEY'] =  os.getenv("SECRET_KEY")
     app.config['MYSQL_CURSORCLASS'] = os.getenv("MYSQL_CURSORCLASS")
     app.config['GEMINI_API_KEY'] = os.getenv("GEMINI_API_KEY")
+    app.config['GEMINI_MAX_CONNECTIONS'] = int(os.getenv("GEMINI_MAX_CONNECTIONS", 10))
+    app.config['GEMINI_KEEPALIVE_SECONDS'] = int(os.getenv("GEMINI_KEEPALIVE_SECONDS", 120))  # idle Gemini connections stay open this long
+    app.config['LLM_CACHE_ENABLED'] = os.getenv("LLM_CACHE_ENABLED", "1") == "1"
+    app.config['LLM_CACHE_SIZE'] = int(os.getenv("LLM_CACHE_SIZE", 256))  # in-process entries
+    app.config['LLM_CACHE_TTL'] = int(os.getenv("LLM_CACHE_TTL", 86400))  # seconds
+    app.config['LLM_CACHE_MAX_ROWS'] = int(os.getenv("LLM_CACHE_MAX_ROWS", 10000))  # shared table bound
+    app.config['TOKEN_STATE_CACHE_SIZE'] = int(os.getenv("TOKEN_STATE_CACHE_SIZE", 4096))
+    app.config['TOKEN_STATE_CACHE_TTL'] = int(os.getenv("TOKEN_STATE_CACHE_TTL", 30))  # seconds a revoked token may still pass
+    app.config['SESSION_STORE'] = os.getenv("SESSION_STORE", "sqlite")  # sqlite | memory (one process; sessions end on restart)
+    app.config['SESSION_STORE_PATH'] = os.getenv("SESSION_STORE_PATH", "/tmp/jenga/sessions.db")
+    app.config['WEB_CONCURRENCY'] = int(os.getenv("WEB_CONCURRENCY", 1))  # worker processes; gunicorn reads the same variable
+    app.config['SESSION_TTL'] = int(os.getenv("SESSION_TTL", 86400))
+    app.config['SESSION_MAX_SIZE'] = int(os.getenv("SESSION_MAX_SIZE", 10000))
+    app.config['BCRYPT_LOG_ROUNDS'] = int(os.getenv("BCRYPT_LOG_ROUNDS", 12))  # see `flask hash calibrate`
+    app.config['HASH_POOL_WORKERS'] = int(os.getenv("HASH_POOL_WORKERS", 2))  # 0 = hash inline
+    app.config['HASH_POOL_MAX_PENDING'] = int(os.getenv("HASH_POOL_MAX_PENDING", 16))
+    app.config['HASH_POOL_TIMEOUT'] = int(os.getenv("HASH_POOL_TIMEOUT", 10))
+    app.config['BODY_CODEC'] = os.getenv("BODY_CODEC", "zlib")  # zlib | zstd (needs zstandard) | none
+    app.config['BODY_CODEC_LEVEL'] = int(os.getenv("BODY_CODEC_LEVEL", 6))
+    app.config['PURGE_WORKER_ENABLED'] = os.getenv("PURGE_WORKER_ENABLED", "1") == "1"
+    app.config['PURGE_INTERVAL'] = int(os.getenv("PURGE_INTERVAL", 30))
+    app.config['PURGE_BATCH_SIZE'] = int(os.getenv("PURGE_BATCH_SIZE", 500))
+    app.config['PURGE_MAX_LOCK_MS'] = int(os.getenv("PURGE_MAX_LOCK_MS", 200))  # per-batch lock budget
+    app.config['GENERATION_WORKERS'] = int(os.getenv("GENERATION_WORKERS", 2))  # 0 = this process only enqueues
+    app.config['GENERATION_POLL_INTERVAL'] = int(os.getenv("GENERATION_POLL_INTERVAL", 2))
+    app.config['GENERATION_MAX_ATTEMPTS'] = int(os.getenv("GENERATION_MAX_ATTEMPTS", 3))
+    app.config['GENERATION_STALE_SECONDS'] = int(os.getenv("GENERATION_STALE_SECONDS", 300))  # running jobs older than this are requeued
+    app.config['GENERATION_LOCK_TTL'] = int(os.getenv("GENERATION_LOCK_TTL", 120))  # cross-process lock expiry for identical generations
     
     mysql.init_app(app)
+    replicas = ReplicaPool(
+        app.config['DB_REPLICA_HOSTS'],
+        user=app.config['MYSQL_USER'],
+        password=app.config['MYSQL_PASSWORD'],
+        db=app.config['MYSQL_DB'],
+        cursorclass=app.config['MYSQL_CURSORCLASS'],
+        max_size=app.config['DB_POOL_MAX_SIZE'],
+        timeout=app.config['DB_POOL_TIMEOUT'],
+    )
+    replicas.init_app(app)
+    app.db_router = DBRouter(mysql, replicas)
     bcrypt.init_app(app)
     swagger.init_app(app)
     
-    configure_serializer(app.config['SECRET_KEY'])
+    configure_serializer(app.config['SECRET_KEY'], max_age=app.config['SESSION_TTL'])
+    configure_token_state_cache(app.config['TOKEN_STATE_CACHE_SIZE'], app.config['TOKEN_STATE_CACHE_TTL'])
+    session_store = create_session_store(
+        app.config['SESSION_STORE'],
+        path=app.config['SESSION_STORE_PATH'],
+        ttl=app.config['SESSION_TTL'],
+        max_size=app.config['SESSION_MAX_SIZE'],
+        workers=app.config['WEB_CONCURRENCY'],
+    )
+    configure_session_store(session_store)
+    # a shared session store also carries read-your-writes stickiness between workers
+    configure_stickiness(
+        app.config['DB_STICKY_SECONDS'],
+        store=session_store if app.config['SESSION_STORE'] != 'memory' else None,
+    )
+    configure_hash_pool(
+        workers=app.config['HASH_POOL_WORKERS'],
+        max_pending=app.config['HASH_POOL_MAX_PENDING'],
+        timeout=app.config['HASH_POOL_TIMEOUT'],
+        rounds=app.config['BCRYPT_LOG_ROUNDS'],
+    )
+    configure_body_codec(app.config['BODY_CODEC'], level=app.config['BODY_CODEC_LEVEL'])
     
     CORS(app, resources={
         r"/api/*": {
@@ -82,11 +163,35 @@ def create_app():
     auth.verify_token(lambda token: verify_token(token, app.user_repo))
 
     # initialize repositories
-    app.user_repo = UserRepository(mysql)
-    app.project_repo = ProjectRepository(mysql)
+    # repositories route @reads methods to replicas through the router
+    app.user_repo = UserRepository(app.db_router)
+    app.project_repo = ProjectRepository(app.db_router)
+    app.purge_repo = PurgeRepository(mysql)
+    app.generation_job_repo = GenerationJobRepository(mysql)
+    # identical prompts are answered from memory, then the shared table, before Gemini
+    configure_llm_cache(
+        LLMCacheRepository(mysql),
+        max_size=app.config['LLM_CACHE_SIZE'],
+        ttl=app.config['LLM_CACHE_TTL'],
+        max_rows=app.config['LLM_CACHE_MAX_ROWS'],
+        enabled=app.config['LLM_CACHE_ENABLED'],
+    )
     # initialize services
     app.user_service = UserService(app.user_repo)
-    app.project_service = ProjectService(app.project_repo)
+    app.generation_service = GenerationJobService(
+        app.generation_job_repo,
+        app.project_repo,
+        max_attempts=app.config['GENERATION_MAX_ATTEMPTS'],
+        stale_seconds=app.config['GENERATION_STALE_SECONDS'],
+        # identical generations coalesce within this process and, via the lock table, across processes
+        single_flight=SingleFlight(GenerationLockRepository(mysql), lock_ttl=app.config['GENERATION_LOCK_TTL']),
+    )
+    app.project_service = ProjectService(app.project_repo, app.generation_service)
+    app.purge_service = PurgeService(
+        app.purge_repo,
+        batch_size=app.config['PURGE_BATCH_SIZE'],
+        max_lock_ms=app.config['PURGE_MAX_LOCK_MS'],
+    )
 
 
     # register blueprints
@@ -100,11 +205,41 @@ def create_app():
     app.register_blueprint(admin_bp, url_prefix='/api')
     app.register_blueprint(health_bp, url_prefix='/api')
 
+    # register CLI commands
+    from commands.hash_commands import hash_cli
+    from commands.db_commands import db_cli
+    from commands.storage_commands import storage_cli
+    from commands.purge_commands import purge_cli
+
+    app.cli.add_command(hash_cli)
+    app.cli.add_command(db_cli)
+    app.cli.add_command(storage_cli)
+    app.cli.add_command(purge_cli)
+
     return app
 
 
-    
+def start_background_workers(app):
+    """
+    Start the threads that only the serving process should run. Kept out of
+    create_app so `flask db ...`, `flask purge ...` and other CLI commands
+    never claim a job and then exit mid-call. Under a pre-fork server, call
+    this from the worker's post_fork hook.
+    """
+    # deleted users/projects are soft-deleted, then purged in the background
+    if app.config['PURGE_WORKER_ENABLED']:
+        start_purge_worker(app, app.purge_service, interval=app.config['PURGE_INTERVAL'])
+    # submits return 202 and plan generation runs on these threads
+    if app.config['GENERATION_WORKERS'] > 0:
+        start_generation_workers(
+            app,
+            app.generation_service,
+            workers=app.config['GENERATION_WORKERS'],
+            poll_interval=app.config['GENERATION_POLL_INTERVAL'],
+        )
+
 
 if __name__ == '__main__':
     app = create_app()
+    start_background_workers(app)
     app.run(host="localhost", port=int("5050"))
\ No newline at end of file
@@ -0,0 +1,110 @@
+# benchmarks/bench_save_project.py
+"""
+Counts commits and database round trips for one ProjectRepository
+save_project_complete call, for a few team sizes.
+
+Run from backend/:  python -m benchmarks.bench_save_project
+"""
+import time
+from models.member import Member
+from models.project import Project
+from models.project_detailed import ProjectDetailed, Budget, Timeframe
+from repositories.project_repository import ProjectRepository
+
+
+class CountingCursor:
+    def __init__(self, conn):
+        self.conn = conn
+        self.lastrowid = 0
+        self.rowcount = 1
+
+    def execute(self, sql, params=None):
+        self.conn.round_trips += 1
+        self.conn.statements.append(" ".join(sql.split())[:60])
+        self.lastrowid = self.conn.next_id()
+        self._rows = []
+        if "FROM Member" in sql:
+            # just enough of a Member table for the get-or-create lookups
+            names = list(zip(params[::2], params[1::2]))
+            self._rows = [
+                {"id": self.conn.members[name], "firstName": name[0], "lastName": name[1]}
+                for name in names if name in self.conn.members
+            ]
+
+    def executemany(self, sql, seq):
+        # MySQLdb folds INSERT ... VALUES batches into one multi-row statement
+        self.execute(sql)
+        if "INSERT INTO Member" in sql:
+            for name in seq:
+                self.conn.members[name] = self.conn.next_id()
+
+    def fetchone(self):
+        return None
+
+    def fetchall(self):
+        return self._rows
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *a):
+        return False
+
+
+class CountingConnection:
+    def __init__(self):
+        self.round_trips = 0
+        self.commits = 0
+        self.rollbacks = 0
+        self.statements = []
+        self.members = {}
+        self._id = 0
+
+    def next_id(self):
+        self._id += 1
+        return self._id
+
+    def cursor(self, *a, **k):
+        return CountingCursor(self)
+
+    def commit(self):
+        self.commits += 1
+        self.round_trips += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+        self.round_trips += 1
+
+
+class CountingMySQL:
+    def __init__(self):
+        self.connection = CountingConnection()
+
+
+def build_project(team_size):
+    members = [Member(f"First{i}", f"Last{i}", "Python", "Flask") for i in range(team_size)]
+    return ProjectDetailed(
+        project=Project(id=None, name="Bench", goal_description="Goal"),
+        budget=Budget(floor=100, ceiling=200),
+        timeframe=Timeframe(start="2030-01-01", end="2030-06-01"),
+        team_members=members,
+    )
+
+
+def run(team_sizes=(1, 10, 40)):
+    print(f"{'team':>5} {'commits':>8} {'round trips':>12} {'ms':>8}")
+    for size in team_sizes:
+        mysql = CountingMySQL()
+        repo = ProjectRepository(mysql)
+        started = time.perf_counter()
+        repo.save_project_complete(build_project(size), user_id=1, project_status='draft')
+        elapsed = (time.perf_counter() - started) * 1000
+        conn = mysql.connection
+        print(f"{size:>5} {conn.commits:>8} {conn.round_trips:>12} {elapsed:>8.2f}")
+
+
+if __name__ == '__main__':
+    run()
@@ -0,0 +1,58 @@
+# commands/db_commands.py - schema migration commands
+import click
+from flask.cli import AppGroup, with_appcontext
+from globals import mysql
+from utils.migration_runner import MigrationRunner, MigrationError
+
+db_cli = AppGroup('db', help='Database schema migrations.')
+
+
+def _runner():
+    return MigrationRunner(mysql.connection)
+
+
+@db_cli.command('migrate')
+@click.option('--target', type=int, default=None, help='Stop after this migration version.')
+@click.option('--dry-run', is_flag=True, help='List pending migrations without applying them.')
+@with_appcontext
+def migrate(target, dry_run):
+    """Apply pending migrations from sql/migrations."""
+    def report(m, duration_ms):
+        click.echo(f"applied {m.version:04d}_{m.name} in {duration_ms} ms")
+
+    try:
+        result = _runner().migrate(target=target, dry_run=dry_run, on_applied=report)
+    except MigrationError as e:
+        raise click.ClickException(str(e))
+
+    if not result:
+        click.echo("Database is up to date.")
+    elif dry_run:
+        for m, _ in result:
+            click.echo(f"pending {m.version:04d}_{m.name}")
+
+
+@db_cli.command('status')
+@with_appcontext
+def status():
+    """Show applied and pending migrations."""
+    for m, row in _runner().status():
+        if row:
+            click.echo(f"{m.version:04d}_{m.name:<40} applied {row['appliedAt']} ({row['durationMs']} ms)")
+        else:
+            click.echo(f"{m.version:04d}_{m.name:<40} pending")
+
+
+@db_cli.command('stamp')
+@click.option('--target', type=int, default=None, help='Stamp up to this migration version.')
+@with_appcontext
+def stamp(target):
+    """Mark migrations as applied without running them (fresh installs from tables.sql)."""
+    try:
+        stamped = _runner().stamp(target=target)
+    except MigrationError as e:
+        raise click.ClickException(str(e))
+    for m in stamped:
+        click.echo(f"stamped {m.version:04d}_{m.name}")
+    if not stamped:
+        click.echo("Nothing to stamp.")
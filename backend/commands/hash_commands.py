@@ -0,0 +1,25 @@
+# commands/hash_commands.py - password hashing maintenance commands
+import click
+from flask.cli import AppGroup
+from utils.hash_pool import calibrate_rounds
+
+hash_cli = AppGroup('hash', help='Password hashing maintenance.')
+
+
+@hash_cli.command('calibrate')
+@click.option('--target-ms', default=250, show_default=True, help='Latency budget for one hash.')
+@click.option('--min-rounds', default=10, show_default=True)
+@click.option('--max-rounds', default=16, show_default=True)
+@click.option('--samples', default=3, show_default=True, help='Hashes timed per cost factor.')
+def calibrate(target_ms, min_rounds, max_rounds, samples):
+    """Benchmark bcrypt on this host and recommend BCRYPT_LOG_ROUNDS."""
+    rounds, timings = calibrate_rounds(target_ms, min_rounds, max_rounds, samples)
+
+    for cost, ms in timings.items():
+        marker = '  <-- selected' if cost == rounds else ''
+        click.echo(f"rounds={cost:<3} median={ms} ms{marker}")
+
+    if timings.get(rounds, 0) > target_ms:
+        click.echo(f"Warning: even rounds={min_rounds} exceeds the {target_ms} ms budget on this host.")
+    click.echo(f"\nSet BCRYPT_LOG_ROUNDS={rounds} in the environment file; "
+               "existing hashes are upgraded on next login.")
@@ -0,0 +1,36 @@
+# commands/purge_commands.py - purge soft-deleted users and projects
+import click
+from flask import current_app
+from flask.cli import AppGroup, with_appcontext
+
+purge_cli = AppGroup('purge', help='Purge soft-deleted users and projects.')
+
+
+@purge_cli.command('run')
+@click.option('--max-batches', type=int, default=None, help='Stop after this many batches.')
+@with_appcontext
+def run(max_batches):
+    """Purge now instead of waiting for the background worker."""
+    service = current_app.purge_service
+
+    def progress(stats):
+        current = stats['current']
+        where = f"project {current['project_id']} ({current['table']})" if current else "idle"
+        click.echo(
+            f"batches={stats['batches']} rows={stats['rows_deleted']} "
+            f"batch_size={stats['batch_size']} last={stats['last_batch_ms']} ms  {where}"
+        )
+
+    if not service.run_once(max_batches=max_batches, on_progress=progress):
+        raise click.ClickException("Another process is purging; try again later.")
+
+    stats = service.stats()
+    click.echo(f"Purged {stats['projects_purged']} projects and {stats['users_purged']} users.")
+
+
+@purge_cli.command('status')
+@with_appcontext
+def status():
+    """Show how many soft-deleted rows are waiting to be purged."""
+    pending = current_app.purge_repo.pending_counts()
+    click.echo(f"Pending: {pending['projects']} projects, {pending['users']} users")
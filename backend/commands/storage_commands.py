@@ -0,0 +1,42 @@
+# commands/storage_commands.py - stored prompt/response body maintenance
+import click
+from flask import current_app
+from flask.cli import AppGroup, with_appcontext
+from repositories.project_repository import BODY_COLUMNS
+
+storage_cli = AppGroup('storage', help='Stored prompt and LLM response bodies.')
+
+
+def _ratio(before, after):
+    return round(before / after, 2) if after else 0.0
+
+
+@storage_cli.command('compress')
+@click.option('--batch-size', default=500, show_default=True, help='Rows rewritten per transaction.')
+@click.option('--table', type=click.Choice(sorted(BODY_COLUMNS)), multiple=True,
+              help='Limit to one table (repeatable). Defaults to all.')
+@with_appcontext
+def compress(batch_size, table):
+    """Backfill: compress bodies written before compression was enabled."""
+    repo = current_app.project_repo
+
+    def progress(name, stats):
+        click.echo(f"{name}: {stats['rows']} rows scanned, {stats['rewritten']} rewritten")
+
+    for name in table or sorted(BODY_COLUMNS):
+        stats = repo.compress_stored_bodies(name, batch_size=batch_size, on_batch=progress)
+        click.echo(
+            f"{name}: done, {stats['bytes_before']} -> {stats['bytes_after']} bytes "
+            f"(ratio {_ratio(stats['bytes_before'], stats['bytes_after'])}x)"
+        )
+
+
+@storage_cli.command('stats')
+@with_appcontext
+def stats():
+    """Report the compression ratio of stored LLM responses."""
+    sizes = current_app.project_repo.stored_body_sizes()
+    click.echo(
+        f"GenerationHistory: {sizes['rows_total']} rows, {sizes['original_bytes']} bytes uncompressed, "
+        f"{sizes['stored_bytes']} bytes stored (ratio {_ratio(sizes['original_bytes'], sizes['stored_bytes'])}x)"
+    )
@@ -1,11 +1,11 @@
 # globals.py
-from flask_mysqldb import MySQL
+from utils.db_pool import PooledMySQL
 from flask_bcrypt import Bcrypt
 from flask_httpauth import HTTPTokenAuth
 from flasgger import Swagger
 
 # Flask extensions / global objects
-mysql = MySQL()
+mysql = PooledMySQL()  # pooled drop-in for flask_mysqldb.MySQL
 bcrypt = Bcrypt()
 auth = HTTPTokenAuth(scheme='Bearer')
 swagger = Swagger()
@@ -0,0 +1,29 @@
+# models/generation_history.py
+from datetime import datetime
+
+
+# one past generation; llm_response stays None until the body is requested
+class GenerationHistoryEntry:
+    def __init__(self, id, project_id, prompt_id=None, version=None, date_time_created=None,
+                 response_size=None, llm_response=None):
+        self.id = id
+        self.project_id = project_id
+        self.prompt_id = prompt_id
+        self.version = version
+        self.date_time_created = date_time_created
+        self.response_size = response_size
+        self.llm_response = llm_response
+
+    def to_dict(self):
+        data = {
+            "id": self.id,
+            "projectId": self.project_id,
+            "promptId": self.prompt_id,
+            "version": self.version,
+            "dateTimeCreated": self.date_time_created.isoformat()
+            if isinstance(self.date_time_created, datetime) else self.date_time_created,
+            "responseSize": self.response_size,
+        }
+        if self.llm_response is not None:
+            data["llmResponse"] = self.llm_response
+        return data
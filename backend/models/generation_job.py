@@ -0,0 +1,32 @@
+# models/generation_job.py
+from datetime import datetime
+
+
+def _isoformat(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+
+# a queued/running/finished plan generation for one project submit
+class GenerationJob:
+    def __init__(self, id, project_id, status='queued', attempts=0, prompt_id=None, error=None,
+                 date_time_created=None, date_time_updated=None):
+        self.id = id
+        self.project_id = project_id
+        self.status = status
+        self.attempts = attempts
+        self.prompt_id = prompt_id
+        self.error = error
+        self.date_time_created = date_time_created
+        self.date_time_updated = date_time_updated
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "projectId": self.project_id,
+            "status": self.status,
+            "attempts": self.attempts,
+            "promptId": self.prompt_id,
+            "error": self.error,
+            "dateTimeCreated": _isoformat(self.date_time_created),
+            "dateTimeUpdated": _isoformat(self.date_time_updated),
+        }
@@ -1,4 +1,5 @@
-from datetime import datetime
+from datetime import date
+from decimal import Decimal
 
 # only include fields in basic Project table
 class Project:
@@ -20,4 +21,58 @@ class Project:
             "status": self.status,
             "userId": self.user_id,
         }
-        
\ No newline at end of file
+        
+
+# list-view projection of Project: no TEXT columns
+class ProjectSummary:
+    def __init__(self, id, name, status='draft', user_id=None,
+                 date_time_created=None, date_time_updated=None):
+        self.id = id
+        self.name = name
+        self.status = status
+        self.user_id = user_id
+        self.date_time_created = date_time_created
+        self.date_time_updated = date_time_updated
+
+    def to_dict(self):
+        return {
+            "id": self.id,
+            "name": self.name,
+            "status": self.status,
+            "userId": self.user_id,
+            "dateTimeCreated": _isoformat(self.date_time_created),
+            "dateTimeUpdated": _isoformat(self.date_time_updated),
+        }
+
+
+# one dashboard card: the summary plus budget, timeframe, team size and last generation
+class ProjectDashboardEntry:
+    def __init__(self, summary, budget_floor=None, budget_ceiling=None, start_date=None,
+                 end_date=None, member_count=0, last_generated_at=None):
+        self.summary = summary
+        self.budget_floor = budget_floor
+        self.budget_ceiling = budget_ceiling
+        self.start_date = start_date
+        self.end_date = end_date
+        self.member_count = member_count
+        self.last_generated_at = last_generated_at
+
+    def to_dict(self):
+        data = self.summary.to_dict()
+        data.update({
+            "budgetFloor": _number(self.budget_floor),
+            "budgetCeiling": _number(self.budget_ceiling),
+            "startDate": _isoformat(self.start_date),
+            "endDate": _isoformat(self.end_date),
+            "memberCount": self.member_count,
+            "lastGeneratedAt": _isoformat(self.last_generated_at),
+        })
+        return data
+
+
+def _isoformat(value):
+    return value.isoformat() if isinstance(value, date) else value
+
+
+def _number(value):
+    return float(value) if isinstance(value, Decimal) else value
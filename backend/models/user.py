@@ -1,5 +1,5 @@
 class User:
-    def __init__(self, id, first_name, last_name, email, role, status=None, password=None):
+    def __init__(self, id, first_name, last_name, email, role, status=None, password=None, token_version=0):
         self.id = id
         self.first_name = first_name
         self.last_name = last_name
@@ -7,6 +7,7 @@ class User:
         self.role = role
         self.status = status
         self.password = password
+        self.token_version = token_version
 
     def to_dict(self):
         return {
@@ -0,0 +1,164 @@
+# repositories/generation_job_repository.py
+import json
+from models.generation_job import GenerationJob
+from repositories.unit_of_work import transaction
+from utils.body_codec import encode_body, decode_body
+
+JOB_COLUMNS = "J.id, J.projectId, J.status, J.attempts, J.promptId, J.error, J.dateTimeCreated, J.dateTimeUpdated"
+
+
+class GenerationJobRepository:
+    """
+    Durable queue of plan generation jobs. Always talks to the primary:
+    workers claim jobs with an UPDATE and read them straight back.
+    """
+
+    def __init__(self, mysql):
+        self.mysql = mysql
+
+    def enqueue(self, project_id, payload):
+        with transaction(self.mysql.connection) as cur:
+            cur.execute(
+                "INSERT INTO GenerationJob (projectId, payload) VALUES (%s, %s)",
+                (project_id, encode_body(json.dumps(payload)))
+            )
+            return cur.lastrowid
+
+    def claim_next(self, token):
+        """
+        Mark the oldest queued job as running under token and return it
+        (with its decoded payload), or None when the queue is empty.
+        """
+        with transaction(self.mysql.connection) as cur:
+            cur.execute(
+                """
+                UPDATE GenerationJob
+                SET status='running', lockedBy=%s, lockedAt=NOW(), attempts=attempts + 1
+                WHERE status='queued'
+                ORDER BY id
+                LIMIT 1
+                """,
+                (token,)
+            )
+            if cur.rowcount == 0:
+                return None
+            cur.execute(
+                "SELECT id, projectId, payload, attempts FROM GenerationJob WHERE lockedBy=%s AND status='running'",
+                (token,)
+            )
+            row = cur.fetchone()
+        if not row:
+            return None
+        return {
+            'id': row['id'],
+            'project_id': row['projectId'],
+            'attempts': row['attempts'],
+            'payload': json.loads(decode_body(row['payload'])),
+        }
+
+    def mark_done(self, job_id, token, project_id, prompt_id):
+        with transaction(self.mysql.connection) as cur:
+            cur.execute(
+                """
+                UPDATE GenerationJob
+                SET status='done', promptId=%s, error=NULL, lockedBy=NULL
+                WHERE id=%s AND lockedBy=%s
+                """,
+                (prompt_id, job_id, token)
+            )
+            cur.execute(
+                "UPDATE Project SET status='submitted' WHERE id=%s AND status IN ('generating', 'failed')",
+                (project_id,)
+            )
+
+    def mark_failed(self, job_id, token, project_id, error, retry):
+        """Requeue the job when retry is set, otherwise fail it and its project."""
+        with transaction(self.mysql.connection) as cur:
+            cur.execute(
+                """
+                UPDATE GenerationJob
+                SET status=%s, error=%s, lockedBy=NULL, lockedAt=NULL
+                WHERE id=%s AND lockedBy=%s
+                """,
+                ('queued' if retry else 'failed', error[:2000], job_id, token)
+            )
+            if not retry:
+                cur.execute(
+                    "UPDATE Project SET status='failed' WHERE id=%s AND status='generating'",
+                    (project_id,)
+                )
+
+    def mark_project_failed(self, project_id):
+        with transaction(self.mysql.connection) as cur:
+            cur.execute(
+                "UPDATE Project SET status='failed' WHERE id=%s AND status='generating'",
+                (project_id,)
+            )
+
+    def requeue_stale(self, stale_seconds):
+        """
+        Put jobs left 'running' by a worker that died (restart, crash) back
+        in the queue. Returns how many were requeued.
+        """
+        with transaction(self.mysql.connection) as cur:
+            cur.execute(
+                """
+                UPDATE GenerationJob
+                SET status='queued', lockedBy=NULL, lockedAt=NULL
+                WHERE status='running' AND lockedAt < NOW() - INTERVAL %s SECOND
+                """,
+                (stale_seconds,)
+            )
+            return cur.rowcount
+
+    def fail_orphaned_projects(self, stale_seconds):
+        """
+        Fail projects stuck in 'generating' with no queued or running job,
+        e.g. a streamed submit whose process died mid-stream. Returns how
+        many were failed.
+        """
+        with transaction(self.mysql.connection) as cur:
+            cur.execute(
+                """
+                UPDATE Project P
+                SET P.status='failed'
+                WHERE P.status='generating' AND P.deletedAt IS NULL
+                  AND P.dateTimeUpdated < NOW() - INTERVAL %s SECOND
+                  AND NOT EXISTS (
+                      SELECT 1 FROM GenerationJob J
+                      WHERE J.projectId = P.id AND J.status IN ('queued', 'running')
+                  )
+                """,
+                (stale_seconds,)
+            )
+            return cur.rowcount
+
+    def get_job(self, job_id, user_id):
+        with self.mysql.connection.cursor() as cur:
+            cur.execute(
+                f"""
+                SELECT {JOB_COLUMNS}
+                FROM GenerationJob J
+                JOIN Project P ON P.id = J.projectId
+                WHERE J.id=%s AND P.userId=%s AND P.deletedAt IS NULL
+                """,
+                (job_id, user_id)
+            )
+            row = cur.fetchone()
+        if not row:
+            return None
+        return GenerationJob(
+            id=row['id'],
+            project_id=row['projectId'],
+            status=row['status'],
+            attempts=row['attempts'],
+            prompt_id=row['promptId'],
+            error=row['error'],
+            date_time_created=row['dateTimeCreated'],
+            date_time_updated=row['dateTimeUpdated'],
+        )
+
+    def status_counts(self):
+        with self.mysql.connection.cursor() as cur:
+            cur.execute("SELECT status, COUNT(*) AS n FROM GenerationJob GROUP BY status")
+            return {row['status']: row['n'] for row in cur.fetchall()}
@@ -0,0 +1,39 @@
+# repositories/generation_lock_repository.py
+
+
+class GenerationLockRepository:
+    """
+    Expiring row locks that let app processes coalesce identical plan
+    generations (see utils.single_flight). A crashed owner's row is taken
+    over once it expires.
+    """
+
+    def __init__(self, mysql):
+        self.mysql = mysql
+
+    def acquire(self, lock_key, owner, ttl_seconds):
+        with self.mysql.connection.cursor() as cur:
+            # assignments run left to right: expiresAt only moves when the
+            # owner update above it just handed the row to us
+            cur.execute(
+                """
+                INSERT INTO GenerationLock (lockKey, owner, expiresAt)
+                VALUES (%s, %s, NOW() + INTERVAL %s SECOND)
+                ON DUPLICATE KEY UPDATE
+                    owner = IF(expiresAt < NOW(), VALUES(owner), owner),
+                    expiresAt = IF(owner = VALUES(owner), VALUES(expiresAt), expiresAt)
+                """,
+                (lock_key, owner, ttl_seconds)
+            )
+            cur.execute("SELECT owner FROM GenerationLock WHERE lockKey=%s", (lock_key,))
+            row = cur.fetchone()
+        self.mysql.connection.commit()
+        return bool(row and row['owner'] == owner)
+
+    def release(self, lock_key, owner):
+        with self.mysql.connection.cursor() as cur:
+            cur.execute(
+                "DELETE FROM GenerationLock WHERE lockKey=%s AND owner=%s",
+                (lock_key, owner)
+            )
+        self.mysql.connection.commit()
@@ -0,0 +1,64 @@
+# repositories/llm_cache_repository.py
+from utils.body_codec import encode_body, decode_body
+
+
+class LLMCacheRepository:
+    """Shared tier of the LLM response cache, keyed by the prompt hash."""
+
+    def __init__(self, mysql):
+        self.mysql = mysql
+
+    def get(self, cache_key, max_age_seconds):
+        with self.mysql.connection.cursor() as cur:
+            cur.execute(
+                """
+                SELECT response FROM LLMResponseCache
+                WHERE cacheKey=%s AND dateTimeCreated > NOW() - INTERVAL %s SECOND
+                """,
+                (cache_key, max_age_seconds)
+            )
+            row = cur.fetchone()
+            if not row:
+                return None
+            cur.execute(
+                "UPDATE LLMResponseCache SET hits = hits + 1, lastUsedAt = NOW() WHERE cacheKey=%s",
+                (cache_key,)
+            )
+        self.mysql.connection.commit()
+        return decode_body(row['response'])
+
+    def put(self, cache_key, model, response):
+        with self.mysql.connection.cursor() as cur:
+            cur.execute(
+                """
+                INSERT INTO LLMResponseCache (cacheKey, model, response, responseSize)
+                VALUES (%s, %s, %s, %s)
+                ON DUPLICATE KEY UPDATE
+                    response = VALUES(response),
+                    responseSize = VALUES(responseSize),
+                    dateTimeCreated = NOW(),
+                    lastUsedAt = NOW(),
+                    hits = 0
+                """,
+                (cache_key, model, encode_body(response), len(response.encode('utf-8')))
+            )
+        self.mysql.connection.commit()
+
+    def trim(self, max_age_seconds, max_rows):
+        """Drop expired rows, then the least recently used beyond max_rows."""
+        with self.mysql.connection.cursor() as cur:
+            cur.execute(
+                "DELETE FROM LLMResponseCache WHERE dateTimeCreated <= NOW() - INTERVAL %s SECOND",
+                (max_age_seconds,)
+            )
+            removed = cur.rowcount
+            cur.execute("SELECT COUNT(*) AS n FROM LLMResponseCache")
+            excess = cur.fetchone()['n'] - max_rows
+            if excess > 0:
+                cur.execute(
+                    "DELETE FROM LLMResponseCache ORDER BY lastUsedAt LIMIT %s",
+                    (excess,)
+                )
+                removed += cur.rowcount
+        self.mysql.connection.commit()
+        return removed
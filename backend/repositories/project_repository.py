@@ -1,6 +1,24 @@
 from models.project_detailed import Budget, Timeframe, ProjectDetailed
 from models.member import Member
-from models.project import Project
+from models.project import Project, ProjectSummary, ProjectDashboardEntry
+from models.generation_history import GenerationHistoryEntry
+from repositories.unit_of_work import UnitOfWork, transaction
+from utils.pagination_utils import encode_cursor, decode_cursor
+from utils.body_codec import encode_body, decode_body, is_compressed
+from utils.db_router import reads, writes
+
+# sort option -> (column, direction); id breaks ties in the same direction
+PROJECT_SORTS = {
+    'updated': ('dateTimeUpdated', 'DESC'),
+    'created': ('dateTimeCreated', 'DESC'),
+    'name': ('name', 'ASC'),
+}
+
+# table -> compressed body column (see utils.body_codec)
+BODY_COLUMNS = {
+    'Prompt': 'prompt',
+    'GenerationHistory': 'llmResponse',
+}
 
 class ProjectRepository:
     def __init__(self, mysql):
@@ -10,52 +28,59 @@ class ProjectRepository:
     #####################################################
     ### Project operations
     #####################################################
+    @writes
     def save_project_complete(self, projectDetailed: ProjectDetailed, user_id, project_status):
-        with self.mysql.connection.cursor() as cur:
-            try:
-                project_id = projectDetailed.project.id
-
-                # Save or update Project
-                if project_id:
-                    # check ownership
-                    cur.execute("SELECT 1 FROM Project WHERE id=%s AND userId=%s", (project_id, user_id))
-                    if not cur.fetchone():
-                        raise ValueError("Project not found or unauthorized")
-                    
-                    cur.execute(
-                        """
-                        UPDATE Project 
-                        SET name=%s, requirementDescription=%s, goalDescription=%s, status=%s 
-                        WHERE id=%s AND userId=%s
-                        """,
-                        (projectDetailed.project.name, projectDetailed.project.requirement_description, projectDetailed.project.goal_description,
-                        project_status, project_id, user_id)
-                    )
-                    
-                else:
-                    cur.execute(
-                        """
-                        INSERT INTO Project (name, requirementDescription, goalDescription, status, userId)
-                        VALUES (%s, %s, %s, %s, %s)
-                        """,
-                        (projectDetailed.project.name, projectDetailed.project.requirement_description, projectDetailed.project.goal_description,
-                        project_status, user_id)
-                    )
-                    project_id = cur.lastrowid
-
-                self.save_budget(project_id, projectDetailed.budget)
-                self.save_timeframe(project_id, projectDetailed.timeframe)
-                self.save_team_and_members(project_id, projectDetailed.team_members)
+        # every write below shares one cursor and commits once at the end
+        with UnitOfWork(self.mysql.connection) as uow:
+            cur = uow.cursor
+            project_id = projectDetailed.project.id
+
+            # Save or update Project
+            if project_id:
+                # check ownership
+                cur.execute(
+                    "SELECT 1 FROM Project WHERE id=%s AND userId=%s AND deletedAt IS NULL",
+                    (project_id, user_id)
+                )
+                if not cur.fetchone():
+                    raise ValueError("Project not found or unauthorized")
+                
+                cur.execute(
+                    """
+                    UPDATE Project 
+                    SET name=%s, requirementDescription=%s, goalDescription=%s, status=%s 
+                    WHERE id=%s AND userId=%s
+                    """,
+                    (projectDetailed.project.name, projectDetailed.project.requirement_description, projectDetailed.project.goal_description,
+                    project_status, project_id, user_id)
+                )
+                
+            else:
+                cur.execute(
+                    """
+                    INSERT INTO Project (name, requirementDescription, goalDescription, status, userId)
+                    VALUES (%s, %s, %s, %s, %s)
+                    """,
+                    (projectDetailed.project.name, projectDetailed.project.requirement_description, projectDetailed.project.goal_description,
+                    project_status, user_id)
+                )
+                project_id = cur.lastrowid
 
-                self.mysql.connection.commit()
-                return project_id
+            self.save_budget(project_id, projectDetailed.budget, cur)
+            self.save_timeframe(project_id, projectDetailed.timeframe, cur)
+            self.save_team_and_members(project_id, projectDetailed.team_members, cur)
 
-            except Exception as e:
-                self.mysql.connection.rollback()
-                raise e
+        return project_id
 
-    def get_project_details_rows(self, project_id, user_id):
-        sql_query = """
+    @reads
+    def get_project_details_parts(self, project_id, user_id):
+        """
+        Returns (header_row, member_rows) for one project, or (None, []) when
+        it does not exist or belongs to someone else. The header carries the
+        project's TEXT columns once; each member row already has its language
+        and framework pivoted into columns, so nothing repeats per skill.
+        """
+        header_sql = """
     SELECT
         P.id AS project_id,
         P.name,
@@ -66,38 +91,146 @@ class ProjectRepository:
         B.floor AS budget_floor,
         B.ceiling AS budget_ceiling,
         Tf.startTime AS project_start_date,
-        Tf.endTime AS project_end_date,
-        CONCAT(M.firstName, ' ', M.lastName) AS member,
-        S.skill,
-        S.category
+        Tf.endTime AS project_end_date
     FROM
         Project P
     LEFT JOIN Budget B ON P.id = B.projectId
     LEFT JOIN Timeframe Tf ON P.id = Tf.projectId
-    LEFT JOIN Team Tm ON P.id = Tm.projectId
-    LEFT JOIN TeamMember TmM ON Tm.id = TmM.TeamId
-    LEFT JOIN Member M ON TmM.MemberId = M.id
-    LEFT JOIN Skillset S ON M.id = S.memberId AND S.category IN ('Language', 'Framework')
     WHERE
-        P.id = %s AND P.userId = %s
+        P.id = %s AND P.userId = %s AND P.deletedAt IS NULL
+        """
 
+        members_sql = """
+    SELECT
+        CONCAT(M.firstName, ' ', M.lastName) AS member,
+        MAX(CASE WHEN S.category = 'Language' THEN S.skill END) AS language,
+        MAX(CASE WHEN S.category = 'Framework' THEN S.skill END) AS framework
+    FROM
+        Team Tm
+    JOIN TeamMember TmM ON Tm.id = TmM.teamId
+    JOIN Member M ON TmM.memberId = M.id
+    LEFT JOIN Skillset S ON S.teamId = Tm.id AND S.memberId = M.id AND S.category IN ('Language', 'Framework')
+    WHERE
+        Tm.projectId = %s
+    GROUP BY M.id, M.firstName, M.lastName
+    ORDER BY M.id
         """
 
         with self.mysql.connection.cursor() as cur:
-            cur.execute(sql_query, (project_id, user_id))
-            detailed_rows = cur.fetchall()
+            cur.execute(header_sql, (project_id, user_id))
+            header = cur.fetchone()
+            if not header:
+                return None, []
+            cur.execute(members_sql, (project_id,))
+            member_rows = cur.fetchall()
 
-        return detailed_rows
-    
+        return header, list(member_rows)
+
+    @reads
     def get_projects_by_user(self, user_id):
         with self.mysql.connection.cursor() as cur:
-            cur.execute("SELECT * FROM Project WHERE userId=%s", (user_id,))
+            cur.execute("SELECT * FROM Project WHERE userId=%s AND deletedAt IS NULL", (user_id,))
             rows = cur.fetchall()
         return [self._row_to_project(row) for row in rows]
 
+    @reads
+    def get_project_summaries(self, user_id, limit, cursor=None, status=None, sort='updated'):
+        """
+        Keyset page of a user's projects without the TEXT descriptions.
+        Returns (summaries, next_cursor); next_cursor is None on the last page.
+        The cursor is bound to the sort it was issued for.
+        """
+        if sort not in PROJECT_SORTS:
+            raise ValueError(f"sort must be one of: {', '.join(PROJECT_SORTS)}")
+        column, direction = PROJECT_SORTS[sort]
+        op = '<' if direction == 'DESC' else '>'
+
+        conditions = ["userId=%s", "deletedAt IS NULL"]
+        params = [user_id]
+        if status:
+            conditions.append("status=%s")
+            params.append(status)
+
+        after = decode_cursor(cursor, str, str, int)
+        if after:
+            if after[0] != sort:
+                raise ValueError("Invalid cursor")
+            conditions.append(f"({column} {op} %s OR ({column} = %s AND id {op} %s))")
+            params.extend([after[1], after[1], after[2]])
+
+        sql = f"""
+            SELECT id, name, status, userId, dateTimeCreated, dateTimeUpdated
+            FROM Project
+            WHERE {' AND '.join(conditions)}
+            ORDER BY {column} {direction}, id {direction}
+            LIMIT %s
+        """
+        params.append(limit + 1)
+
+        with self.mysql.connection.cursor() as cur:
+            cur.execute(sql, tuple(params))
+            rows = cur.fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(sort, last[column], last['id'])
+        return [self._row_to_summary(row) for row in rows], next_cursor
+
+    @reads
+    def get_project_dashboard(self, user_id, limit, cursor=None, status=None, sort='updated'):
+        """
+        One page of dashboard cards in two queries regardless of page size:
+        the summary page, then budget/timeframe/team size/last generation
+        for every project on it. Returns (entries, next_cursor).
+        """
+        summaries, next_cursor = self.get_project_summaries(user_id, limit, cursor, status, sort)
+        if not summaries:
+            return [], next_cursor
+
+        ids = [s.id for s in summaries]
+        placeholders = ", ".join(["%s"] * len(ids))
+        sql = f"""
+            SELECT
+                P.id AS projectId,
+                B.floor AS budgetFloor,
+                B.ceiling AS budgetCeiling,
+                Tf.startTime AS startDate,
+                Tf.endTime AS endDate,
+                (SELECT COUNT(*) FROM Team Tm
+                 JOIN TeamMember TmM ON Tm.id = TmM.teamId
+                 WHERE Tm.projectId = P.id) AS memberCount,
+                (SELECT MAX(G.dateTimeCreated) FROM GenerationHistory G
+                 WHERE G.projectId = P.id) AS lastGeneratedAt
+            FROM Project P
+            LEFT JOIN Budget B ON P.id = B.projectId
+            LEFT JOIN Timeframe Tf ON P.id = Tf.projectId
+            WHERE P.userId = %s AND P.deletedAt IS NULL AND P.id IN ({placeholders})
+        """
+
+        with self.mysql.connection.cursor() as cur:
+            cur.execute(sql, (user_id, *ids))
+            extras = {row['projectId']: row for row in cur.fetchall()}
+
+        entries = []
+        for summary in summaries:
+            row = extras.get(summary.id, {})
+            entries.append(ProjectDashboardEntry(
+                summary,
+                budget_floor=row.get('budgetFloor'),
+                budget_ceiling=row.get('budgetCeiling'),
+                start_date=row.get('startDate'),
+                end_date=row.get('endDate'),
+                member_count=row.get('memberCount') or 0,
+                last_generated_at=row.get('lastGeneratedAt')
+            ))
+        return entries, next_cursor
+
+    @reads
     def get_project_by_id(self, project_id):
         with self.mysql.connection.cursor() as cur:
-            cur.execute("SELECT * FROM Project WHERE id=%s", (project_id,))
+            cur.execute("SELECT * FROM Project WHERE id=%s AND deletedAt IS NULL", (project_id,))
             row = cur.fetchone()
         return self._row_to_project(row)
     
@@ -113,15 +246,51 @@ class ProjectRepository:
             user_id=row['userId']
         )
         
+    def _row_to_summary(self, row):
+        return ProjectSummary(
+            id=row['id'],
+            name=row['name'],
+            status=row['status'],
+            user_id=row['userId'],
+            date_time_created=row.get('dateTimeCreated'),
+            date_time_updated=row.get('dateTimeUpdated')
+        )
+
+    @reads
+    def project_belongs_to(self, project_id, user_id):
+        with self.mysql.connection.cursor() as cur:
+            cur.execute(
+                "SELECT 1 FROM Project WHERE id=%s AND userId=%s AND deletedAt IS NULL",
+                (project_id, user_id)
+            )
+            return cur.fetchone() is not None
+
+    @writes
     def delete_project(self, project_id, user_id):
+        # soft delete: hidden from every read at once; PurgeService removes
+        # the rows and their children later in small batches
         with self.mysql.connection.cursor() as cur:
-            cur.execute("DELETE FROM Project WHERE id=%s AND userId=%s", (project_id, user_id))
+            cur.execute(
+                "UPDATE Project SET deletedAt=NOW() WHERE id=%s AND userId=%s AND deletedAt IS NULL",
+                (project_id, user_id)
+            )
+            deleted = cur.rowcount > 0
+        self.mysql.connection.commit()
+        return deleted
+
+    @writes
+    def update_project_status(self, project_id, status):
+        with self.mysql.connection.cursor() as cur:
+            cur.execute(
+                "UPDATE Project SET status=%s WHERE id=%s AND deletedAt IS NULL",
+                (status, project_id)
+            )
         self.mysql.connection.commit()
-        return cur.rowcount > 0
     
     #####################################################
     ### Generation History & Prompt Operations
     #####################################################
+    @reads
     def get_latest_generation_response(self, project_id):
         with self.mysql.connection.cursor() as cur:
                 cur.execute(
@@ -135,51 +304,203 @@ class ProjectRepository:
                     (project_id,)
                 )
                 row = cur.fetchone()
-        return row['llmResponse'] if row else None
+        return decode_body(row['llmResponse']) if row else None
     
     
-    def save_prompt_version(self, project_id, prompt):
+    # primary on purpose: the job poller sees 'done' from the primary, and a
+    # worker's write makes nobody sticky, so a replica could still lack the row
+    def get_generation_response_for_prompt(self, project_id, prompt_id):
         with self.mysql.connection.cursor() as cur:
             cur.execute(
-                "SELECT MAX(version) AS max_version FROM Prompt WHERE projectId=%s",
-                (project_id,)
+                """
+                SELECT GH.llmResponse
+                FROM GenerationHistory GH
+                WHERE GH.projectId=%s AND GH.promptId=%s
+                ORDER BY GH.id DESC
+                LIMIT 1
+                """,
+                (project_id, prompt_id)
+            )
+            row = cur.fetchone()
+        return decode_body(row['llmResponse']) if row else None
+
+    @reads
+    def get_generation_history_page(self, project_id, limit, cursor=None):
+        """
+        Keyset page of a project's generations, newest first, without the
+        response bodies. Returns (entries, next_cursor).
+        """
+        conditions = ["GH.projectId=%s"]
+        params = [project_id]
+
+        after = decode_cursor(cursor, str, int)
+        if after:
+            conditions.append("(GH.dateTimeCreated < %s OR (GH.dateTimeCreated = %s AND GH.id < %s))")
+            params.extend([after[0], after[0], after[1]])
+
+        sql = f"""
+            SELECT GH.id, GH.projectId, GH.promptId, PR.version, GH.dateTimeCreated, GH.responseSize
+            FROM GenerationHistory GH
+            JOIN Prompt PR ON PR.id = GH.promptId
+            WHERE {' AND '.join(conditions)}
+            ORDER BY GH.dateTimeCreated DESC, GH.id DESC
+            LIMIT %s
+        """
+        params.append(limit + 1)
+
+        with self.mysql.connection.cursor() as cur:
+            cur.execute(sql, tuple(params))
+            rows = cur.fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last['dateTimeCreated'], last['id'])
+        return [self._row_to_history(row) for row in rows], next_cursor
+
+    @reads
+    def get_generation_history_entry(self, project_id, history_id, user_id):
+        """One generation including its response body, or None if not the user's."""
+        with self.mysql.connection.cursor() as cur:
+            cur.execute(
+                """
+                SELECT GH.id, GH.projectId, GH.promptId, PR.version, GH.dateTimeCreated,
+                       GH.responseSize, GH.llmResponse
+                FROM GenerationHistory GH
+                JOIN Prompt PR ON PR.id = GH.promptId
+                JOIN Project P ON P.id = GH.projectId
+                WHERE GH.id=%s AND GH.projectId=%s AND P.userId=%s AND P.deletedAt IS NULL
+                """,
+                (history_id, project_id, user_id)
             )
             row = cur.fetchone()
-            next_version = (row['max_version'] or 0) + 1
+        return self._row_to_history(row) if row else None
+
+    def _row_to_history(self, row):
+        return GenerationHistoryEntry(
+            id=row['id'],
+            project_id=row['projectId'],
+            prompt_id=row.get('promptId'),
+            version=row.get('version'),
+            date_time_created=row.get('dateTimeCreated'),
+            response_size=row.get('responseSize'),
+            llm_response=decode_body(row.get('llmResponse'))
+        )
+
+    @writes
+    def save_prompt_version(self, project_id, prompt):
+        with transaction(self.mysql.connection) as cur:
+            # Atomically bump the per-project counter; LAST_INSERT_ID(expr) hands
+            # the new value back on this connection, so there is no MAX() scan
+            # and concurrent submits can never draw the same version.
+            cur.execute(
+                """
+                UPDATE Project
+                SET promptVersion = LAST_INSERT_ID(promptVersion + 1), dateTimeUpdated = dateTimeUpdated
+                WHERE id=%s AND deletedAt IS NULL
+                """,
+                (project_id,)
+            )
+            if cur.rowcount == 0:
+                raise ValueError("Project not found")
+            next_version = cur.lastrowid
 
             cur.execute(
                 "INSERT INTO Prompt (projectId, prompt, version) VALUES (%s, %s, %s)",
-                (project_id, prompt, next_version)
+                (project_id, encode_body(prompt), next_version)
             )
-            self.mysql.connection.commit()
             return cur.lastrowid
 
+    @writes
     def save_llm_history(self, project_id, prompt_id, llm_text):
         with self.mysql.connection.cursor() as cur:
             cur.execute(
-                "INSERT INTO GenerationHistory (projectId, promptId, llmResponse) VALUES (%s, %s, %s)",
-                (project_id, prompt_id, llm_text)
+                "INSERT INTO GenerationHistory (projectId, promptId, llmResponse, responseSize) VALUES (%s, %s, %s, %s)",
+                (project_id, prompt_id, encode_body(llm_text), len(llm_text.encode('utf-8')))
             )
             self.mysql.connection.commit()
     
     
+    @writes
+    def compress_stored_bodies(self, table, batch_size=500, on_batch=None):
+        """
+        Re-encode plain rows of one body table with the configured codec,
+        walking the primary key in batches and committing after each one.
+        Returns {'rows', 'rewritten', 'bytes_before', 'bytes_after'}.
+        """
+        column = BODY_COLUMNS[table]
+        stats = {'rows': 0, 'rewritten': 0, 'bytes_before': 0, 'bytes_after': 0}
+        last_id = 0
+
+        while True:
+            with transaction(self.mysql.connection) as cur:
+                cur.execute(
+                    f"SELECT id, {column} AS body FROM {table} WHERE id > %s ORDER BY id LIMIT %s",
+                    (last_id, batch_size)
+                )
+                rows = cur.fetchall()
+                if not rows:
+                    break
+
+                updates = []
+                for row in rows:
+                    stored = row['body']
+                    stored = stored.encode('utf-8') if isinstance(stored, str) else bytes(stored)
+                    stats['rows'] += 1
+                    stats['bytes_before'] += len(stored)
+                    if is_compressed(stored):
+                        stats['bytes_after'] += len(stored)
+                        continue
+                    encoded = encode_body(stored.decode('utf-8'))
+                    stats['bytes_after'] += len(encoded)
+                    if encoded != stored:
+                        updates.append((encoded, row['id']))
+
+                if updates:
+                    cur.executemany(
+                        f"UPDATE {table} SET {column}=%s, dateTimeUpdated=dateTimeUpdated WHERE id=%s",
+                        updates
+                    )
+                    stats['rewritten'] += len(updates)
+                last_id = rows[-1]['id']
+
+            if on_batch:
+                on_batch(table, stats)
+        return stats
+
+    @reads
+    def stored_body_sizes(self):
+        """Bytes on disk vs. uncompressed for response bodies (compression ratio)."""
+        with self.mysql.connection.cursor() as cur:
+            cur.execute(
+                """
+                SELECT COUNT(*) AS rows_total,
+                       COALESCE(SUM(responseSize), 0) AS original_bytes,
+                       COALESCE(SUM(LENGTH(llmResponse)), 0) AS stored_bytes
+                FROM GenerationHistory
+                """
+            )
+            return cur.fetchone()
+
+
     #####################################################
     ### Team & Member operations
     #####################################################
-    def save_team_and_members(self, project_id, members: list[Member]):
+    @writes
+    def save_team_and_members(self, project_id, members: list[Member], cur=None):
         if not members:
             return
 
-        with self.mysql.connection.cursor() as cur:
+        # a fixed number of statements regardless of team size
+        with transaction(self.mysql.connection, cur) as cur:
             team_id = self._get_or_create_team(cur, project_id)
             self._clear_team_members(cur, team_id)
 
-            for member in members:
-                member_id = self._get_or_create_member(cur, member)
-                self._add_member_to_team(cur, team_id, member_id)
-                self._add_member_skills(cur, member_id, member)
-
-        self.mysql.connection.commit()
+            members = self._dedupe_members(members)
+            member_ids = self._get_or_create_members(cur, members)
+            self._add_members_to_team(cur, team_id, member_ids)
+            self._replace_member_skills(cur, team_id, member_ids, members)
 
     # --- helper methods ---
     # generated by ChatGPT
@@ -197,62 +518,99 @@ class ProjectRepository:
         cur.execute("DELETE FROM TeamMember WHERE TeamId=%s", (team_id,))
 
 
-    def _get_or_create_member(self, cur, member: Member):
-        cur.execute("SELECT id FROM Member WHERE firstName=%s AND lastName=%s",
-                    (member.first_name, member.last_name))
-        row = cur.fetchone()
-        if row:
-            return row["id"]
+    @staticmethod
+    def _member_key(first_name, last_name):
+        # Member names compare case-insensitively under the default collation
+        return (first_name or "").casefold(), (last_name or "").casefold()
 
-        cur.execute("INSERT INTO Member (firstName, lastName) VALUES (%s, %s)",
-                    (member.first_name, member.last_name))
-        return cur.lastrowid
 
+    def _dedupe_members(self, members: list[Member]):
+        # TeamMember is keyed by (teamId, memberId); the last entry for a name wins
+        unique = {}
+        for member in members:
+            unique[self._member_key(member.first_name, member.last_name)] = member
+        return list(unique.values())
 
-    def _add_member_to_team(self, cur, team_id, member_id):
-        cur.execute("INSERT INTO TeamMember (TeamId, MemberId) VALUES (%s, %s)", (team_id, member_id))
 
+    def _select_member_ids(self, cur, members: list[Member]):
+        placeholders = ", ".join(["(%s, %s)"] * len(members))
+        params = [value for m in members for value in (m.first_name, m.last_name)]
+        cur.execute(
+            f"SELECT id, firstName, lastName FROM Member WHERE (firstName, lastName) IN ({placeholders}) ORDER BY id",
+            tuple(params)
+        )
+        found = {}
+        for row in cur.fetchall():
+            found.setdefault(self._member_key(row["firstName"], row["lastName"]), row["id"])
+        return found
 
-    def _add_member_skills(self, cur, member_id, member: Member):
-        if member.language:
-            cur.execute(
-                "INSERT INTO Skillset (memberId, skill, category) VALUES (%s, %s, %s)",
-                (member_id, member.language, "Language")
+
+    def _get_or_create_members(self, cur, members: list[Member]):
+        """Return [member_id, ...] aligned with members, inserting missing names in one batch."""
+        found = self._select_member_ids(cur, members)
+        missing = [m for m in members if self._member_key(m.first_name, m.last_name) not in found]
+
+        if missing:
+            cur.executemany(
+                "INSERT INTO Member (firstName, lastName) VALUES (%s, %s)",
+                [(m.first_name, m.last_name) for m in missing]
             )
-        if member.framework and member.framework.lower() != "none":
-            cur.execute(
-                "INSERT INTO Skillset (memberId, skill, category) VALUES (%s, %s, %s)",
-                (member_id, member.framework, "Framework")
+            found.update(self._select_member_ids(cur, missing))
+
+        return [found[self._member_key(m.first_name, m.last_name)] for m in members]
+
+
+    def _add_members_to_team(self, cur, team_id, member_ids):
+        cur.executemany(
+            "INSERT INTO TeamMember (TeamId, MemberId) VALUES (%s, %s)",
+            [(team_id, member_id) for member_id in member_ids]
+        )
+
+
+    def _replace_member_skills(self, cur, team_id, member_ids, members: list[Member]):
+        # replace rather than append so re-saving a draft doesn't pile up duplicate skill rows;
+        # Member rows are shared by name across projects, so only this team's skills are touched
+        cur.execute(
+            "DELETE FROM Skillset WHERE teamId=%s AND category IN ('Language', 'Framework')",
+            (team_id,)
+        )
+
+        rows = []
+        for member_id, member in zip(member_ids, members):
+            if member.language:
+                rows.append((member_id, team_id, member.language, "Language"))
+            if member.framework and member.framework.lower() != "none":
+                rows.append((member_id, team_id, member.framework, "Framework"))
+        if rows:
+            cur.executemany(
+                "INSERT INTO Skillset (memberId, teamId, skill, category) VALUES (%s, %s, %s, %s)",
+                rows
             )
 
 
     #####################################################
     ### Timeframe operations
     #####################################################
-    def save_timeframe(self, project_id, time: Timeframe):
+    @writes
+    def save_timeframe(self, project_id, time: Timeframe, cur=None):
         if time.start is None and time.end is None:
             return
         # never save incomplete timeframe
 
-        with self.mysql.connection.cursor() as cur:
-            cur.execute("SELECT id FROM Timeframe WHERE projectId=%s", (project_id,))
-            exists = cur.fetchone()
-
-            time.start = time.start if time.start not in (None, "") else None
-            time.end= time.end if time.end not in (None, "") else None
+        time.start = time.start if time.start not in (None, "") else None
+        time.end= time.end if time.end not in (None, "") else None
 
-            if exists:
-                cur.execute(
-                    "UPDATE Timeframe SET startTime=%s, endTime=%s WHERE projectId=%s",
-                    (time.start, time.end, project_id)
-                )
-            else:
-                cur.execute(
-                    "INSERT INTO Timeframe (projectId, startTime, endTime) VALUES (%s, %s, %s)",
-                    (project_id, time.start, time.end)
-                )
-        self.mysql.connection.commit()
+        # single round trip; uq_timeframe_project keeps one row per project
+        with transaction(self.mysql.connection, cur) as cur:
+            cur.execute(
+                """
+                INSERT INTO Timeframe (projectId, startTime, endTime) VALUES (%s, %s, %s)
+                ON DUPLICATE KEY UPDATE startTime=VALUES(startTime), endTime=VALUES(endTime)
+                """,
+                (project_id, time.start, time.end)
+            )
         
+    @reads
     def get_timeframe(self, project_id):
         with self.mysql.connection.cursor() as cur:
             cur.execute("SELECT * FROM Timeframe WHERE projectId=%s", (project_id,))
@@ -272,28 +630,24 @@ class ProjectRepository:
     #####################################################
     ### Budget operations
     #####################################################
-    def save_budget(self, project_id, budget: Budget):
+    @writes
+    def save_budget(self, project_id, budget: Budget, cur=None):
         if budget.floor is None and budget.ceiling is None:
             return
         # never save incomplete budget
 
-        with self.mysql.connection.cursor() as cur:
-            cur.execute("SELECT id FROM Budget WHERE projectId=%s", (project_id,))
-            exists = cur.fetchone()
-
-            if exists:
-                cur.execute(
-                    "UPDATE Budget SET floor=%s, ceiling=%s WHERE projectId=%s",
-                    (budget.floor, budget.ceiling, project_id)
-                )
-            else:
-                cur.execute(
-                    "INSERT INTO Budget (projectId, floor, ceiling) VALUES (%s, %s, %s)",
-                    (project_id, budget.floor, budget.ceiling)
-                )
-        self.mysql.connection.commit()
+        # single round trip; uq_budget_project keeps one row per project
+        with transaction(self.mysql.connection, cur) as cur:
+            cur.execute(
+                """
+                INSERT INTO Budget (projectId, floor, ceiling) VALUES (%s, %s, %s)
+                ON DUPLICATE KEY UPDATE floor=VALUES(floor), ceiling=VALUES(ceiling)
+                """,
+                (project_id, budget.floor, budget.ceiling)
+            )
             
     
+    @reads
     def get_budget(self, project_id):
         with self.mysql.connection.cursor() as cur:
             cur.execute("SELECT * FROM Budget WHERE projectId=%s", (project_id,))
@@ -0,0 +1,92 @@
+# repositories/purge_repository.py
+LOCK_NAME = "purge_worker"
+
+# children of a soft-deleted project, deleted leaf-first so the final
+# DELETE of the Project row has nothing left to cascade
+PROJECT_CHILDREN = [
+    ("GenerationJob", "projectId=%s"),
+    ("GenerationHistory", "projectId=%s"),
+    ("Prompt", "projectId=%s"),
+    ("TeamMember", "teamId IN (SELECT id FROM Team WHERE projectId=%s)"),
+    ("Team", "projectId=%s"),
+    ("Budget", "projectId=%s"),
+    ("Timeframe", "projectId=%s"),
+]
+
+
+class PurgeRepository:
+    """Hard-deletes soft-deleted projects and users, one bounded statement at a time."""
+
+    def __init__(self, mysql):
+        self.mysql = mysql
+
+    def try_lock(self):
+        # one purger per database, no matter how many app processes run
+        with self.mysql.connection.cursor() as cur:
+            cur.execute("SELECT GET_LOCK(%s, 0) AS acquired", (LOCK_NAME,))
+            row = cur.fetchone()
+        return bool(row and row['acquired'] == 1)
+
+    def release_lock(self):
+        with self.mysql.connection.cursor() as cur:
+            cur.execute("SELECT RELEASE_LOCK(%s)", (LOCK_NAME,))
+            cur.fetchone()
+
+    def next_deleted_project(self):
+        with self.mysql.connection.cursor() as cur:
+            cur.execute(
+                "SELECT id FROM Project WHERE deletedAt IS NOT NULL ORDER BY deletedAt, id LIMIT 1"
+            )
+            row = cur.fetchone()
+        return row['id'] if row else None
+
+    def next_deleted_user(self):
+        """A soft-deleted user whose projects are all purged already."""
+        with self.mysql.connection.cursor() as cur:
+            cur.execute(
+                """
+                SELECT U.id FROM User U
+                WHERE U.deletedAt IS NOT NULL
+                  AND NOT EXISTS (SELECT 1 FROM Project P WHERE P.userId = U.id)
+                ORDER BY U.deletedAt, U.id
+                LIMIT 1
+                """
+            )
+            row = cur.fetchone()
+        return row['id'] if row else None
+
+    def purge_project_batch(self, project_id, batch_size):
+        """
+        Delete up to batch_size rows from the first child table that still
+        has rows, or the Project row itself once the children are gone.
+        Commits before returning. Returns (table, rows_deleted).
+        """
+        with self.mysql.connection.cursor() as cur:
+            for table, where in PROJECT_CHILDREN:
+                cur.execute(f"DELETE FROM {table} WHERE {where} LIMIT %s", (project_id, batch_size))
+                if cur.rowcount > 0:
+                    self.mysql.connection.commit()
+                    return table, cur.rowcount
+
+            cur.execute("DELETE FROM Project WHERE id=%s AND deletedAt IS NOT NULL", (project_id,))
+            deleted = cur.rowcount
+        self.mysql.connection.commit()
+        return "Project", deleted
+
+    def purge_user(self, user_id):
+        with self.mysql.connection.cursor() as cur:
+            cur.execute("DELETE FROM User WHERE id=%s AND deletedAt IS NOT NULL", (user_id,))
+            deleted = cur.rowcount
+        self.mysql.connection.commit()
+        return deleted
+
+    def pending_counts(self):
+        with self.mysql.connection.cursor() as cur:
+            cur.execute(
+                """
+                SELECT
+                    (SELECT COUNT(*) FROM Project WHERE deletedAt IS NOT NULL) AS projects,
+                    (SELECT COUNT(*) FROM User WHERE deletedAt IS NOT NULL) AS users
+                """
+            )
+            return cur.fetchone()
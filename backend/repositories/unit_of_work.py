@@ -0,0 +1,40 @@
+# repositories/unit_of_work.py
+from contextlib import contextmanager
+
+
+class UnitOfWork:
+    """
+    One cursor and one transaction: commits exactly once on success,
+    rolls back everything on any exception.
+    """
+
+    def __init__(self, connection):
+        self.connection = connection
+        self.cursor = None
+
+    def __enter__(self):
+        self.cursor = self.connection.cursor()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        try:
+            if exc_type is None:
+                self.connection.commit()
+            else:
+                self.connection.rollback()
+        finally:
+            self.cursor.close()
+        return False
+
+
+@contextmanager
+def transaction(connection, cur=None):
+    """
+    Yield the caller's cursor when already inside a unit of work (the caller
+    owns the commit); otherwise run the block in its own UnitOfWork.
+    """
+    if cur is not None:
+        yield cur
+        return
+    with UnitOfWork(connection) as uow:
+        yield uow.cursor
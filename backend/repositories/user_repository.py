@@ -1,24 +1,50 @@
 from models.user import User
+from utils.auth_utils import invalidate_token_state
+from utils.pagination_utils import encode_cursor, decode_cursor, escape_like
+from utils.db_router import reads, writes
 
 class UserRepository:
     def __init__(self, mysql):
         self.mysql = mysql
 
+    # identity and token-state lookups stay on the primary: a lagging replica
+    # could briefly accept a revoked token or miss a just-registered user
     def get_user_by_email(self, email):
         with self.mysql.connection.cursor() as cur:
-            cur.execute("SELECT * FROM User WHERE email=%s", (email,))
+            cur.execute("SELECT * FROM User WHERE email=%s AND deletedAt IS NULL", (email,))
             row = cur.fetchone()
         return self._row_to_user(row)
 
+    def email_taken(self, email):
+        # soft-deleted users keep their row (and the unique email) until purged
+        with self.mysql.connection.cursor() as cur:
+            cur.execute("SELECT 1 FROM User WHERE email=%s LIMIT 1", (email,))
+            row = cur.fetchone()
+        return row is not None
+
     def get_user_by_id(self, user_id):
         with self.mysql.connection.cursor() as cur:
             cur.execute("""
-                SELECT id, firstName, lastName, email, role, status, password
-                FROM User WHERE id=%s
+                SELECT id, firstName, lastName, email, role, status, password, tokenVersion
+                FROM User WHERE id=%s AND deletedAt IS NULL
             """, (user_id,))
             row = cur.fetchone()
         return self._row_to_user(row)
 
+    def get_token_state(self, user_id):
+        with self.mysql.connection.cursor() as cur:
+            cur.execute("SELECT status, tokenVersion FROM User WHERE id=%s AND deletedAt IS NULL", (user_id,))
+            row = cur.fetchone()
+        return row
+
+    @writes
+    def revoke_tokens(self, user_id):
+        with self.mysql.connection.cursor() as cur:
+            cur.execute("UPDATE User SET tokenVersion = tokenVersion + 1 WHERE id=%s", (user_id,))
+        self.mysql.connection.commit()
+        invalidate_token_state(user_id)
+
+    @writes
     def insert_user(self, firstName, lastName, email, pw_hash, role):
         with self.mysql.connection.cursor() as cur:
             sql = """
@@ -28,33 +54,179 @@ class UserRepository:
             cur.execute(sql, (firstName, lastName, email, pw_hash, role))
         self.mysql.connection.commit()
         
+    @writes
     def delete_user(self, user_id):
+        # soft delete the user and their projects; PurgeService removes the
+        # rows later in small batches instead of one long cascading DELETE
         with self.mysql.connection.cursor() as cur:
-            cur.execute("DELETE FROM User WHERE id=%s", (user_id,))
+            cur.execute(
+                "UPDATE User SET deletedAt=NOW(), tokenVersion = tokenVersion + 1 WHERE id=%s AND deletedAt IS NULL",
+                (user_id,)
+            )
             affected = cur.rowcount
+            if affected > 0:
+                cur.execute("UPDATE Project SET deletedAt=NOW() WHERE userId=%s AND deletedAt IS NULL", (user_id,))
 
         if affected > 0:
             self.mysql.connection.commit()
+            invalidate_token_state(user_id)
             return True
 
         self.mysql.connection.rollback()
         return False
 
 
+    BULK_STATUS = {'deactivate': 'inactive', 'reactivate': 'active'}
+    BULK_CHUNK_SIZE = 1000
+
+    @writes
+    def bulk_update_users(self, action, user_ids):
+        """
+        Apply deactivate/reactivate/delete to many users in one transaction
+        using set-based statements. Returns {user_id: result} where result is
+        one of 'updated', 'unchanged', 'deleted' or 'not_found'.
+        """
+        if action != 'delete' and action not in self.BULK_STATUS:
+            raise ValueError(f"Unsupported bulk action: {action}")
+
+        ids = list(dict.fromkeys(user_ids))
+        results = {user_id: 'not_found' for user_id in ids}
+        chunks = [ids[i:i + self.BULK_CHUNK_SIZE] for i in range(0, len(ids), self.BULK_CHUNK_SIZE)]
+
+        with self.mysql.connection.cursor() as cur:
+            try:
+                for chunk in chunks:
+                    placeholders = ", ".join(["%s"] * len(chunk))
+                    cur.execute(
+                        f"SELECT id, status FROM User WHERE id IN ({placeholders}) AND deletedAt IS NULL FOR UPDATE",
+                        tuple(chunk)
+                    )
+                    found = {row["id"]: row["status"] for row in cur.fetchall()}
+                    if not found:
+                        continue
+
+                    found_placeholders = ", ".join(["%s"] * len(found))
+                    if action == 'delete':
+                        # soft delete; PurgeService removes the rows in the background
+                        cur.execute(
+                            f"""
+                            UPDATE User SET deletedAt=NOW(), tokenVersion = tokenVersion + 1
+                            WHERE id IN ({found_placeholders})
+                            """,
+                            tuple(found)
+                        )
+                        cur.execute(
+                            f"UPDATE Project SET deletedAt=NOW() WHERE userId IN ({found_placeholders}) AND deletedAt IS NULL",
+                            tuple(found)
+                        )
+                        results.update({user_id: 'deleted' for user_id in found})
+                        continue
+
+                    status = self.BULK_STATUS[action]
+                    changed = [user_id for user_id, current in found.items() if current != status]
+                    results.update({user_id: 'unchanged' for user_id in found})
+                    if changed:
+                        changed_placeholders = ", ".join(["%s"] * len(changed))
+                        # bumping tokenVersion signs deactivated users out immediately
+                        cur.execute(
+                            f"""
+                            UPDATE User SET status=%s, tokenVersion = tokenVersion + 1
+                            WHERE id IN ({changed_placeholders})
+                            """,
+                            (status, *changed)
+                        )
+                        results.update({user_id: 'updated' for user_id in changed})
+
+                self.mysql.connection.commit()
+            except Exception as e:
+                self.mysql.connection.rollback()
+                raise e
+
+        for user_id, result in results.items():
+            if result in ('updated', 'deleted'):
+                invalidate_token_state(user_id)
+        return results
+
+    @reads
     def get_all_users(self):
         with self.mysql.connection.cursor() as cur:
             cur.execute("""
                 SELECT id, firstName, lastName, email, role, status, dateTimeCreated
-                FROM User ORDER BY dateTimeCreated DESC
+                FROM User WHERE deletedAt IS NULL ORDER BY dateTimeCreated DESC
             """)
             rows = cur.fetchall()
         return [self._row_to_user(row) for row in rows]
 
-    def update_password(self, user_id, new_pw_hash):
+    @reads
+    def get_users_page(self, limit, cursor=None, role=None, status=None, prefix=None):
+        """
+        Keyset page of users, newest first, ordered by (dateTimeCreated, id).
+        Returns (users, next_cursor); next_cursor is None on the last page.
+
+        role and/or status filters walk an index in page order, so a page
+        costs the same however deep it is. prefix matches email, firstName
+        or lastName: a UNION of one index range scan per column (an OR
+        across them would scan the table), joined back and sorted, so its
+        cost follows the number of matches rather than the table size.
+        """
+        conditions = ["deletedAt IS NULL"]
+        params = []
+        source = "User"
+
+        if prefix:
+            like = escape_like(prefix)
+            source = """User JOIN (
+                SELECT id FROM User WHERE email LIKE %s
+                UNION SELECT id FROM User WHERE firstName LIKE %s
+                UNION SELECT id FROM User WHERE lastName LIKE %s
+            ) M USING (id)"""
+            params.extend([like, like, like])
+
+        if role:
+            conditions.append("role=%s")
+            params.append(role)
+        if status:
+            conditions.append("status=%s")
+            params.append(status)
+        after = decode_cursor(cursor, str, int)
+        if after:
+            conditions.append("(dateTimeCreated < %s OR (dateTimeCreated = %s AND id < %s))")
+            params.extend([after[0], after[0], after[1]])
+
+        sql = f"""
+            SELECT id, firstName, lastName, email, role, status, dateTimeCreated
+            FROM {source} WHERE {' AND '.join(conditions)}
+            ORDER BY dateTimeCreated DESC, id DESC
+            LIMIT %s
+        """
+        params.append(limit + 1)
+
+        with self.mysql.connection.cursor() as cur:
+            cur.execute(sql, tuple(params))
+            rows = cur.fetchall()
+
+        next_cursor = None
+        if len(rows) > limit:
+            rows = rows[:limit]
+            last = rows[-1]
+            next_cursor = encode_cursor(last["dateTimeCreated"], last["id"])
+        return [self._row_to_user(row) for row in rows], next_cursor
+
+    @writes
+    def update_password(self, user_id, new_pw_hash, revoke_tokens=True):
         with self.mysql.connection.cursor() as cur:
-            cur.execute("UPDATE User SET password=%s WHERE id=%s", (new_pw_hash, user_id))
+            if revoke_tokens:
+                # a password change signs the user out everywhere
+                cur.execute(
+                    "UPDATE User SET password=%s, tokenVersion = tokenVersion + 1 WHERE id=%s",
+                    (new_pw_hash, user_id)
+                )
+            else:
+                cur.execute("UPDATE User SET password=%s WHERE id=%s", (new_pw_hash, user_id))
         self.mysql.connection.commit()
+        invalidate_token_state(user_id)
 
+    @writes
     def update_profile(self, user_id, first_name=None, last_name=None):
         updates = []
         params = []
@@ -75,6 +247,7 @@ class UserRepository:
         with self.mysql.connection.cursor() as cur:
             cur.execute(sql, tuple(params))
         self.mysql.connection.commit()
+        invalidate_token_state(user_id)
 
     def _row_to_user(self, row):
         if not row:
@@ -86,5 +259,6 @@ class UserRepository:
             email=row["email"],
             role=row["role"],
             status=row.get("status"),
-            password=row.get("password")
+            password=row.get("password"),
+            token_version=row.get("tokenVersion", 0)
         )
\ No newline at end of file
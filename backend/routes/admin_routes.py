@@ -3,6 +3,7 @@
 from flask import Blueprint, jsonify,request, current_app
 from flasgger import swag_from
 from utils.auth_utils import authenticate_token
+from utils.pagination_utils import parse_limit
 
 admin_bp = Blueprint('admin', __name__)
 @admin_bp.route('/admin/users', methods=['GET'])
@@ -16,12 +17,22 @@ def admin_list_users():
     if user.role != 'admin':
         return jsonify({'error': 'Forbidden – admin access required'}), 403
 
-    user_repo = current_app.user_repo
-    users = user_repo.get_all_users()
+    # Keyset pagination: ?limit=&cursor= plus optional role/status/q (name or email prefix)
+    try:
+        limit = parse_limit(request.args.get('limit'))
+        users, next_cursor = current_app.user_repo.get_users_page(
+            limit,
+            cursor=request.args.get('cursor'),
+            role=request.args.get('role'),
+            status=request.args.get('status'),
+            prefix=request.args.get('q'),
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
     
     users_dict = [user.to_dict() for user in users]
     
-    return jsonify({'users': users_dict})
+    return jsonify({'users': users_dict, 'next_cursor': next_cursor})
 
 @admin_bp.route('/admin/users/<int:user_id>', methods=['DELETE'])
 def admin_delete_user(user_id):
@@ -43,4 +54,46 @@ def admin_delete_user(user_id):
         return jsonify({'message': 'User deleted'}), 200
 
     except Exception:
-        return jsonify({'error': 'Database error'}), 500
\ No newline at end of file
+        return jsonify({'error': 'Database error'}), 500
+
+BULK_ACTIONS = ('deactivate', 'reactivate', 'delete')
+BULK_MAX_IDS = 10000
+
+@admin_bp.route('/admin/users/bulk', methods=['POST'])
+def admin_bulk_users():
+    user, error_response, status_code = authenticate_token(current_app.user_repo)
+    if error_response:
+        return error_response, status_code
+
+    # Enforce admin authorization
+    if user.role != 'admin':
+        return jsonify({'error': 'Forbidden – admin access required'}), 403
+
+    data = request.get_json() or {}
+    action = data.get('action')
+    user_ids = data.get('user_ids')
+
+    if action not in BULK_ACTIONS:
+        return jsonify({'error': f"action must be one of {', '.join(BULK_ACTIONS)}"}), 400
+    if not isinstance(user_ids, list) or not user_ids:
+        return jsonify({'error': 'user_ids must be a non-empty list'}), 400
+    if len(user_ids) > BULK_MAX_IDS:
+        return jsonify({'error': f'At most {BULK_MAX_IDS} user_ids per request'}), 400
+    if not all(isinstance(i, int) and not isinstance(i, bool) for i in user_ids):
+        return jsonify({'error': 'user_ids must be integers'}), 400
+
+    # an admin cannot lock themselves out through a bulk request
+    target_ids = [i for i in user_ids if i != user.id]
+
+    try:
+        results = current_app.user_repo.bulk_update_users(action, target_ids) if target_ids else {}
+    except Exception:
+        return jsonify({'error': 'Database error'}), 500
+
+    if user.id in user_ids:
+        results[user.id] = 'skipped'
+
+    return jsonify({
+        'action': action,
+        'results': [{'id': user_id, 'result': results[user_id]} for user_id in dict.fromkeys(user_ids)],
+    }), 200
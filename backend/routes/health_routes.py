@@ -1,8 +1,7 @@
 # Databricks notebook source
 from flask import Blueprint, jsonify, current_app
-import MySQLdb.cursors
 import sys
-from flask_mysqldb import MySQL
+from utils.db_pool import PooledMySQL
 
 
 try:
@@ -20,11 +19,12 @@ def db_status_check():
     Checks the status of the MySQL database connection.
     """
     # Defensive check: if the import failed (which it shouldn't in the correct setup)
-    if not isinstance(mysql, MySQL):
+    if not isinstance(mysql, PooledMySQL):
         return jsonify({"status": "error", "message": "Database object not initialized."}), 500
 
     try:
         # Use mysql.connection to access the current session connection.
+        import MySQLdb.cursors
         cursor = mysql.connection.cursor(MySQLdb.cursors.DictCursor)
 
         # Execute a simple, lightweight query to confirm read/write ability.
@@ -38,7 +38,9 @@ def db_status_check():
             "message": "MySQL connection is established and healthy.",
             "host": current_app.config.get('MYSQL_HOST'),
             "database": current_app.config.get('MYSQL_DB'),
-            "timestamp": result['current_time'].isoformat() if result else 'N/A'
+            "timestamp": result['current_time'].isoformat() if result else 'N/A',
+            "routing": current_app.db_router.stats() if hasattr(current_app, 'db_router') else None,
+            "pool": mysql.stats()
         }), 200
 
     except Exception as e:
@@ -59,4 +61,60 @@ def db_status_check():
             "message": custom_message,
             "error_details": error_details,
             "host": current_app.config.get('MYSQL_HOST') or "Unknown"
-        }), 503 # 503 Service Unavailable for dependency failure
\ No newline at end of file
+        }), 503 # 503 Service Unavailable for dependency failure
+
+@health_bp.route('/health/auth', methods=['GET'])
+def auth_cache_status():
+    """
+    Reports hit/eviction counters for the token state cache and session store,
+    plus queue depth and latency of the password hashing pool.
+    """
+    from utils import auth_utils, hash_pool
+
+    return jsonify({
+        "status": "success",
+        "token_state_cache": auth_utils.token_state_cache.stats(),
+        "session_store": auth_utils.session_store.stats(),
+        "hash_pool": hash_pool.hash_pool.stats(),
+    }), 200
+
+@health_bp.route('/health/purge', methods=['GET'])
+def purge_status():
+    """
+    Progress of the background purge of soft-deleted users and projects:
+    batch size, last batch duration and rows removed so far.
+    """
+    return jsonify({
+        "status": "success",
+        "purge": current_app.purge_service.stats(),
+    }), 200
+
+@health_bp.route('/health/llm', methods=['GET'])
+def llm_status():
+    """
+    Gemini client reuse and call timings, with client setup and model
+    latency reported separately, plus LLM response cache hit rates.
+    """
+    from utils import gemini_utils, llm_cache
+
+    return jsonify({
+        "status": "success",
+        "gemini": gemini_utils.gemini_client.stats(),
+        "cache": llm_cache.llm_cache.stats(),
+    }), 200
+
+@health_bp.route('/health/jobs', methods=['GET'])
+def generation_jobs_status():
+    """
+    Plan generation queue: jobs per status in the database plus this
+    process's worker counters.
+    """
+    try:
+        counts = current_app.generation_job_repo.status_counts()
+    except Exception as e:
+        return jsonify({"status": "error", "error_details": str(e)}), 503
+    return jsonify({
+        "status": "success",
+        "queue": counts,
+        "workers": current_app.generation_service.stats(),
+    }), 200
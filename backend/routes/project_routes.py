@@ -1,8 +1,10 @@
 # Databricks notebook source
 # project_routes.py
-from flask import Blueprint, request, jsonify, current_app
+import json
+from flask import Blueprint, request, jsonify, current_app, Response
 from flasgger import swag_from
 from utils.auth_utils import authenticate_token
+from utils.pagination_utils import parse_limit
 
 
 project_bp = Blueprint('project', __name__)
@@ -28,7 +30,7 @@ def save_project_draft():
         return jsonify({'error': str(e)}), 500
 
 
-# Submit project endpoint with LLM call
+# Submit project endpoint; the LLM call runs as a background job
 @project_bp.route('/projects/submit', methods=['POST'])
 def submit_project():
     user, error_response, status_code = authenticate_token(current_app.user_repo)
@@ -40,14 +42,14 @@ def submit_project():
 
     try:
         project_service = current_app.project_service
-        project_id, prompt_id, llm_text = project_service.submit_project(data, user.id)
+        project_id, job_id = project_service.submit_project(data, user.id)
 
         return jsonify({
-            'message': 'Project submitted successfully',
+            'message': 'Project submitted; plan generation queued',
             'project_id': project_id,
-            'prompt_id': prompt_id,
-            'llm_response': llm_text
-        }), 200
+            'job_id': job_id,
+            'status': 'queued'
+        }), 202
 
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
@@ -56,6 +58,78 @@ def submit_project():
         return jsonify({'error': str(e)}), 500
 
 
+def _sse(event, payload):
+    return f"event: {event}\ndata: {json.dumps(payload)}\n\n"
+
+
+# Streaming submit: the plan arrives as Server-Sent Events while Gemini writes it.
+# Events: project {project_id}, chunk {text}..., then done {project_id, prompt_id} or error {error}
+@project_bp.route('/projects/submit/stream', methods=['POST'])
+def submit_project_stream():
+    user, error_response, status_code = authenticate_token(current_app.user_repo)
+    if error_response:
+        return error_response, status_code
+
+    data = request.get_json() or {}
+
+    try:
+        project_id, events = current_app.project_service.submit_project_stream(data, user.id)
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except Exception as e:
+        print("500: ", e, '\n')
+        return jsonify({'error': str(e)}), 500
+
+    # No stream_with_context: the request context, and the pooled connection
+    # that saved the project, are released as soon as this view returns, so a
+    # long Gemini call holds neither. The stream runs in a fresh app context
+    # that only borrows a connection for the writes at the end, and hands it
+    # back before 'done' is sent.
+    app = current_app._get_current_object()
+
+    def stream():
+        yield _sse('project', {'project_id': project_id})
+        prompt_id = None
+        try:
+            with app.app_context():
+                try:
+                    for kind, value in events:
+                        if kind == 'chunk':
+                            yield _sse('chunk', {'text': value})
+                        else:
+                            prompt_id = value
+                finally:
+                    # a client that went away must fail the project while we still have a context
+                    events.close()
+        except Exception as e:
+            print("Plan stream failed:", e)
+            yield _sse('error', {'error': str(e)})
+            return
+        yield _sse('done', {'project_id': project_id, 'prompt_id': prompt_id})
+
+    return Response(
+        stream(),
+        mimetype='text/event-stream',
+        # proxies (nginx) must not buffer the stream
+        headers={'Cache-Control': 'no-cache', 'X-Accel-Buffering': 'no'},
+    )
+
+
+# plan generation job status; includes llm_response once done
+@project_bp.route('/projects/jobs/<int:job_id>', methods=['GET'])
+def get_generation_job(job_id):
+    user, error_response, status_code = authenticate_token(current_app.user_repo)
+    if error_response:
+        return error_response, status_code
+
+    project_service = current_app.project_service
+    try:
+        job = project_service.get_generation_job(job_id, user.id)
+    except FileNotFoundError as e:
+        return jsonify({'error': str(e)}), 404
+    return jsonify({'job': job}), 200
+
+
 # list projects by user endpoint
 @project_bp.route('/projects/user/<int:user_id>', methods=['GET'])
 def list_projects_by_user(user_id):
@@ -65,11 +139,46 @@ def list_projects_by_user(user_id):
     if user.id != user_id:
         return jsonify({'error': 'Forbidden'}), 403
 
+    # Summaries only (no descriptions): ?limit=&cursor=&status=&sort=updated|created|name
     project_service = current_app.project_service
-    projects = project_service.get_projects_by_user(user_id)
+    try:
+        limit = parse_limit(request.args.get('limit'))
+        projects, next_cursor = project_service.get_project_summaries(
+            user_id,
+            limit,
+            cursor=request.args.get('cursor'),
+            status=request.args.get('status'),
+            sort=request.args.get('sort') or 'updated',
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
 
     project_dicts = [project.to_dict() for project in projects]
-    return jsonify({'projects': project_dicts}), 200
+    return jsonify({'projects': project_dicts, 'next_cursor': next_cursor}), 200
+
+# project dashboard: summaries plus budget, timeframe, team size and last generation
+@project_bp.route('/projects/user/<int:user_id>/dashboard', methods=['GET'])
+def project_dashboard(user_id):
+    user, error_response, status_code = authenticate_token(current_app.user_repo)
+    if error_response:
+        return error_response, status_code
+    if user.id != user_id:
+        return jsonify({'error': 'Forbidden'}), 403
+
+    project_service = current_app.project_service
+    try:
+        limit = parse_limit(request.args.get('limit'))
+        entries, next_cursor = project_service.get_project_dashboard(
+            user_id,
+            limit,
+            cursor=request.args.get('cursor'),
+            status=request.args.get('status'),
+            sort=request.args.get('sort') or 'updated',
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+
+    return jsonify({'projects': [entry.to_dict() for entry in entries], 'next_cursor': next_cursor}), 200
 
 # Delete project endpoint
 @project_bp.route('/projects/<int:project_id>', methods=['DELETE'])
@@ -113,3 +222,39 @@ def get_project_details(project_id):
         return jsonify({'message': 'Project not found'}), 404
 
     return jsonify({'project': project.to_dict()}), 200
+
+
+# generation history: metadata pages, bodies fetched per item
+@project_bp.route('/projects/<int:project_id>/history', methods=['GET'])
+def list_generation_history(project_id):
+    user, error_response, status_code = authenticate_token(current_app.user_repo)
+    if error_response:
+        return error_response, status_code
+
+    project_service = current_app.project_service
+    try:
+        limit = parse_limit(request.args.get('limit'))
+        entries, next_cursor = project_service.get_generation_history(
+            project_id, user.id, limit, cursor=request.args.get('cursor')
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    except FileNotFoundError as e:
+        return jsonify({'error': str(e)}), 404
+
+    return jsonify({'history': [entry.to_dict() for entry in entries], 'next_cursor': next_cursor}), 200
+
+
+@project_bp.route('/projects/<int:project_id>/history/<int:history_id>', methods=['GET'])
+def get_generation_history_entry(project_id, history_id):
+    user, error_response, status_code = authenticate_token(current_app.user_repo)
+    if error_response:
+        return error_response, status_code
+
+    project_service = current_app.project_service
+    try:
+        entry = project_service.get_generation_history_entry(project_id, history_id, user.id)
+    except FileNotFoundError as e:
+        return jsonify({'error': str(e)}), 404
+
+    return jsonify({'history': entry.to_dict()}), 200
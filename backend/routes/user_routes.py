@@ -2,10 +2,16 @@
 from flask import Blueprint, request, jsonify, current_app
 from utils.auth_utils import serializer
 from flasgger import swag_from
-from utils.auth_utils import authenticate_token
+from utils.auth_utils import authenticate_token, end_session
+from utils.hash_pool import HashPoolSaturated
 
 user_bp = Blueprint("user", __name__)
 
+
+def _hashing_busy(e):
+    return jsonify({'error': 'Server busy, please retry shortly'}), 503, {'Retry-After': str(e.retry_after)}
+
+
 @user_bp.route('/register', methods=['POST'])
 @swag_from({'tags': ['User']})
 def register():
@@ -20,7 +26,10 @@ def register():
     role = data.get('role')
 
     service = current_app.user_service
-    success, error = service.register_user(first_name, last_name, email, password, role)
+    try:
+        success, error = service.register_user(first_name, last_name, email, password, role)
+    except HashPoolSaturated as e:
+        return _hashing_busy(e)
     if not success:
         return jsonify({'error': error}), 400
 
@@ -40,7 +49,10 @@ def login():
         return jsonify({'error': 'Missing email or password'}), 400
 
     service = current_app.user_service
-    user, token, error = service.login_user(email, password)
+    try:
+        user, token, error = service.login_user(email, password)
+    except HashPoolSaturated as e:
+        return _hashing_busy(e)
 
     if error:
         return jsonify({'error': error}), 401
@@ -48,6 +60,16 @@ def login():
     return jsonify({'token': token, 'user': user.to_dict()}), 200
 
 
+@user_bp.route('/logout', methods=['POST'])
+def logout():
+    user, error_response, status_code = authenticate_token(current_app.user_repo)
+    if error_response:
+        return error_response, status_code
+
+    end_session(request.headers['Authorization'][len('Bearer '):])
+    return jsonify({'message': 'Logged out'}), 200
+
+
 @user_bp.route('/users/reset_password', methods=['POST'])
 def reset_password():
     user, error_response, status_code = authenticate_token(current_app.user_repo)
@@ -62,7 +84,10 @@ def reset_password():
         return jsonify({'error': 'Missing old or new password'}), 400
 
     service = current_app.user_service
-    error = service.reset_password(user.email, old_pw, new_pw)
+    try:
+        error = service.reset_password(user.email, old_pw, new_pw)
+    except HashPoolSaturated as e:
+        return _hashing_busy(e)
     if error:
         return jsonify({'error': error}), 401
 
@@ -81,7 +106,10 @@ def update_profile():
         return jsonify({'error': 'Email and password are required'}), 400
 
     service = current_app.user_service
-    error = service.update_profile(email, password, first_name, last_name)
+    try:
+        error = service.update_profile(email, password, first_name, last_name)
+    except HashPoolSaturated as e:
+        return _hashing_busy(e)
     if error:
         return jsonify({'error': error}), 400
 
@@ -0,0 +1,165 @@
+# services/generation_service.py
+import threading
+import time
+import uuid
+from utils.gemini_utils import generate_project_plan, plan_prompt_key
+from utils.single_flight import SingleFlight
+
+
+class GenerationJobService:
+    """
+    Runs plan generation off the request thread. Submits enqueue a job in
+    the database; workers claim one at a time, call Gemini and store the
+    prompt and response. Failed jobs are retried up to max_attempts, and
+    jobs left running by a dead worker are requeued after stale_seconds.
+    """
+
+    def __init__(self, job_repo, project_repo, generate=generate_project_plan,
+                 max_attempts=3, stale_seconds=300, single_flight=None, clock=time.monotonic):
+        self.job_repo = job_repo
+        self.project_repo = project_repo
+        self.generate = generate
+        self.single_flight = single_flight or SingleFlight()
+        self.max_attempts = max_attempts
+        self.stale_seconds = stale_seconds
+        self._clock = clock
+        self._wake = threading.Event()
+        self._last_recovery = None
+
+        self.enqueued = 0
+        self.completed = 0
+        self.failed = 0
+        self.retried = 0
+        self.recovered = 0
+        self.orphans_failed = 0
+        self.running = 0
+        self.last_run_ms = 0.0
+
+    def enqueue(self, project_id, data):
+        try:
+            job_id = self.job_repo.enqueue(project_id, data)
+        except Exception:
+            # don't leave the project stuck in 'generating' with no job
+            self.job_repo.mark_project_failed(project_id)
+            raise
+        self.enqueued += 1
+        self._wake.set()
+        return job_id
+
+    def recover(self):
+        """
+        Requeue jobs claimed longer than stale_seconds ago (their worker died
+        or restarted), and fail projects left 'generating' that long with no
+        job behind them (a streamed submit whose process died).
+        """
+        self._last_recovery = self._clock()
+        requeued = self.job_repo.requeue_stale(self.stale_seconds)
+        if requeued:
+            print(f"Requeued {requeued} stale generation job(s)")
+            self.recovered += requeued
+        orphaned = self.job_repo.fail_orphaned_projects(self.stale_seconds)
+        if orphaned:
+            print(f"Failed {orphaned} project(s) stuck in 'generating'")
+            self.orphans_failed += orphaned
+        return requeued
+
+    def recover_if_due(self):
+        if self._last_recovery is None or self._clock() - self._last_recovery >= self.stale_seconds / 2:
+            self.recover()
+
+    def run_next(self):
+        """Run the oldest queued job. Returns False when the queue is empty."""
+        token = uuid.uuid4().hex
+        job = self.job_repo.claim_next(token)
+        if job is None:
+            return False
+
+        self.running += 1
+        started = self._clock()
+        try:
+            prompt, llm_text = self._generate(job['project_id'], job['payload'])
+            prompt_id = self.project_repo.save_prompt_version(job['project_id'], prompt)
+            self.project_repo.save_llm_history(job['project_id'], prompt_id, llm_text)
+            self.job_repo.mark_done(job['id'], token, job['project_id'], prompt_id)
+            self.completed += 1
+        except Exception as e:
+            retry = job['attempts'] < self.max_attempts
+            print(f"Generation job {job['id']} failed (attempt {job['attempts']}):", e)
+            self.job_repo.mark_failed(job['id'], token, job['project_id'], str(e), retry)
+            if retry:
+                self.retried += 1
+            else:
+                self.failed += 1
+        finally:
+            self.running -= 1
+            self.last_run_ms = round((self._clock() - started) * 1000, 2)
+        return True
+
+    def _generate(self, project_id, payload):
+        """
+        Identical jobs for the same project (double submits, several tabs)
+        share one Gemini call. A job that waited on another process reuses
+        that result through the LLM response cache, even if it asked to
+        bypass the cache, since the result it waited for is fresh.
+        """
+        key = f"{project_id}:{plan_prompt_key(payload)}"
+        return self.single_flight.do(
+            key,
+            lambda: self.generate(payload),
+            after_wait=lambda: self.generate(dict(payload, bypass_cache=False)),
+        )
+
+    def wait_for_work(self, timeout):
+        self._wake.wait(timeout)
+        self._wake.clear()
+
+    def get_job(self, job_id, user_id):
+        """Job status for its owner; includes this job's plan once it is done."""
+        job = self.job_repo.get_job(job_id, user_id)
+        if job is None:
+            raise FileNotFoundError("Generation job not found")
+        data = job.to_dict()
+        if job.status == 'done':
+            data['llm_response'] = self.project_repo.get_generation_response_for_prompt(job.project_id, job.prompt_id)
+        return data
+
+    def stats(self):
+        return {
+            "enqueued": self.enqueued,
+            "running": self.running,
+            "completed": self.completed,
+            "retried": self.retried,
+            "failed": self.failed,
+            "recovered": self.recovered,
+            "orphans_failed": self.orphans_failed,
+            "last_run_ms": self.last_run_ms,
+            "max_attempts": self.max_attempts,
+            "stale_seconds": self.stale_seconds,
+            "single_flight": self.single_flight.stats(),
+        }
+
+
+def start_generation_workers(app, generation_service, workers=2, poll_interval=2):
+    """
+    Start workers daemon threads that drain the generation queue. They
+    wake as soon as this process enqueues a job and otherwise poll every
+    poll_interval seconds (for jobs enqueued by other processes).
+    """
+    stop = threading.Event()
+
+    def loop():
+        while not stop.is_set():
+            try:
+                with app.app_context():
+                    generation_service.recover_if_due()
+                    ran = generation_service.run_next()
+            except Exception as e:
+                print("Generation worker error:", e)
+                ran = False
+            if not ran:
+                generation_service.wait_for_work(poll_interval)
+
+    for i in range(workers):
+        thread = threading.Thread(target=loop, name=f"generation-worker-{i}", daemon=True)
+        thread.start()
+    return stop
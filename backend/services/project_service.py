@@ -3,11 +3,14 @@ from models.project_detailed import ProjectDetailed, Budget, Timeframe
 from models.project import Project
 from models.member import Member
 from utils.prompt_utils import contains_invalid_phrase
-from utils.gemini_utils import generate_project_plan
+from utils.gemini_utils import stream_project_plan
+
+PROJECT_STATUSES = ('draft', 'submitted', 'generating', 'failed')
 
 class ProjectService:
-    def __init__(self, project_repo):
+    def __init__(self, project_repo, generation_jobs=None):
         self.project_repo = project_repo
+        self.generation_jobs = generation_jobs
         
     # Project Detail Validation 
     def validate_project(self, project_detailed):
@@ -152,80 +155,117 @@ class ProjectService:
         return project_id
     
     
-    def submit_project(self, data: dict, user_id: int) -> int:
+    def submit_project(self, data: dict, user_id: int):
         # Validate required fields
         self._validate_req_fields(data)
         project = self.build_project_detailed(data, user_id)
         self.validate_project(project)
         
-        # save as submitted
-        project_id = self.project_repo.save_project_complete(project, user_id, project_status = 'submitted')
-        
-        # generate project plan
-        prompt, llm_response_text = generate_project_plan(data)
+        # save as generating; a worker runs Gemini and flips it to submitted
+        project_id = self.project_repo.save_project_complete(project, user_id, project_status = 'generating')
         
-        # save prompt
-        prompt_id = self.project_repo.save_prompt_version(project_id, prompt)
-        # save llm response
-        self.project_repo.save_llm_history(project_id, prompt_id, llm_response_text)
+        # queue the project plan generation
+        job_id = self.generation_jobs.enqueue(project_id, data)
         
-        return project_id, prompt_id, llm_response_text
+        return project_id, job_id
+
+    def submit_project_stream(self, data: dict, user_id: int):
+        """
+        Save the project and start streaming its plan. Returns
+        (project_id, events); events yields ('chunk', text) as Gemini
+        produces it, then ('done', prompt_id) once the assembled response
+        is stored. Validation errors raise before anything is streamed.
+        events runs after the request has ended, so the caller iterates it
+        inside a fresh app context and closes it when the client goes away.
+        """
+        self._validate_req_fields(data)
+        project = self.build_project_detailed(data, user_id)
+        self.validate_project(project)
+
+        project_id = self.project_repo.save_project_complete(project, user_id, project_status = 'generating')
+
+        def events():
+            parts = []
+            finished = False
+            try:
+                prompt, chunks = stream_project_plan(data)
+                for text in chunks:
+                    parts.append(text)
+                    yield 'chunk', text
+                prompt_id = self.project_repo.save_prompt_version(project_id, prompt)
+                self.project_repo.save_llm_history(project_id, prompt_id, ''.join(parts))
+                self.project_repo.update_project_status(project_id, 'submitted')
+                finished = True
+            finally:
+                # Gemini error or the client went away mid-stream
+                if not finished:
+                    self.project_repo.update_project_status(project_id, 'failed')
+            yield 'done', prompt_id
+
+        return project_id, events()
+
+    def get_generation_job(self, job_id, user_id):
+        return self.generation_jobs.get_job(job_id, user_id)
     
     def get_projects_by_user(self, user_id):
         return self.project_repo.get_projects_by_user(user_id)
+
+    def get_project_summaries(self, user_id, limit, cursor=None, status=None, sort='updated'):
+        if status and status not in PROJECT_STATUSES:
+            raise ValueError(f"status must be one of: {', '.join(PROJECT_STATUSES)}")
+        return self.project_repo.get_project_summaries(user_id, limit, cursor=cursor, status=status, sort=sort)
+
+    def get_project_dashboard(self, user_id, limit, cursor=None, status=None, sort='updated'):
+        if status and status not in PROJECT_STATUSES:
+            raise ValueError(f"status must be one of: {', '.join(PROJECT_STATUSES)}")
+        return self.project_repo.get_project_dashboard(user_id, limit, cursor=cursor, status=status, sort=sort)
     
     def delete_project(self, project_id: int, user_id: int) -> None:
+        # Soft delete in one statement; children are purged in the background
+        if self.project_repo.delete_project(project_id, user_id):
+            return
+
+        # only a failed delete needs to know why
         project = self.project_repo.get_project_by_id(project_id)
         if not project:
             raise FileNotFoundError("Project not found")
-        if project.user_id != user_id:
-            print("Project user_id: ", project.user_id, "User ID:", user_id, "\n")
-            raise PermissionError("You do not have permission to delete this project")
-        
-        # Delete the project (cascades to budget, timeframe, team, etc.)
-        self.project_repo.delete_project(project_id, user_id)
-    
+        print("Project user_id: ", project.user_id, "User ID:", user_id, "\n")
+        raise PermissionError("You do not have permission to delete this project")
+
+
+    def get_generation_history(self, project_id, user_id, limit, cursor=None):
+        if not self.project_repo.project_belongs_to(project_id, user_id):
+            raise FileNotFoundError("Project not found")
+        return self.project_repo.get_generation_history_page(project_id, limit, cursor=cursor)
+
+    def get_generation_history_entry(self, project_id, history_id, user_id):
+        entry = self.project_repo.get_generation_history_entry(project_id, history_id, user_id)
+        if not entry:
+            raise FileNotFoundError("Generation not found")
+        return entry
 
     def get_project_details(self, project_id, user_id):
-        # Fetch raw rows from DB
-        detailed_rows = self.project_repo.get_project_details_rows(project_id, user_id)
-        if not detailed_rows:
+        # Header row plus one pre-aggregated row per member
+        header, member_rows = self.project_repo.get_project_details_parts(project_id, user_id)
+        if not header:
             return None
-        
-               # Convert first row to dict for ProjectDetailed
-        first_row = detailed_rows[0]
+
         project_dict = {
-            'id': first_row['project_id'],
-            'name': first_row['name'],
-            'requirement_description': first_row.get('requirementDescription'),
-            'goal_description': first_row.get('goalDescription'),
-            'project_status': first_row.get('status'),
-            'budget_floor': first_row.get('budget_floor'),
-            'budget_ceiling': first_row.get('budget_ceiling'),
-            'start_date': first_row.get('project_start_date'),
-            'end_date': first_row.get('project_end_date'),
-            'team_members': []
+            'id': header['project_id'],
+            'name': header['name'],
+            'requirement_description': header.get('requirementDescription'),
+            'goal_description': header.get('goalDescription'),
+            'project_status': header.get('status'),
+            'budget_floor': header.get('budget_floor'),
+            'budget_ceiling': header.get('budget_ceiling'),
+            'start_date': header.get('project_start_date'),
+            'end_date': header.get('project_end_date'),
+            'team_members': [
+                {'member': row['member'], 'language': row.get('language'), 'framework': row.get('framework')}
+                for row in member_rows if row.get('member')
+            ]
         }
 
-        # Aggregate team members and their skills
-        members_dict = {}
-        for row in detailed_rows:
-            member_name = row.get('member')
-            if not member_name:
-                continue
-            if member_name not in members_dict:
-                members_dict[member_name] = {'member': member_name, 'language': None, 'framework': None}
-
-            skill = row.get('skill')
-            category = row.get('category')
-            if skill and category:
-                if category == 'Language':
-                    members_dict[member_name]['language'] = skill
-                elif category == 'Framework':
-                    members_dict[member_name]['framework'] = skill
-
-        project_dict['team_members'] = list(members_dict.values())
-
         # Build ProjectDetailed object
         project_detailed = self.build_project_detailed(project_dict, user_id)
 
@@ -0,0 +1,123 @@
+# services/purge_service.py
+import threading
+import time
+
+
+class PurgeService:
+    """
+    Drains soft-deleted projects and users in small batches. Each batch is
+    one DELETE ... LIMIT n plus a commit, so row locks are held briefly; the
+    batch size halves when a batch runs over max_lock_ms and doubles again
+    when batches finish well inside it.
+    """
+
+    def __init__(self, purge_repo, batch_size=500, max_lock_ms=200, min_batch=10,
+                 max_batch=5000, pause_ms=0, clock=time.perf_counter, sleep=time.sleep):
+        self.purge_repo = purge_repo
+        self.batch_size = batch_size
+        self.max_lock_ms = max_lock_ms
+        self.min_batch = min_batch
+        self.max_batch = max_batch
+        self.pause_ms = pause_ms
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+
+        self.projects_purged = 0
+        self.users_purged = 0
+        self.rows_deleted = 0
+        self.batches = 0
+        self.slow_batches = 0
+        self.last_batch_ms = 0.0
+        self.last_run_at = None
+        self.current = None  # {'project_id', 'table', 'rows_deleted'} while purging
+
+    def _adapt(self, elapsed_ms, rows):
+        if elapsed_ms > self.max_lock_ms:
+            self.slow_batches += 1
+            self.batch_size = max(self.min_batch, self.batch_size // 2)
+        elif elapsed_ms < self.max_lock_ms / 4 and rows >= self.batch_size:
+            self.batch_size = min(self.max_batch, self.batch_size * 2)
+
+    def _purge_batch(self, project_id):
+        started = self._clock()
+        table, rows = self.purge_repo.purge_project_batch(project_id, self.batch_size)
+        elapsed_ms = (self._clock() - started) * 1000
+
+        self.batches += 1
+        self.rows_deleted += rows
+        self.last_batch_ms = round(elapsed_ms, 2)
+        if self.current is None or self.current['project_id'] != project_id:
+            self.current = {'project_id': project_id, 'table': table, 'rows_deleted': 0}
+        self.current['table'] = table
+        self.current['rows_deleted'] += rows
+
+        if table == "Project":
+            self.projects_purged += 1
+            self.current = None
+        else:
+            self._adapt(elapsed_ms, rows)
+
+    def run_once(self, max_batches=None, on_progress=None):
+        """
+        Purge until nothing is pending or max_batches is reached.
+        Returns False when another process holds the purge lock.
+        """
+        if not self._lock.acquire(blocking=False):
+            return False
+        try:
+            if not self.purge_repo.try_lock():
+                return False
+            try:
+                done = 0
+                while max_batches is None or done < max_batches:
+                    project_id = self.purge_repo.next_deleted_project()
+                    if project_id is not None:
+                        self._purge_batch(project_id)
+                    else:
+                        user_id = self.purge_repo.next_deleted_user()
+                        if user_id is None:
+                            break
+                        self.users_purged += self.purge_repo.purge_user(user_id)
+                    done += 1
+                    if on_progress:
+                        on_progress(self.stats())
+                    if self.pause_ms:
+                        self._sleep(self.pause_ms / 1000)
+                return True
+            finally:
+                self.last_run_at = time.time()
+                self.purge_repo.release_lock()
+        finally:
+            self._lock.release()
+
+    def stats(self):
+        return {
+            "batch_size": self.batch_size,
+            "max_lock_ms": self.max_lock_ms,
+            "last_batch_ms": self.last_batch_ms,
+            "batches": self.batches,
+            "slow_batches": self.slow_batches,
+            "rows_deleted": self.rows_deleted,
+            "projects_purged": self.projects_purged,
+            "users_purged": self.users_purged,
+            "current": dict(self.current) if self.current else None,
+            "last_run_at": self.last_run_at,
+        }
+
+
+def start_purge_worker(app, purge_service, interval=30):
+    """Run purge_service.run_once every interval seconds on a daemon thread."""
+    stop = threading.Event()
+
+    def loop():
+        while not stop.wait(interval):
+            try:
+                with app.app_context():
+                    purge_service.run_once()
+            except Exception as e:
+                print("Purge worker error:", e)
+
+    thread = threading.Thread(target=loop, name="purge-worker", daemon=True)
+    thread.start()
+    return stop
@@ -1,6 +1,6 @@
-from globals import bcrypt
 from models.user import User
 from utils.auth_utils import generate_token
+from utils.hash_pool import hash_password, check_password, needs_rehash, HashPoolSaturated
 
 class UserService:
     def __init__(self, user_repo):
@@ -13,10 +13,10 @@ class UserService:
         if role not in ['regular', 'admin']:
             return None, "Invalid role"
         
-        if self.user_repo.get_user_by_email(email):
+        if self.user_repo.email_taken(email):
             return None, "Email already registered"
 
-        pw_hash = bcrypt.generate_password_hash(password).decode('utf-8')
+        pw_hash = hash_password(password)
         self.user_repo.insert_user(first_name, last_name, email, pw_hash, role)
         user = self.user_repo.get_user_by_email(email)
         return user, None
@@ -27,23 +27,37 @@ class UserService:
         if not user or user.status != "active":
             return None, None, "Invalid credentials"
 
-        if not bcrypt.check_password_hash(user.password, password):
+        if not check_password(user.password, password):
             return None, None, "Invalid credentials"
 
-        token = generate_token(user.to_dict())
+        self._rehash_if_outdated(user, password)
+
+        token = generate_token(user.to_dict(), user.token_version)
         print(user.to_dict(), '\n', token, '\n')
         return user, token, None
 
 
+    def _rehash_if_outdated(self, user, password):
+        # upgrade hashes made with an older cost factor while we hold the plaintext
+        if not needs_rehash(user.password):
+            return
+        try:
+            new_hash = hash_password(password)
+        except HashPoolSaturated:
+            return  # retried on a later login
+        self.user_repo.update_password(user.id, new_hash, revoke_tokens=False)
+        user.password = new_hash
+
+
     def reset_password(self, email, old_password, new_password):
         user = self.user_repo.get_user_by_email(email)
         if not user:
             return "User not found"
 
-        if not bcrypt.check_password_hash(user.password, old_password):
+        if not check_password(user.password, old_password):
             return "Old password incorrect"
 
-        new_hash = bcrypt.generate_password_hash(new_password).decode('utf-8')
+        new_hash = hash_password(new_password)
         self.user_repo.update_password(user.id, new_hash)
         return None
 
@@ -52,7 +66,7 @@ class UserService:
         if not user:
             return "User not found"
 
-        if not bcrypt.check_password_hash(user.password, password):
+        if not check_password(user.password, password):
             return "Incorrect password"
 
         self.user_repo.update_profile(user.id, first_name, last_name)
@@ -33,13 +33,33 @@ def test_admin_list_users_forbidden_for_non_admin(client, monkeypatch):
 
 def test_admin_list_users_success(app_with_repo, monkeypatch):
     client = app_with_repo.test_client()
-    app_with_repo.user_repo.get_all_users.return_value = [
-        Mock(to_dict=lambda: {"email": "admin@test.com", "role": "admin"})
-    ]
+    app_with_repo.user_repo.get_users_page.return_value = (
+        [Mock(to_dict=lambda: {"email": "admin@test.com", "role": "admin"})],
+        "next-page"
+    )
     monkeypatch.setattr(admin_routes, "authenticate_token", lambda repo: (Mock(role="admin"), None, None))
-    resp = client.get("/api/admin/users")
+    resp = client.get("/api/admin/users?limit=10&role=admin&q=adm")
     assert resp.status_code == 200
     assert "users" in resp.json
+    assert resp.json["next_cursor"] == "next-page"
+    app_with_repo.user_repo.get_users_page.assert_called_once_with(
+        10, cursor=None, role="admin", status=None, prefix="adm"
+    )
+
+def test_admin_list_users_bad_limit(app_with_repo, monkeypatch):
+    client = app_with_repo.test_client()
+    monkeypatch.setattr(admin_routes, "authenticate_token", lambda repo: (Mock(role="admin"), None, None))
+    resp = client.get("/api/admin/users?limit=abc")
+    assert resp.status_code == 400
+
+def test_admin_list_users_crafted_cursor(app_with_repo, monkeypatch):
+    from repositories.user_repository import UserRepository
+    from utils.pagination_utils import encode_cursor
+    client = app_with_repo.test_client()
+    app_with_repo.user_repo = UserRepository(Mock())
+    monkeypatch.setattr(admin_routes, "authenticate_token", lambda repo: (Mock(role="admin"), None, None))
+    resp = client.get("/api/admin/users", query_string={"cursor": encode_cursor("2025-01-02", {"id": 1})})
+    assert resp.status_code == 400
 
 def test_admin_delete_user_success(app_with_repo, monkeypatch):
     client = app_with_repo.test_client()
@@ -56,3 +76,27 @@ def test_admin_delete_user_not_found(app_with_repo, monkeypatch):
     resp = client.delete("/api/admin/users/999")
     assert resp.status_code == 404
     assert resp.json["error"] == "User not found"
+
+def test_admin_bulk_users_success_skips_self(app_with_repo, monkeypatch):
+    client = app_with_repo.test_client()
+    app_with_repo.user_repo.bulk_update_users.return_value = {2: 'updated', 3: 'not_found'}
+    monkeypatch.setattr(admin_routes, "authenticate_token", lambda repo: (Mock(role="admin", id=1), None, None))
+    resp = client.post("/api/admin/users/bulk", json={"action": "deactivate", "user_ids": [1, 2, 3]})
+    assert resp.status_code == 200
+    assert resp.json["results"] == [
+        {"id": 1, "result": "skipped"},
+        {"id": 2, "result": "updated"},
+        {"id": 3, "result": "not_found"},
+    ]
+    app_with_repo.user_repo.bulk_update_users.assert_called_once_with("deactivate", [2, 3])
+
+def test_admin_bulk_users_rejects_bad_action(app_with_repo, monkeypatch):
+    client = app_with_repo.test_client()
+    monkeypatch.setattr(admin_routes, "authenticate_token", lambda repo: (Mock(role="admin", id=1), None, None))
+    resp = client.post("/api/admin/users/bulk", json={"action": "explode", "user_ids": [2]})
+    assert resp.status_code == 400
+
+def test_admin_bulk_users_forbidden_for_non_admin(client, monkeypatch):
+    monkeypatch.setattr(admin_routes, "authenticate_token", lambda repo: (Mock(role="user"), None, None))
+    resp = client.post("/api/admin/users/bulk", json={"action": "delete", "user_ids": [2]})
+    assert resp.status_code == 403
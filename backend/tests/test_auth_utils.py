@@ -1,14 +1,18 @@
+import time
 import pytest
 from flask import Flask, g
-from unittest.mock import Mock
+from itsdangerous import TimestampSigner
+from unittest.mock import Mock, patch
 from utils.auth_utils import configure_serializer, generate_token, verify_token, authenticate_token
+from utils.session_store import MemorySessionStore
 
 @pytest.fixture(autouse=True)
 def reset_serializer():
     # Reset serializer and tokens before each test
     from utils import auth_utils
     auth_utils.serializer = None
-    auth_utils.tokens = {}
+    auth_utils.session_store = MemorySessionStore()
+    auth_utils.token_state_cache.clear()
 
 
 def test_generate_token_after_configuration():
@@ -18,8 +22,7 @@ def test_generate_token_after_configuration():
 
     from utils import auth_utils
     assert isinstance(token, str)
-    assert token in auth_utils.tokens
-    assert auth_utils.tokens[token] == 42
+    assert auth_utils.session_store.get(token) == 42
 
 
 def test_generate_token_without_configure_raises():
@@ -33,13 +36,15 @@ def test_verify_token_valid_active_user():
     user_repo = Mock()
     user = {"email": "charlie@example.com", "id": 7, "status": "active"}
     token = generate_token(user)
-    user_repo.get_user_by_email.return_value = user
+    user_repo.get_token_state.return_value = {"status": "active", "tokenVersion": 0}
 
     app = Flask(__name__)
     with app.app_context():
         result = verify_token(token, user_repo)
         assert result is True
-        assert g.current_user == user
+        assert g.current_user.id == 7
+        assert g.current_user.email == "charlie@example.com"
+    user_repo.get_user_by_email.assert_not_called()
 
 
 def test_verify_token_invalid_token():
@@ -86,14 +91,129 @@ def test_authenticate_token_success():
     app = Flask(__name__)
     configure_serializer("secret-key")
 
-    fake_user = {"email": "eva@example.com", "id": 9}
+    fake_user = {"email": "eva@example.com", "id": 9, "role": "admin", "status": "active"}
     token = generate_token(fake_user)
 
     user_repo = Mock()
-    user_repo.get_user_by_email.return_value = fake_user
+    user_repo.get_token_state.return_value = {"status": "active", "tokenVersion": 0}
 
     with app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
         user, error, status = authenticate_token(user_repo)
-        assert user == fake_user
+        assert user.id == 9
+        assert user.role == "admin"
         assert error is None
         assert status is None
+    user_repo.get_user_by_email.assert_not_called()
+
+
+def test_authenticate_token_rejects_legacy_email_token():
+    from utils import auth_utils
+    app = Flask(__name__)
+    configure_serializer("secret-key")
+    # token from before claims were signed in: only the email
+    token = auth_utils.serializer.dumps("finn@example.com")
+    auth_utils.session_store.put(token, 12)
+
+    user_repo = Mock()
+    user_repo.get_user_by_email.return_value = {"email": "finn@example.com", "id": 12, "status": "active"}
+
+    with app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
+        user, error, status = authenticate_token(user_repo)
+        assert user is None
+        assert status == 401
+    user_repo.get_user_by_email.assert_not_called()
+
+
+def test_authenticate_token_rejects_expired_token():
+    app = Flask(__name__)
+    configure_serializer("secret-key", max_age=60)
+    token = generate_token({"email": "gus@example.com", "id": 18, "status": "active"})
+
+    user_repo = Mock()
+    user_repo.get_token_state.return_value = {"status": "active", "tokenVersion": 0}
+
+    with app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
+        assert authenticate_token(user_repo)[0].id == 18
+
+    # two minutes later the signature is too old, though the session is still stored
+    with patch.object(TimestampSigner, "get_timestamp", return_value=int(time.time()) + 120):
+        with app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
+            user, error, status = authenticate_token(user_repo)
+            assert user is None
+            assert status == 401
+
+
+def test_invalidate_token_state_forces_reload():
+    from utils import auth_utils
+    user_repo = Mock()
+    user_repo.get_token_state.return_value = {"status": "active", "tokenVersion": 0}
+
+    auth_utils.get_cached_token_state(13, user_repo)
+    auth_utils.get_cached_token_state(13, user_repo)
+    auth_utils.invalidate_token_state(13)
+    auth_utils.get_cached_token_state(13, user_repo)
+
+    assert user_repo.get_token_state.call_count == 2
+
+
+def test_authenticate_token_rejects_revoked_version():
+    app = Flask(__name__)
+    configure_serializer("secret-key")
+    token = generate_token({"email": "hal@example.com", "id": 14, "status": "active"}, token_version=2)
+
+    user_repo = Mock()
+    user_repo.get_token_state.return_value = {"status": "active", "tokenVersion": 3}
+
+    with app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
+        user, error, status = authenticate_token(user_repo)
+        assert user is None
+        assert status == 401
+
+
+def test_authenticate_token_caches_token_state():
+    app = Flask(__name__)
+    configure_serializer("secret-key")
+    token = generate_token({"email": "ivy@example.com", "id": 15, "status": "active"})
+
+    user_repo = Mock()
+    user_repo.get_token_state.return_value = {"status": "active", "tokenVersion": 0}
+
+    for _ in range(3):
+        with app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
+            user, error, status = authenticate_token(user_repo)
+            assert user.id == 15
+
+    user_repo.get_token_state.assert_called_once_with(15)
+
+
+def test_authenticate_token_rejects_ended_session():
+    from utils import auth_utils
+    app = Flask(__name__)
+    configure_serializer("secret-key")
+    token = generate_token({"email": "jo@example.com", "id": 16, "status": "active"})
+
+    user_repo = Mock()
+    user_repo.get_token_state.return_value = {"status": "active", "tokenVersion": 0}
+
+    auth_utils.end_session(token)
+    with app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
+        user, error, status = authenticate_token(user_repo)
+        assert user is None
+        assert status == 401
+    user_repo.get_token_state.assert_not_called()
+
+
+def test_authenticate_token_rejects_token_missing_from_session_store():
+    from utils import auth_utils
+    app = Flask(__name__)
+    configure_serializer("secret-key")
+    # validly signed, but never issued through generate_token
+    token = auth_utils.serializer.dumps({"id": 17, "email": "kai@example.com", "ver": 0})
+
+    user_repo = Mock()
+    user_repo.get_token_state.return_value = {"status": "active", "tokenVersion": 0}
+
+    with app.test_request_context(headers={"Authorization": f"Bearer {token}"}):
+        user, error, status = authenticate_token(user_repo)
+        assert user is None
+        assert status == 401
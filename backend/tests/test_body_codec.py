@@ -0,0 +1,44 @@
+# tests/test_body_codec.py
+import pytest
+from utils.body_codec import BodyCodec, ZLIB_MARKER, is_compressed
+
+PLAN = "# Project Plan\n\n" + "- Build the thing with Flask and React.\n" * 200
+
+
+def test_zlib_round_trip_and_marker():
+    codec = BodyCodec("zlib")
+    stored = codec.encode(PLAN)
+
+    assert stored.startswith(ZLIB_MARKER)
+    assert is_compressed(stored)
+    assert len(stored) < len(PLAN) / 5
+    assert codec.decode(stored) == PLAN
+
+
+def test_small_bodies_stay_plain():
+    codec = BodyCodec("zlib", min_size=256)
+    stored = codec.encode("short prompt é")
+
+    assert stored == "short prompt é".encode("utf-8")
+    assert not is_compressed(stored)
+    assert codec.decode(stored) == "short prompt é"
+
+
+def test_decode_accepts_legacy_text_and_none():
+    codec = BodyCodec("zlib")
+    assert codec.decode("already text") == "already text"
+    assert codec.decode(bytearray(b"plain bytes")) == "plain bytes"
+    assert codec.decode(None) is None
+
+
+def test_none_codec_never_compresses_but_reads_compressed_rows():
+    stored = BodyCodec("zlib").encode(PLAN)
+    codec = BodyCodec("none")
+
+    assert codec.encode(PLAN) == PLAN.encode("utf-8")
+    assert codec.decode(stored) == PLAN
+
+
+def test_unknown_codec_rejected():
+    with pytest.raises(ValueError):
+        BodyCodec("lz4")
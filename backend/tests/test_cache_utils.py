@@ -0,0 +1,58 @@
+# tests/test_cache_utils.py
+import pytest
+from utils.cache_utils import TTLCache
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def test_get_returns_value_before_ttl():
+    clock = FakeClock()
+    cache = TTLCache(max_size=2, ttl=10, clock=clock)
+    cache.set("a", 1)
+    clock.now = 9
+    assert cache.get("a") == 1
+    assert cache.hits == 1
+
+
+def test_entry_expires_after_ttl():
+    clock = FakeClock()
+    cache = TTLCache(max_size=2, ttl=10, clock=clock)
+    cache.set("a", 1)
+    clock.now = 10
+    assert cache.get("a") is None
+    assert cache.misses == 1
+    assert len(cache) == 0
+
+
+def test_lru_eviction_keeps_recently_used():
+    cache = TTLCache(max_size=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    assert cache.evictions == 1
+
+
+def test_discard_where_removes_matching_entries():
+    cache = TTLCache(max_size=4, ttl=60)
+    cache.set("x", {"id": 1})
+    cache.set("y", {"id": 2})
+    removed = cache.discard_where(lambda v: v["id"] == 1)
+    assert removed == 1
+    assert cache.get("x") is None
+    assert cache.get("y") == {"id": 2}
+
+
+def test_invalid_max_size_raises():
+    with pytest.raises(ValueError):
+        TTLCache(max_size=0)
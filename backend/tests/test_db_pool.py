@@ -0,0 +1,140 @@
+import threading
+import pytest
+from flask import Flask
+
+from utils.db_pool import ConnectionPool, PoolTimeout, PooledMySQL
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+class FakeConn:
+    def __init__(self, n):
+        self.n = n
+        self.closed = False
+        self.rollbacks = 0
+        self.ping_ok = True
+        self.rollback_ok = True
+
+    def ping(self):
+        if not self.ping_ok:
+            raise RuntimeError("gone away")
+
+    def rollback(self):
+        if not self.rollback_ok:
+            raise RuntimeError("gone away")
+        self.rollbacks += 1
+
+    def close(self):
+        self.closed = True
+
+
+def make_pool(**kwargs):
+    made = []
+
+    def connect():
+        conn = FakeConn(len(made))
+        made.append(conn)
+        return conn
+
+    kwargs.setdefault("min_size", 0)
+    return ConnectionPool(connect, **kwargs), made
+
+
+def test_released_connection_is_reused_and_rolled_back():
+    pool, made = make_pool()
+    conn = pool.acquire()
+    pool.release(conn)
+    assert pool.acquire() is conn
+    assert conn.rollbacks == 1
+    assert len(made) == 1
+
+
+def test_min_size_is_filled_on_first_acquire():
+    pool, made = make_pool(min_size=3)
+    assert made == []
+    pool.acquire()
+    assert len(made) == 3
+    assert pool.stats()["idle"] == 2
+
+
+def test_acquire_times_out_when_pool_is_exhausted():
+    pool, _ = make_pool(max_size=1, timeout=0.05)
+    pool.acquire()
+    with pytest.raises(PoolTimeout):
+        pool.acquire()
+    assert pool.stats()["timeouts"] == 1
+
+
+def test_waiter_gets_connection_released_by_another_thread():
+    pool, made = make_pool(max_size=1, timeout=2)
+    conn = pool.acquire()
+    got = []
+    t = threading.Thread(target=lambda: got.append(pool.acquire()))
+    t.start()
+    threading.Timer(0.05, pool.release, args=(conn,)).start()
+    t.join(2)
+    assert got == [conn]
+    assert len(made) == 1
+
+
+def test_idle_and_old_connections_are_recycled():
+    clock = FakeClock()
+    pool, made = make_pool(max_idle=10, max_lifetime=100, clock=clock, pre_ping=False)
+    first = pool.acquire()
+    pool.release(first)
+
+    clock.now = 11
+    second = pool.acquire()
+    assert second is not first and first.closed
+
+    clock.now = 112
+    pool.release(second)
+    third = pool.acquire()
+    assert third is not second and second.closed
+    assert pool.stats()["recycled"] == 2
+
+
+def test_failed_ping_discards_and_opens_a_new_connection():
+    clock = FakeClock()
+    pool, made = make_pool(clock=clock, ping_interval=1.0)
+    conn = pool.acquire()
+    pool.release(conn)
+    conn.ping_ok = False
+
+    clock.now = 2
+    fresh = pool.acquire()
+    assert fresh is not conn and conn.closed
+    stats = pool.stats()
+    assert stats["ping_failures"] == 1
+    assert stats["size"] == 1
+
+
+def test_connection_that_cannot_roll_back_is_discarded():
+    pool, made = make_pool()
+    conn = pool.acquire()
+    conn.rollback_ok = False
+    pool.release(conn)
+    assert conn.closed
+    assert pool.stats()["size"] == 0
+
+
+def test_pooled_mysql_borrows_once_per_app_context():
+    app = Flask(__name__)
+    db = PooledMySQL(app)
+    pool, made = make_pool()
+    db.pool = pool
+
+    with app.app_context():
+        assert db.connection is db.connection
+        assert pool.stats()["in_use"] == 1
+    assert pool.stats()["in_use"] == 0
+    assert pool.stats()["idle"] == 1
+
+    with app.app_context():
+        assert db.connection is made[0]
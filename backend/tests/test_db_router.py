@@ -0,0 +1,159 @@
+# tests/test_db_router.py
+import pytest
+from flask import Flask, g
+from unittest.mock import MagicMock
+from utils import db_router
+from utils.db_router import DBRouter, reads, writes, configure_stickiness
+from utils.session_store import SQLiteSessionStore
+
+
+class FakePrimary:
+    connection = "primary"
+
+
+class FakeReplicas:
+    hosts = [("replica-1", 3306)]
+    failures = 0
+
+    def __init__(self, fail=False):
+        self.fail = fail
+
+    @property
+    def connection(self):
+        if self.fail:
+            raise RuntimeError("replica down")
+        return "replica"
+
+    def stats(self):
+        return []
+
+
+class Repo:
+    def __init__(self, mysql):
+        self.mysql = mysql
+
+    @reads
+    def list_things(self):
+        return self.mysql.connection
+
+    @writes
+    def save_thing(self):
+        return self.mysql.connection
+
+    @writes
+    def save_then_list(self):
+        return self.list_things()
+
+    def unannotated(self):
+        return self.mysql.connection
+
+
+@pytest.fixture
+def app():
+    configure_stickiness(5)
+    return Flask(__name__)
+
+
+def test_reads_go_to_replica_and_writes_to_primary(app):
+    repo = Repo(DBRouter(FakePrimary(), FakeReplicas()))
+    with app.test_request_context():
+        assert repo.list_things() == "replica"
+        assert repo.unannotated() == "primary"
+        assert repo.save_thing() == "primary"
+
+
+def test_reads_nested_in_a_write_stay_on_primary(app):
+    repo = Repo(DBRouter(FakePrimary(), FakeReplicas()))
+    with app.test_request_context():
+        assert repo.save_then_list() == "primary"
+
+
+def test_reads_after_a_write_in_the_same_request_use_primary(app):
+    repo = Repo(DBRouter(FakePrimary(), FakeReplicas()))
+    with app.test_request_context():
+        repo.save_thing()
+        assert repo.list_things() == "primary"
+
+
+def test_user_stays_on_primary_for_the_sticky_window(app):
+    router = DBRouter(FakePrimary(), FakeReplicas())
+    repo = Repo(router)
+
+    with app.test_request_context():
+        g.auth_user_id = 7
+        repo.save_thing()
+
+    with app.test_request_context():
+        g.auth_user_id = 7
+        assert repo.list_things() == "primary"
+
+    with app.test_request_context():
+        g.auth_user_id = 8
+        assert repo.list_things() == "replica"
+
+    assert router.stats()["sticky"] == 1
+
+
+def test_sticky_window_expires(app):
+    configure_stickiness(0)
+    repo = Repo(DBRouter(FakePrimary(), FakeReplicas()))
+
+    with app.test_request_context():
+        g.auth_user_id = 7
+        repo.save_thing()
+    with app.test_request_context():
+        g.auth_user_id = 7
+        assert repo.list_things() == "replica"
+
+
+def test_shared_store_keeps_user_sticky_across_workers(app, tmp_path):
+    path = str(tmp_path / "sessions.db")
+    repo = Repo(DBRouter(FakePrimary(), FakeReplicas()))
+
+    # the write is served by one worker...
+    configure_stickiness(5, store=SQLiteSessionStore(path))
+    with app.test_request_context():
+        g.auth_user_id = 7
+        repo.save_thing()
+
+    # ...and the next read by another, with its own connection to the store
+    configure_stickiness(5, store=SQLiteSessionStore(path))
+    with app.test_request_context():
+        g.auth_user_id = 7
+        assert repo.list_things() == "primary"
+    with app.test_request_context():
+        g.auth_user_id = 8
+        assert repo.list_things() == "replica"
+
+
+def test_without_replicas_everything_uses_primary(app):
+    replicas = MagicMock(hosts=[])
+    repo = Repo(DBRouter(FakePrimary(), replicas))
+    with app.test_request_context():
+        assert repo.list_things() == "primary"
+
+
+def test_replica_failure_falls_back_to_primary(app):
+    router = DBRouter(FakePrimary(), FakeReplicas(fail=True))
+    with app.test_request_context():
+        assert Repo(router).list_things() == "primary"
+    assert router.stats()["fallback"] == 1
+
+
+def test_decorators_are_transparent_for_plain_connections():
+    # repositories are also built directly on a mock in tests and scripts
+    repo = Repo(MagicMock(connection="plain"))
+    assert repo.list_things() == "plain"
+    assert repo.save_thing() == "plain"
+    assert db_router._intent.get() is None
+
+
+def test_job_plan_is_read_from_primary(app):
+    from repositories.project_repository import ProjectRepository
+    primary = MagicMock()
+    primary.connection.cursor.return_value.__enter__.return_value.fetchone.return_value = None
+    router = DBRouter(primary, FakeReplicas())
+    with app.test_request_context():
+        # the worker that stored the plan wrote outside any request, so nobody is sticky
+        assert ProjectRepository(router).get_generation_response_for_prompt(1, 2) is None
+    assert router.stats()["replica"] == 0
@@ -1,7 +1,14 @@
 # tests/test_gemini_utils.py
 import pytest
 from unittest.mock import patch, MagicMock
-from utils import gemini_utils
+from utils import gemini_utils, llm_cache
+
+
+@pytest.fixture(autouse=True)
+def fresh_client(monkeypatch):
+    monkeypatch.setattr(gemini_utils, "gemini_client", gemini_utils.GeminiClientHolder())
+    monkeypatch.setattr(llm_cache, "llm_cache", llm_cache.LLMResponseCache())
+
 
 def test_generate_project_plan_success(monkeypatch):
     # Mock current_app.config
@@ -15,7 +22,7 @@ def test_generate_project_plan_success(monkeypatch):
     mock_response.text = "Generated project plan"
     mock_client_instance = MagicMock()
     mock_client_instance.models.generate_content.return_value = mock_response
-    monkeypatch.setattr(gemini_utils.genai, "Client", lambda api_key: mock_client_instance)
+    monkeypatch.setattr(gemini_utils.genai, "Client", lambda api_key, **kwargs: mock_client_instance)
 
     # Sample input data
     data = {
@@ -53,7 +60,7 @@ def test_generate_project_plan_client_exception(monkeypatch):
     monkeypatch.setattr(gemini_utils, "current_app", MockCurrentApp())
 
     # Mock genai.Client to raise exception
-    def mock_client_fail(api_key):
+    def mock_client_fail(api_key, **kwargs):
         raise Exception("Init error")
     monkeypatch.setattr(gemini_utils.genai, "Client", mock_client_fail)
 
@@ -69,8 +76,99 @@ def test_generate_project_plan_generate_content_exception(monkeypatch):
 
     mock_client_instance = MagicMock()
     mock_client_instance.models.generate_content.side_effect = Exception("API fail")
-    monkeypatch.setattr(gemini_utils.genai, "Client", lambda api_key: mock_client_instance)
+    monkeypatch.setattr(gemini_utils.genai, "Client", lambda api_key, **kwargs: mock_client_instance)
 
     data = {"team_members": []}
     with pytest.raises(RuntimeError, match="Failed to generate plan from Gemini API"):
         gemini_utils.generate_project_plan(data)
+
+
+def _patch_app(monkeypatch, config):
+    class MockCurrentApp:
+        pass
+    MockCurrentApp.config = config
+    monkeypatch.setattr(gemini_utils, "current_app", MockCurrentApp())
+
+
+def test_client_is_reused_across_calls(monkeypatch):
+    _patch_app(monkeypatch, {"GEMINI_API_KEY": "fake-key"})
+    created = []
+
+    def make_client(api_key, **kwargs):
+        client = MagicMock()
+        client.models.generate_content.return_value.text = "plan"
+        created.append(client)
+        return client
+    monkeypatch.setattr(gemini_utils.genai, "Client", make_client)
+
+    gemini_utils.generate_project_plan({"name": "First", "team_members": []})
+    gemini_utils.generate_project_plan({"name": "Second", "team_members": []})
+
+    assert len(created) == 1
+    stats = gemini_utils.gemini_client.stats()
+    assert stats["calls"] == 2
+    assert stats["clients_created"] == 1
+
+
+def test_rotated_api_key_replaces_client(monkeypatch):
+    config = {"GEMINI_API_KEY": "old-key"}
+    _patch_app(monkeypatch, config)
+    created = []
+
+    def make_client(api_key, **kwargs):
+        client = MagicMock()
+        client.models.generate_content.return_value.text = api_key
+        created.append(client)
+        return client
+    monkeypatch.setattr(gemini_utils.genai, "Client", make_client)
+
+    gemini_utils.generate_project_plan({"name": "First", "team_members": []})
+    config["GEMINI_API_KEY"] = "new-key"
+    _, text = gemini_utils.generate_project_plan({"name": "Second", "team_members": []})
+
+    assert text == "new-key"
+    assert len(created) == 2
+    created[0].close.assert_called_once()
+
+
+def test_stream_project_plan_yields_chunks_and_records_first_chunk(monkeypatch):
+    _patch_app(monkeypatch, {"GEMINI_API_KEY": "fake-key"})
+    client = MagicMock()
+    client.models.generate_content_stream.return_value = iter([
+        MagicMock(text="# Plan"), MagicMock(text=None), MagicMock(text="\n- step"),
+    ])
+    monkeypatch.setattr(gemini_utils.genai, "Client", lambda api_key, **kwargs: client)
+
+    prompt, chunks = gemini_utils.stream_project_plan({"name": "Streamed", "team_members": []})
+
+    assert "Streamed" in prompt
+    assert list(chunks) == ["# Plan", "\n- step"]
+    assert gemini_utils.gemini_client.stats()["streams"] == 1
+
+
+def test_identical_prompt_is_served_from_cache(monkeypatch):
+    _patch_app(monkeypatch, {"GEMINI_API_KEY": "fake-key"})
+    client = MagicMock()
+    client.models.generate_content.return_value.text = "plan"
+    monkeypatch.setattr(gemini_utils.genai, "Client", lambda api_key, **kwargs: client)
+
+    data = {"name": "Cached", "team_members": []}
+    gemini_utils.generate_project_plan(data)
+    _, text = gemini_utils.generate_project_plan(dict(data))
+
+    assert text == "plan"
+    client.models.generate_content.assert_called_once()
+    assert llm_cache.llm_cache.stats()["memory_hits"] == 1
+
+
+def test_bypass_cache_flag_calls_gemini_again(monkeypatch):
+    _patch_app(monkeypatch, {"GEMINI_API_KEY": "fake-key"})
+    client = MagicMock()
+    client.models.generate_content.return_value.text = "plan"
+    monkeypatch.setattr(gemini_utils.genai, "Client", lambda api_key, **kwargs: client)
+
+    gemini_utils.generate_project_plan({"name": "Fresh", "team_members": []})
+    gemini_utils.generate_project_plan({"name": "Fresh", "team_members": [], "bypass_cache": True})
+
+    assert client.models.generate_content.call_count == 2
+    assert llm_cache.llm_cache.stats()["bypassed"] == 1
@@ -0,0 +1,172 @@
+# tests/test_generation_service.py
+import pytest
+from unittest.mock import MagicMock
+from models.generation_job import GenerationJob
+from services.generation_service import GenerationJobService
+
+
+class FakeJobRepo:
+    """In-memory GenerationJob table with the same claim/finish rules."""
+
+    def __init__(self):
+        self.jobs = {}
+        self.project_status = {}
+
+    def enqueue(self, project_id, payload):
+        job_id = len(self.jobs) + 1
+        self.jobs[job_id] = {"id": job_id, "project_id": project_id, "payload": payload,
+                             "status": "queued", "attempts": 0, "token": None, "prompt_id": None}
+        self.project_status[project_id] = "generating"
+        return job_id
+
+    def claim_next(self, token):
+        for job in self.jobs.values():
+            if job["status"] == "queued":
+                job.update(status="running", token=token, attempts=job["attempts"] + 1)
+                return {k: job[k] for k in ("id", "project_id", "attempts", "payload")}
+        return None
+
+    def mark_done(self, job_id, token, project_id, prompt_id):
+        job = self.jobs[job_id]
+        if job["token"] == token:
+            job.update(status="done", token=None, prompt_id=prompt_id)
+            self.project_status[project_id] = "submitted"
+
+    def mark_failed(self, job_id, token, project_id, error, retry):
+        job = self.jobs[job_id]
+        if job["token"] == token:
+            job.update(status="queued" if retry else "failed", token=None, error=error)
+            if not retry:
+                self.project_status[project_id] = "failed"
+
+    def mark_project_failed(self, project_id):
+        self.project_status[project_id] = "failed"
+
+    def requeue_stale(self, stale_seconds):
+        stale = [job for job in self.jobs.values() if job["status"] == "running"]
+        for job in stale:
+            job.update(status="queued", token=None)
+        return len(stale)
+
+    def fail_orphaned_projects(self, stale_seconds):
+        active = {job["project_id"] for job in self.jobs.values() if job["status"] in ("queued", "running")}
+        orphans = [pid for pid, status in self.project_status.items()
+                   if status == "generating" and pid not in active]
+        for pid in orphans:
+            self.project_status[pid] = "failed"
+        return len(orphans)
+
+    def get_job(self, job_id, user_id):
+        job = self.jobs.get(job_id)
+        if job is None:
+            return None
+        return GenerationJob(id=job_id, project_id=job["project_id"], status=job["status"],
+                             attempts=job["attempts"], prompt_id=job["prompt_id"])
+
+
+@pytest.fixture
+def job_repo():
+    return FakeJobRepo()
+
+
+@pytest.fixture
+def project_repo():
+    repo = MagicMock()
+    repo.save_prompt_version.return_value = 99
+    repo.get_generation_response_for_prompt.return_value = "the plan"
+    return repo
+
+
+def test_job_runs_generation_and_marks_project_submitted(job_repo, project_repo):
+    generate = MagicMock(return_value=("prompt", "the plan"))
+    service = GenerationJobService(job_repo, project_repo, generate=generate)
+
+    job_id = service.enqueue(5, {"name": "Demo"})
+    assert service.run_next() is True
+    assert service.run_next() is False
+
+    generate.assert_called_once_with({"name": "Demo"})
+    project_repo.save_prompt_version.assert_called_once_with(5, "prompt")
+    project_repo.save_llm_history.assert_called_once_with(5, 99, "the plan")
+    assert job_repo.project_status[5] == "submitted"
+
+    job = service.get_job(job_id, user_id=1)
+    assert job["status"] == "done"
+    assert job["llm_response"] == "the plan"
+    project_repo.get_generation_response_for_prompt.assert_called_once_with(5, 99)
+    project_repo.get_latest_generation_response.assert_not_called()
+
+
+def test_failed_job_is_retried_then_fails_project(job_repo, project_repo):
+    generate = MagicMock(side_effect=RuntimeError("Gemini down"))
+    service = GenerationJobService(job_repo, project_repo, generate=generate, max_attempts=2)
+
+    job_id = service.enqueue(5, {})
+    service.run_next()
+    assert job_repo.jobs[job_id]["status"] == "queued"
+    service.run_next()
+
+    assert job_repo.jobs[job_id]["status"] == "failed"
+    assert job_repo.project_status[5] == "failed"
+    assert service.stats()["retried"] == 1
+    assert service.stats()["failed"] == 1
+    project_repo.save_prompt_version.assert_not_called()
+
+
+def test_job_left_running_by_dead_worker_is_recovered(job_repo, project_repo):
+    generate = MagicMock(return_value=("prompt", "the plan"))
+    service = GenerationJobService(job_repo, project_repo, generate=generate)
+
+    job_id = service.enqueue(5, {})
+    job_repo.claim_next("worker-that-died")
+
+    assert service.run_next() is False
+    assert service.recover() == 1
+    assert service.run_next() is True
+    assert job_repo.jobs[job_id]["status"] == "done"
+    assert job_repo.jobs[job_id]["attempts"] == 2
+
+
+def test_recover_fails_generating_project_without_a_job(job_repo, project_repo):
+    # a streamed submit whose process died: 'generating' with nothing queued
+    job_repo.project_status[7] = "generating"
+    service = GenerationJobService(job_repo, project_repo)
+    service.enqueue(5, {})
+
+    service.recover()
+
+    assert job_repo.project_status[7] == "failed"
+    assert job_repo.project_status[5] == "generating"
+    assert service.stats()["orphans_failed"] == 1
+
+
+def test_enqueue_failure_marks_project_failed(job_repo, project_repo):
+    job_repo.enqueue = MagicMock(side_effect=RuntimeError("db down"))
+    service = GenerationJobService(job_repo, project_repo)
+
+    with pytest.raises(RuntimeError):
+        service.enqueue(5, {})
+    assert job_repo.project_status[5] == "failed"
+
+
+def test_unknown_job_raises_not_found(job_repo, project_repo):
+    service = GenerationJobService(job_repo, project_repo)
+    with pytest.raises(FileNotFoundError):
+        service.get_job(404, user_id=1)
+
+
+def test_identical_jobs_use_the_same_flight_key(job_repo, project_repo):
+    generate = MagicMock(return_value=("prompt", "the plan"))
+    single_flight = MagicMock()
+    single_flight.do.side_effect = lambda key, fn, after_wait=None: fn()
+    service = GenerationJobService(job_repo, project_repo, generate=generate, single_flight=single_flight)
+
+    service.enqueue(5, {"name": "Demo"})
+    service.enqueue(5, {"name": "Demo"})
+    service.run_next()
+    service.run_next()
+
+    first_key = single_flight.do.call_args_list[0].args[0]
+    second_key = single_flight.do.call_args_list[1].args[0]
+    assert first_key == second_key
+    assert first_key.startswith("5:")
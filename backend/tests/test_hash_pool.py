@@ -0,0 +1,113 @@
+# tests/test_hash_pool.py
+import threading
+from concurrent.futures import Future
+import pytest
+from utils.hash_pool import HashPool, HashPoolSaturated
+
+
+def test_inline_hash_and_check_roundtrip():
+    pool = HashPool(workers=0, rounds=4)
+    pw_hash = pool.hash("s3cret")
+
+    assert pw_hash.startswith("$2b$04$")
+    assert pool.check(pw_hash, "s3cret") is True
+    assert pool.check(pw_hash, "wrong") is False
+    assert pool.stats()["hash"]["count"] == 1
+    assert pool.stats()["check"]["count"] == 2
+
+
+def test_check_rejects_malformed_hash():
+    pool = HashPool(workers=0, rounds=4)
+    assert pool.check("hashed_pass_1", "anything") is False
+    assert pool.check(None, "anything") is False
+
+
+def test_process_pool_hashes_off_thread():
+    pool = HashPool(workers=1, rounds=4)
+    try:
+        pw_hash = pool.hash("pw")
+        assert pool.check(pw_hash, "pw") is True
+    finally:
+        pool.shutdown()
+
+
+def test_saturated_pool_rejects_new_work(monkeypatch):
+    pool = HashPool(workers=0, max_pending=1, retry_after=3, rounds=4)
+    entered = threading.Event()
+    release = threading.Event()
+
+    def slow_check(pw_hash, password):
+        entered.set()
+        release.wait(5)
+        return True
+
+    monkeypatch.setattr("utils.hash_pool._check_worker", slow_check)
+    worker = threading.Thread(target=pool.check, args=("h", "p"))
+    worker.start()
+    entered.wait(5)
+
+    with pytest.raises(HashPoolSaturated) as exc:
+        pool.check("h", "p")
+    assert exc.value.retry_after == 3
+    assert pool.stats()["rejected"] == 1
+
+    release.set()
+    worker.join()
+    assert pool.stats()["pending"] == 0
+
+
+class _StuckExecutor:
+    """Hands back futures that only finish when the test says so."""
+
+    def __init__(self):
+        self.futures = []
+
+    def submit(self, fn, *args):
+        future = Future()
+        self.futures.append(future)
+        return future
+
+
+def test_timed_out_job_is_saturation_and_keeps_its_slot():
+    pool = HashPool(workers=1, max_pending=1, timeout=0.01, retry_after=2, rounds=4)
+    pool._executor = _StuckExecutor()
+
+    with pytest.raises(HashPoolSaturated) as exc:
+        pool.check("h", "p")
+    assert exc.value.retry_after == 2
+    # the worker is still busy with the abandoned job
+    assert pool.stats()["pending"] == 1
+    with pytest.raises(HashPoolSaturated):
+        pool.check("h", "p")
+    assert pool.stats()["rejected"] == 1
+
+    pool._executor.futures[0].set_result(True)
+    assert pool.stats()["pending"] == 0
+
+
+def test_needs_rehash_detects_cost_and_variant():
+    from utils.hash_pool import needs_rehash, hash_cost
+    assert hash_cost("$2b$12$abcdefghijklmnopqrstuv") == ("$2b$", 12)
+    assert needs_rehash("$2b$12$abc", rounds=12) is False
+    assert needs_rehash("$2b$10$abc", rounds=12) is True
+    assert needs_rehash("$2a$12$abc", rounds=12) is True
+    assert needs_rehash("plain-text", rounds=12) is True
+
+
+def test_calibrate_rounds_picks_highest_cost_within_budget(monkeypatch):
+    from utils import hash_pool
+    # each cost factor "takes" 100ms more than the previous one
+    clock = {"now": 0.0}
+
+    def timer():
+        return clock["now"]
+
+    def fake_hash(pw, rounds):
+        clock["now"] += (rounds - 9) * 0.1
+
+    monkeypatch.setattr(hash_pool, "_hash_worker", fake_hash)
+    rounds, timings = hash_pool.calibrate_rounds(target_ms=250, min_rounds=10, max_rounds=16, samples=1, timer=timer)
+
+    assert rounds == 11
+    assert timings[10] == 100.0
+    assert timings[12] == 300.0
@@ -0,0 +1,69 @@
+# tests/test_llm_cache.py
+from unittest.mock import MagicMock
+from utils.llm_cache import LLMResponseCache, cache_key, normalize_prompt
+
+
+def test_key_ignores_whitespace_noise_but_not_model_or_content():
+    base = cache_key("Project: Demo\n\nGoal: ship", "model-a", "system")
+    assert cache_key("  Project: Demo  \r\n\n\n\nGoal: ship\n", "model-a", "system") == base
+    assert cache_key("Project: Demo\n\nGoal: ship", "model-b", "system") != base
+    assert cache_key("Project: Demo\n\nGoal: ship", "model-a", "other system") != base
+    assert cache_key("Project: Demo2\n\nGoal: ship", "model-a", "system") != base
+
+
+def test_normalize_prompt_keeps_single_blank_lines():
+    assert normalize_prompt("a \n\n\n\nb\t\n") == "a\n\nb"
+
+
+def test_store_hit_is_promoted_to_memory():
+    store = MagicMock()
+    store.get.return_value = "stored plan"
+    cache = LLMResponseCache(store=store, ttl=60)
+
+    assert cache.get("k") == "stored plan"
+    assert cache.get("k") == "stored plan"
+
+    store.get.assert_called_once_with("k", 60)
+    stats = cache.stats()
+    assert stats["store_hits"] == 1
+    assert stats["memory_hits"] == 1
+
+
+def test_put_writes_through_and_trims_periodically():
+    store = MagicMock()
+    cache = LLMResponseCache(store=store, ttl=60, max_rows=100)
+    cache.trim_every = 2
+
+    cache.put("a", "model", "plan a")
+    cache.put("b", "model", "plan b")
+
+    assert store.put.call_count == 2
+    store.trim.assert_called_once_with(60, 100)
+
+
+def test_store_errors_count_as_misses():
+    store = MagicMock()
+    store.get.side_effect = RuntimeError("db down")
+    store.put.side_effect = RuntimeError("db down")
+    cache = LLMResponseCache(store=store)
+
+    assert cache.get("k") is None
+    cache.put("k", "model", "plan")
+    assert cache.get("k") == "plan"
+    stats = cache.stats()
+    assert stats["errors"] == 2
+    assert stats["misses"] == 1
+
+
+def test_bypass_and_disabled_skip_lookup():
+    store = MagicMock()
+    cache = LLMResponseCache(store=store)
+    cache.put("k", "model", "plan")
+
+    assert cache.get("k", bypass=True) is None
+    assert cache.stats()["bypassed"] == 1
+
+    disabled = LLMResponseCache(store=store, enabled=False)
+    disabled.put("k", "model", "plan")
+    assert disabled.get("k") is None
+    assert store.put.call_count == 1
@@ -0,0 +1,152 @@
+# tests/test_migration_runner.py
+import pytest
+from unittest.mock import MagicMock
+from utils.migration_runner import (
+    MigrationRunner, MigrationError, load_migrations, split_statements, MIGRATIONS_DIR
+)
+
+
+class FakeDB:
+    """Records executed SQL and keeps SchemaMigration rows in memory."""
+
+    def __init__(self, applied=None, lock=1, fail_on=None):
+        self.applied = dict(applied or {})
+        self.lock = lock
+        self.fail_on = fail_on
+        self.executed = []
+        self.commits = 0
+        self.rollbacks = 0
+        self._result = []
+
+    def cursor(self):
+        cur = MagicMock()
+        cur.execute.side_effect = self._execute
+        cur.fetchall.side_effect = lambda: self._result
+        cur.fetchone.side_effect = lambda: self._result[0] if self._result else None
+        return cur
+
+    def _execute(self, sql, params=None):
+        self.executed.append(sql)
+        if self.fail_on and self.fail_on in sql:
+            raise RuntimeError("boom")
+        if sql.startswith("SELECT GET_LOCK"):
+            self._result = [{'acquired': self.lock}]
+        elif sql.startswith("SELECT version"):
+            self._result = list(self.applied.values())
+        elif sql.startswith("INSERT INTO SchemaMigration"):
+            version, name, checksum, duration = params
+            self.applied[version] = {'version': version, 'name': name, 'checksum': checksum,
+                                     'durationMs': duration, 'appliedAt': None}
+        else:
+            self._result = []
+
+    def commit(self):
+        self.commits += 1
+
+    def rollback(self):
+        self.rollbacks += 1
+
+
+@pytest.fixture
+def migrations_dir(tmp_path):
+    (tmp_path / "0001_first.sql").write_text(
+        "-- first; comment\nCREATE INDEX a ON T (x);\nCREATE INDEX b ON T (y);\n")
+    (tmp_path / "0002_second.sql").write_text("ALTER TABLE T ADD COLUMN z INT;\n")
+    return tmp_path
+
+
+def ticking_clock(step=0.05):
+    state = {'now': 0.0}
+
+    def clock():
+        state['now'] += step
+        return state['now']
+    return clock
+
+
+def test_split_statements_ignores_comments_and_blanks():
+    assert split_statements("-- a;b\nSELECT 1;\n\n SELECT 2 ;\n") == ["SELECT 1", "SELECT 2"]
+
+
+def test_repo_migrations_load_in_order():
+    versions = [m.version for m in load_migrations(MIGRATIONS_DIR)]
+    assert versions == sorted(versions)
+    assert versions[0] == 1
+
+
+def test_load_rejects_bad_filename(tmp_path):
+    (tmp_path / "add_index.sql").write_text("SELECT 1;")
+    with pytest.raises(MigrationError):
+        load_migrations(str(tmp_path))
+
+
+def test_migrate_applies_pending_and_records_duration(migrations_dir):
+    db = FakeDB()
+    runner = MigrationRunner(db, directory=str(migrations_dir), clock=ticking_clock())
+
+    done = runner.migrate()
+
+    assert [m.version for m, _ in done] == [1, 2]
+    assert all(ms > 0 for _, ms in done)
+    assert "CREATE INDEX a ON T (x)" in db.executed
+    assert db.applied[1]['durationMs'] > 0
+    assert db.commits == 2
+    assert db.executed[-1].startswith("SELECT RELEASE_LOCK")
+
+
+def test_migrate_skips_applied_and_honours_target(migrations_dir):
+    db = FakeDB()
+    runner = MigrationRunner(db, directory=str(migrations_dir))
+    runner.migrate(target=1)
+    assert set(db.applied) == {1}
+
+    done = runner.migrate()
+    assert [m.version for m, _ in done] == [2]
+    assert runner.migrate() == []
+
+
+def test_dry_run_executes_nothing(migrations_dir):
+    db = FakeDB()
+    result = MigrationRunner(db, directory=str(migrations_dir)).migrate(dry_run=True)
+
+    assert [m.version for m, _ in result] == [1, 2]
+    assert db.applied == {}
+    assert not any(sql.startswith("CREATE INDEX") for sql in db.executed)
+
+
+def test_failed_migration_keeps_earlier_ones(migrations_dir):
+    db = FakeDB(fail_on="ALTER TABLE T")
+    runner = MigrationRunner(db, directory=str(migrations_dir))
+
+    with pytest.raises(MigrationError):
+        runner.migrate()
+
+    assert set(db.applied) == {1}
+    assert db.rollbacks == 1
+    assert db.executed[-1].startswith("SELECT RELEASE_LOCK")
+
+
+def test_edited_migration_is_rejected(migrations_dir):
+    db = FakeDB()
+    runner = MigrationRunner(db, directory=str(migrations_dir))
+    runner.migrate(target=1)
+    (migrations_dir / "0001_first.sql").write_text("CREATE INDEX c ON T (z);\n")
+
+    with pytest.raises(MigrationError):
+        runner.migrate()
+
+
+def test_lock_held_elsewhere_aborts(migrations_dir):
+    db = FakeDB(lock=0)
+    with pytest.raises(MigrationError):
+        MigrationRunner(db, directory=str(migrations_dir)).migrate()
+    assert db.applied == {}
+
+
+def test_stamp_records_without_running(migrations_dir):
+    db = FakeDB()
+    stamped = MigrationRunner(db, directory=str(migrations_dir)).stamp()
+
+    assert [m.version for m in stamped] == [1, 2]
+    assert set(db.applied) == {1, 2}
+    assert not any(sql.startswith("CREATE INDEX") for sql in db.executed)
@@ -1,6 +1,6 @@
 # tests/test_project_repository.py
 import pytest
-from unittest.mock import Mock, MagicMock
+from unittest.mock import Mock, MagicMock, PropertyMock
 from models.project import Project
 from models.project_detailed import ProjectDetailed, Budget, Timeframe
 from models.member import Member
@@ -24,22 +24,31 @@ def mock_mysql():
 def repo(mock_mysql):
     return ProjectRepository(mock_mysql)
 
-def test_save_budget_inserts(repo, mock_mysql):
-    # simulate no existing budget row
+def test_save_budget_upserts(repo, mock_mysql):
     mock_cursor = mock_mysql.connection.cursor()
-    mock_cursor.fetchone.return_value = None
 
     budget = Budget(project_id=1, floor=100, ceiling=200)
     repo.save_budget(1, budget)
 
-    # check that INSERT was called with correct args
-    mock_cursor.execute.assert_any_call(
-        "INSERT INTO Budget (projectId, floor, ceiling) VALUES (%s, %s, %s)",
-        (1, 100, 200)
-    )
+    # one upsert statement, no SELECT first
+    mock_cursor.execute.assert_called_once()
+    sql, params = mock_cursor.execute.call_args[0]
+    assert "INSERT INTO Budget (projectId, floor, ceiling) VALUES (%s, %s, %s)" in sql
+    assert "ON DUPLICATE KEY UPDATE floor=VALUES(floor), ceiling=VALUES(ceiling)" in sql
+    assert params == (1, 100, 200)
     # check that commit was called
     mock_mysql.connection.commit.assert_called_once()
 
+def test_save_timeframe_upserts_and_normalizes_blank_dates(repo, mock_mysql):
+    mock_cursor = mock_mysql.connection.cursor()
+
+    repo.save_timeframe(2, Timeframe(start="2030-01-01", end=""))
+
+    mock_cursor.execute.assert_called_once()
+    sql, params = mock_cursor.execute.call_args[0]
+    assert "ON DUPLICATE KEY UPDATE startTime=VALUES(startTime), endTime=VALUES(endTime)" in sql
+    assert params == (2, "2030-01-01", None)
+
 def test_get_budget_returns_budget(repo, mock_mysql):
     # simulate fetchone returning a real dict
     mock_cursor = mock_mysql.connection.cursor()
@@ -70,4 +79,278 @@ def test_row_to_project_populated(repo):
     assert project.name == "Test Project"
     assert project.status == "draft"
 
-# more needed
\ No newline at end of file
+def test_save_project_complete_commits_once(repo, mock_mysql):
+    mock_cursor = mock_mysql.connection.cursor()
+    mock_cursor.fetchone.return_value = None
+    mock_cursor.lastrowid = 10
+    mock_cursor.fetchall.side_effect = [
+        [],
+        [{"id": 1, "firstName": "Ann", "lastName": "Lee"}, {"id": 2, "firstName": "Bo", "lastName": "Kim"}],
+    ]
+
+    pd = ProjectDetailed(
+        project=Project(id=None, name="P", goal_description="G"),
+        budget=Budget(floor=1, ceiling=2),
+        timeframe=Timeframe(start="2030-01-01", end="2030-02-01"),
+        team_members=[Member("Ann", "Lee", "Python", "Flask"), Member("Bo", "Kim", "Go")],
+    )
+    project_id = repo.save_project_complete(pd, user_id=1, project_status="draft")
+
+    assert project_id == 10
+    mock_mysql.connection.commit.assert_called_once()
+    mock_mysql.connection.rollback.assert_not_called()
+
+def test_save_project_complete_rolls_back_partial_writes(repo, mock_mysql):
+    mock_cursor = mock_mysql.connection.cursor()
+    mock_cursor.fetchone.return_value = None
+    mock_cursor.execute.side_effect = [None, None, RuntimeError("deadlock")]
+
+    pd = ProjectDetailed(
+        project=Project(id=None, name="P", goal_description="G"),
+        budget=Budget(floor=1, ceiling=2),
+        timeframe=Timeframe(start="2030-01-01", end="2030-02-01"),
+    )
+    with pytest.raises(RuntimeError):
+        repo.save_project_complete(pd, user_id=1, project_status="draft")
+
+    mock_mysql.connection.commit.assert_not_called()
+    mock_mysql.connection.rollback.assert_called_once()
+
+def test_save_team_and_members_uses_batched_statements(repo, mock_mysql):
+    mock_cursor = mock_mysql.connection.cursor()
+    mock_cursor.fetchone.return_value = {"id": 3}  # existing team
+    mock_cursor.fetchall.side_effect = [
+        [{"id": 7, "firstName": "ann", "lastName": "lee"}],
+        [{"id": 8, "firstName": "Bo", "lastName": "Kim"}],
+    ]
+    members = [
+        Member("Ann", "Lee", "Python", "Flask"),
+        Member("Bo", "Kim", "Go", "None"),
+        Member("ANN", "LEE", "Rust"),  # duplicate name, last one wins
+    ]
+
+    repo.save_team_and_members(5, members)
+
+    mock_cursor.executemany.assert_any_call(
+        "INSERT INTO Member (firstName, lastName) VALUES (%s, %s)", [("Bo", "Kim")]
+    )
+    mock_cursor.executemany.assert_any_call(
+        "INSERT INTO TeamMember (TeamId, MemberId) VALUES (%s, %s)", [(3, 7), (3, 8)]
+    )
+    mock_cursor.executemany.assert_any_call(
+        "INSERT INTO Skillset (memberId, teamId, skill, category) VALUES (%s, %s, %s, %s)",
+        [(7, 3, "Rust", "Language"), (8, 3, "Go", "Language")]
+    )
+    # team lookup, clear, member lookup x2, skill delete
+    assert mock_cursor.execute.call_count == 5
+    # only this team's skills are replaced; Member rows are shared across projects
+    mock_cursor.execute.assert_any_call(
+        "DELETE FROM Skillset WHERE teamId=%s AND category IN ('Language', 'Framework')", (3,)
+    )
+    mock_mysql.connection.commit.assert_called_once()
+
+# more needed
+def test_get_project_details_parts_uses_header_and_member_queries(repo, mock_mysql):
+    mock_cursor = mock_mysql.connection.cursor()
+    header = {'project_id': 1, 'name': 'P', 'goalDescription': 'long goal'}
+    members = [{'member': 'Ada Lovelace', 'language': 'Python', 'framework': None}]
+    mock_cursor.fetchone.return_value = header
+    mock_cursor.fetchall.return_value = members
+
+    result = repo.get_project_details_parts(1, 7)
+
+    assert result == (header, members)
+    header_sql, header_params = mock_cursor.execute.call_args_list[0][0]
+    member_sql, member_params = mock_cursor.execute.call_args_list[1][0]
+    assert header_params == (1, 7)
+    assert "Skillset" not in header_sql
+    assert "GROUP BY M.id" in member_sql
+    assert "S.teamId = Tm.id" in member_sql
+    assert "goalDescription" not in member_sql
+    assert member_params == (1,)
+
+def test_get_project_details_parts_skips_members_when_not_owned(repo, mock_mysql):
+    mock_cursor = mock_mysql.connection.cursor()
+    mock_cursor.fetchone.return_value = None
+
+    assert repo.get_project_details_parts(1, 7) == (None, [])
+    mock_cursor.execute.assert_called_once()
+
+def test_get_project_summaries_selects_list_columns_only(repo, mock_mysql):
+    from datetime import datetime
+    mock_cursor = mock_mysql.connection.cursor()
+    updated = datetime(2030, 1, 2, 3, 4, 5)
+    mock_cursor.fetchall.return_value = [
+        {'id': 9, 'name': 'A', 'status': 'draft', 'userId': 4,
+         'dateTimeCreated': updated, 'dateTimeUpdated': updated},
+        {'id': 8, 'name': 'B', 'status': 'draft', 'userId': 4,
+         'dateTimeCreated': updated, 'dateTimeUpdated': updated},
+    ]
+
+    summaries, next_cursor = repo.get_project_summaries(4, 1, status='draft')
+
+    sql, params = mock_cursor.execute.call_args[0]
+    assert "Description" not in sql
+    assert "SELECT *" not in sql
+    assert "ORDER BY dateTimeUpdated DESC, id DESC" in sql
+    assert params == (4, 'draft', 2)
+    assert [s.id for s in summaries] == [9]
+    assert summaries[0].to_dict()['dateTimeUpdated'] == '2030-01-02T03:04:05'
+    assert next_cursor is not None
+
+    # the cursor resumes after the last row of the same sort
+    repo.get_project_summaries(4, 1, cursor=next_cursor)
+    sql, params = mock_cursor.execute.call_args[0]
+    assert "(dateTimeUpdated < %s OR (dateTimeUpdated = %s AND id < %s))" in sql
+    assert params[-2:] == (9, 2)
+
+def test_get_project_summaries_rejects_cursor_from_other_sort(repo, mock_mysql):
+    from utils.pagination_utils import encode_cursor
+    with pytest.raises(ValueError):
+        repo.get_project_summaries(4, 10, cursor=encode_cursor('updated', 'x', 1), sort='name')
+    with pytest.raises(ValueError):
+        repo.get_project_summaries(4, 10, sort='bogus')
+
+def test_get_project_summaries_name_sort_ascends(repo, mock_mysql):
+    mock_cursor = mock_mysql.connection.cursor()
+    mock_cursor.fetchall.return_value = []
+
+    assert repo.get_project_summaries(4, 10, sort='name') == ([], None)
+    sql, _ = mock_cursor.execute.call_args[0]
+    assert "ORDER BY name ASC, id ASC" in sql
+
+def test_get_project_dashboard_uses_two_queries_per_page(repo, mock_mysql):
+    from decimal import Decimal
+    mock_cursor = mock_mysql.connection.cursor()
+    summary_rows = [
+        {'id': i, 'name': f'P{i}', 'status': 'draft', 'userId': 4,
+         'dateTimeCreated': None, 'dateTimeUpdated': None}
+        for i in (3, 2, 1)
+    ]
+    extras = [
+        {'projectId': 3, 'budgetFloor': Decimal('10.50'), 'budgetCeiling': Decimal('20.00'),
+         'startDate': None, 'endDate': None, 'memberCount': 4, 'lastGeneratedAt': None},
+        {'projectId': 1, 'budgetFloor': None, 'budgetCeiling': None,
+         'startDate': None, 'endDate': None, 'memberCount': 0, 'lastGeneratedAt': None},
+    ]
+    mock_cursor.fetchall.side_effect = [summary_rows, extras]
+
+    entries, next_cursor = repo.get_project_dashboard(4, 10)
+
+    assert mock_cursor.execute.call_count == 2
+    sql, params = mock_cursor.execute.call_args[0]
+    assert "P.id IN (%s, %s, %s)" in sql
+    assert params == (4, 3, 2, 1)
+    assert [e.summary.id for e in entries] == [3, 2, 1]
+    first = entries[0].to_dict()
+    assert first['budgetFloor'] == 10.5
+    assert first['memberCount'] == 4
+    assert entries[1].member_count == 0
+    assert next_cursor is None
+
+def test_get_project_dashboard_empty_page_skips_detail_query(repo, mock_mysql):
+    mock_cursor = mock_mysql.connection.cursor()
+    mock_cursor.fetchall.return_value = []
+
+    assert repo.get_project_dashboard(4, 10) == ([], None)
+    mock_cursor.execute.assert_called_once()
+
+def test_save_prompt_version_allocates_from_counter(repo, mock_mysql):
+    # Distinct versions under concurrency come from MySQL, not this code: the
+    # UPDATE row-locks the project and bumps its counter in one statement, and
+    # the version is read back from that statement, never from a separate
+    # SELECT. Assert exactly that shape; the race itself needs a real database.
+    mock_cursor = mock_mysql.connection.cursor()
+    mock_cursor.rowcount = 1
+    type(mock_cursor).lastrowid = PropertyMock(side_effect=[5, 42])
+
+    prompt_id = repo.save_prompt_version(1, "prompt text")
+
+    assert mock_cursor.execute.call_count == 2
+    update_sql, update_params = mock_cursor.execute.call_args_list[0][0]
+    insert_sql, insert_params = mock_cursor.execute.call_args_list[1][0]
+    assert update_sql.strip().startswith("UPDATE Project")
+    assert "SET promptVersion = LAST_INSERT_ID(promptVersion + 1)" in update_sql
+    assert "WHERE id=%s" in update_sql
+    assert update_params == (1,)
+    assert insert_sql.startswith("INSERT INTO Prompt")
+    assert "MAX(" not in update_sql + insert_sql
+    # the INSERT takes the version the UPDATE handed back...
+    assert insert_params == (1, b"prompt text", 5)
+    # ...and the caller gets the new Prompt row id
+    assert prompt_id == 42
+    mock_mysql.connection.commit.assert_called_once()
+
+def test_save_prompt_version_unknown_project(repo, mock_mysql):
+    mock_cursor = mock_mysql.connection.cursor()
+    mock_cursor.rowcount = 0
+
+    with pytest.raises(ValueError):
+        repo.save_prompt_version(1, "prompt text")
+    mock_mysql.connection.rollback.assert_called_once()
+    assert mock_cursor.execute.call_count == 1
+
+def test_get_generation_history_page_skips_bodies(repo, mock_mysql):
+    from datetime import datetime
+    mock_cursor = mock_mysql.connection.cursor()
+    created = datetime(2030, 1, 1)
+    mock_cursor.fetchall.return_value = [
+        {'id': 11, 'projectId': 1, 'promptId': 5, 'version': 3, 'dateTimeCreated': created, 'responseSize': 900},
+        {'id': 10, 'projectId': 1, 'promptId': 4, 'version': 2, 'dateTimeCreated': created, 'responseSize': 800},
+    ]
+
+    entries, next_cursor = repo.get_generation_history_page(1, 1)
+
+    sql, params = mock_cursor.execute.call_args[0]
+    assert "llmResponse" not in sql
+    assert "ORDER BY GH.dateTimeCreated DESC, GH.id DESC" in sql
+    assert params == (1, 2)
+    assert [e.to_dict() for e in entries] == [{
+        'id': 11, 'projectId': 1, 'promptId': 5, 'version': 3,
+        'dateTimeCreated': '2030-01-01T00:00:00', 'responseSize': 900,
+    }]
+
+    repo.get_generation_history_page(1, 1, cursor=next_cursor)
+    sql, params = mock_cursor.execute.call_args[0]
+    assert "GH.id < %s" in sql
+    assert params[-2:] == (11, 2)
+
+def test_save_llm_history_stores_response_size(repo, mock_mysql):
+    mock_cursor = mock_mysql.connection.cursor()
+
+    repo.save_llm_history(1, 2, "héllo")
+
+    _, params = mock_cursor.execute.call_args[0]
+    assert params == (1, 2, "héllo".encode("utf-8"), 6)
+
+def test_latest_generation_response_is_decompressed(repo, mock_mysql):
+    from utils.body_codec import encode_body
+    mock_cursor = mock_mysql.connection.cursor()
+    plan = "# Plan\n" + "step\n" * 500
+    mock_cursor.fetchone.return_value = {'llmResponse': encode_body(plan)}
+
+    assert repo.get_latest_generation_response(1) == plan
+
+def test_compress_stored_bodies_rewrites_plain_rows_in_batches(repo, mock_mysql):
+    from utils.body_codec import encode_body, is_compressed
+    mock_cursor = mock_mysql.connection.cursor()
+    plan = "# Plan\n" + "step\n" * 500
+    already = encode_body(plan)
+    mock_cursor.fetchall.side_effect = [
+        [{'id': 1, 'body': plan.encode('utf-8')}, {'id': 2, 'body': already}],
+        [{'id': 3, 'body': b'tiny'}],
+        [],
+    ]
+
+    stats = repo.compress_stored_bodies('GenerationHistory', batch_size=2)
+
+    assert stats['rows'] == 3
+    assert stats['rewritten'] == 1
+    assert stats['bytes_after'] < stats['bytes_before']
+    sql, updates = mock_cursor.executemany.call_args[0]
+    assert sql.startswith("UPDATE GenerationHistory SET llmResponse=%s")
+    assert [row_id for _, row_id in updates] == [1]
+    assert is_compressed(updates[0][0])
+    # keyset walk over the primary key
+    assert mock_cursor.execute.call_args_list[1][0][1] == (2, 2)
+    assert mock_mysql.connection.commit.call_count == 3
@@ -0,0 +1,90 @@
+# tests/test_project_repo_mysql.py
+# Runs against a real MySQL with sql/tables.sql applied. Skipped unless
+# TEST_DB_HOST (plus TEST_DB_USER / TEST_DB_PASSWORD / TEST_DB_NAME) is set;
+# rows it creates are removed afterwards.
+import os
+import threading
+import types
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+import pytest
+
+try:
+    # imported at collection time, before conftest stubs the driver per test
+    import MySQLdb as _MySQLdb
+    import MySQLdb.cursors as _cursors
+except ImportError:
+    _MySQLdb = None
+
+from repositories.project_repository import ProjectRepository
+
+pytestmark = pytest.mark.skipif(
+    _MySQLdb is None or not os.getenv("TEST_DB_HOST"),
+    reason="needs mysqlclient and a test database (TEST_DB_HOST)",
+)
+
+PARALLEL_SUBMITS = 16
+
+
+def _connect():
+    return _MySQLdb.connect(
+        host=os.getenv("TEST_DB_HOST"),
+        port=int(os.getenv("TEST_DB_PORT", 3306)),
+        user=os.getenv("TEST_DB_USER", "root"),
+        passwd=os.getenv("TEST_DB_PASSWORD", ""),
+        db=os.getenv("TEST_DB_NAME", "jengadb"),
+        cursorclass=_cursors.DictCursor,
+        charset="utf8mb4",
+    )
+
+
+@pytest.fixture
+def project_id():
+    conn = _connect()
+    try:
+        with conn.cursor() as cur:
+            cur.execute(
+                "INSERT INTO User (firstName, lastName, email, password) VALUES (%s, %s, %s, %s)",
+                ("Race", "Test", f"race-{uuid.uuid4().hex}@example.com", "x")
+            )
+            user_id = cur.lastrowid
+            cur.execute("INSERT INTO Project (name, userId) VALUES (%s, %s)", ("race", user_id))
+            project_id = cur.lastrowid
+        conn.commit()
+
+        yield project_id
+
+        with conn.cursor() as cur:
+            # cascades to Project and Prompt
+            cur.execute("DELETE FROM User WHERE id=%s", (user_id,))
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def test_parallel_submits_get_distinct_versions(project_id):
+    start = threading.Barrier(PARALLEL_SUBMITS)
+
+    def submit(i):
+        # one connection per thread, as with one pooled connection per request
+        conn = _connect()
+        try:
+            repo = ProjectRepository(types.SimpleNamespace(connection=conn))
+            start.wait()
+            return repo.save_prompt_version(project_id, f"prompt {i}")
+        finally:
+            conn.close()
+
+    with ThreadPoolExecutor(max_workers=PARALLEL_SUBMITS) as pool:
+        prompt_ids = list(pool.map(submit, range(PARALLEL_SUBMITS)))
+
+    conn = _connect()
+    try:
+        with conn.cursor() as cur:
+            cur.execute("SELECT version FROM Prompt WHERE projectId=%s", (project_id,))
+            versions = sorted(row["version"] for row in cur.fetchall())
+    finally:
+        conn.close()
+
+    assert len(set(prompt_ids)) == PARALLEL_SUBMITS
+    assert versions == list(range(1, PARALLEL_SUBMITS + 1))
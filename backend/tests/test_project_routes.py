@@ -96,13 +96,39 @@ def test_submit_project_success(app_with_repo, monkeypatch):
     monkeypatch.setattr(project_routes, "authenticate_token",
                         lambda repo: (fake_user, None, None))
 
-    app_with_repo.project_service.submit_project.return_value = (5, 99, "LLM response text")
+    app_with_repo.project_service.submit_project.return_value = (5, 12)
 
     resp = client.post("/api/projects/submit", json={"name": "Test Project"})
-    assert resp.status_code == 200
+    assert resp.status_code == 202
     assert resp.json["project_id"] == 5
-    assert resp.json["prompt_id"] == 99
-    assert resp.json["llm_response"] == "LLM response text"
+    assert resp.json["job_id"] == 12
+    assert resp.json["status"] == "queued"
+
+
+def test_generation_job_status(app_with_repo, monkeypatch):
+    client = app_with_repo.test_client()
+    monkeypatch.setattr(project_routes, "authenticate_token",
+                        lambda repo: (Mock(id=10), None, None))
+
+    app_with_repo.project_service.get_generation_job.return_value = {
+        "id": 12, "status": "done", "llm_response": "plan"
+    }
+
+    resp = client.get("/api/projects/jobs/12")
+    assert resp.status_code == 200
+    assert resp.json["job"]["llm_response"] == "plan"
+    app_with_repo.project_service.get_generation_job.assert_called_once_with(12, 10)
+
+
+def test_generation_job_status_not_found(app_with_repo, monkeypatch):
+    client = app_with_repo.test_client()
+    monkeypatch.setattr(project_routes, "authenticate_token",
+                        lambda repo: (Mock(id=10), None, None))
+
+    app_with_repo.project_service.get_generation_job.side_effect = FileNotFoundError("Generation job not found")
+
+    resp = client.get("/api/projects/jobs/12")
+    assert resp.status_code == 404
 
 
 def test_submit_project_bad_request(app_with_repo, monkeypatch):
@@ -141,14 +167,97 @@ def test_list_projects_by_user_success(app_with_repo, monkeypatch):
     monkeypatch.setattr(project_routes, "authenticate_token",
                         lambda repo: (fake_user, None, None))
 
-    app_with_repo.project_service.get_projects_by_user.return_value = [
-        Mock(to_dict=lambda: {"id": 1})
-    ]
+    app_with_repo.project_service.get_project_summaries.return_value = (
+        [Mock(to_dict=lambda: {"id": 1})], "next"
+    )
 
-    resp = client.get("/api/projects/user/7")
+    resp = client.get("/api/projects/user/7?limit=10&status=draft&sort=name")
     assert resp.status_code == 200
     assert "projects" in resp.json
     assert resp.json["projects"][0]["id"] == 1
+    assert resp.json["next_cursor"] == "next"
+    app_with_repo.project_service.get_project_summaries.assert_called_once_with(
+        7, 10, cursor=None, status="draft", sort="name"
+    )
+
+
+def test_list_projects_bad_params(app_with_repo, monkeypatch):
+    client = app_with_repo.test_client()
+
+    monkeypatch.setattr(project_routes, "authenticate_token",
+                        lambda repo: (Mock(id=7), None, None))
+    app_with_repo.project_service.get_project_summaries.side_effect = ValueError("Invalid cursor")
+
+    assert client.get("/api/projects/user/7?limit=abc").status_code == 400
+    resp = client.get("/api/projects/user/7?cursor=zzz")
+    assert resp.status_code == 400
+    assert resp.json["error"] == "Invalid cursor"
+
+def test_project_dashboard_success(app_with_repo, monkeypatch):
+    client = app_with_repo.test_client()
+
+    monkeypatch.setattr(project_routes, "authenticate_token",
+                        lambda repo: (Mock(id=7), None, None))
+    app_with_repo.project_service.get_project_dashboard.return_value = (
+        [Mock(to_dict=lambda: {"id": 1, "memberCount": 3})], None
+    )
+
+    resp = client.get("/api/projects/user/7/dashboard")
+    assert resp.status_code == 200
+    assert resp.json["projects"][0]["memberCount"] == 3
+    assert resp.json["next_cursor"] is None
+
+
+def test_project_dashboard_forbidden(app_with_repo, monkeypatch):
+    client = app_with_repo.test_client()
+
+    monkeypatch.setattr(project_routes, "authenticate_token",
+                        lambda repo: (Mock(id=7), None, None))
+
+    resp = client.get("/api/projects/user/8/dashboard")
+    assert resp.status_code == 403
+    app_with_repo.project_service.get_project_dashboard.assert_not_called()
+
+def test_generation_history_list(app_with_repo, monkeypatch):
+    client = app_with_repo.test_client()
+
+    monkeypatch.setattr(project_routes, "authenticate_token",
+                        lambda repo: (Mock(id=7), None, None))
+    app_with_repo.project_service.get_generation_history.return_value = (
+        [Mock(to_dict=lambda: {"id": 11, "version": 3})], "c"
+    )
+
+    resp = client.get("/api/projects/5/history?limit=20")
+    assert resp.status_code == 200
+    assert resp.json["history"][0]["version"] == 3
+    assert resp.json["next_cursor"] == "c"
+    app_with_repo.project_service.get_generation_history.assert_called_once_with(5, 7, 20, cursor=None)
+
+
+def test_generation_history_not_owned(app_with_repo, monkeypatch):
+    client = app_with_repo.test_client()
+
+    monkeypatch.setattr(project_routes, "authenticate_token",
+                        lambda repo: (Mock(id=7), None, None))
+    app_with_repo.project_service.get_generation_history.side_effect = FileNotFoundError("Project not found")
+    app_with_repo.project_service.get_generation_history_entry.side_effect = FileNotFoundError("Generation not found")
+
+    assert client.get("/api/projects/5/history").status_code == 404
+    assert client.get("/api/projects/5/history/11").status_code == 404
+
+
+def test_generation_history_entry_includes_body(app_with_repo, monkeypatch):
+    client = app_with_repo.test_client()
+
+    monkeypatch.setattr(project_routes, "authenticate_token",
+                        lambda repo: (Mock(id=7), None, None))
+    app_with_repo.project_service.get_generation_history_entry.return_value = Mock(
+        to_dict=lambda: {"id": 11, "llmResponse": "# Plan"}
+    )
+
+    resp = client.get("/api/projects/5/history/11")
+    assert resp.status_code == 200
+    assert resp.json["history"]["llmResponse"] == "# Plan"
 
 # # ------------------------------
 # # Delete Project
@@ -213,3 +322,90 @@ def test_get_project_details_success(app_with_repo, monkeypatch):
     resp = client.get("/api/projects/99")
     assert resp.status_code == 200
     assert resp.json["project"]["id"] == 99
+
+
+def test_submit_project_stream_sends_sse_events(app_with_repo, monkeypatch):
+    client = app_with_repo.test_client()
+    monkeypatch.setattr(project_routes, "authenticate_token",
+                        lambda repo: (Mock(id=10), None, None))
+
+    def events():
+        yield from [("chunk", "# Plan"), ("chunk", "\n- step"), ("done", 99)]
+    app_with_repo.project_service.submit_project_stream.return_value = (5, events())
+
+    resp = client.post("/api/projects/submit/stream", json={"name": "Demo"})
+    assert resp.status_code == 200
+    assert resp.mimetype == "text/event-stream"
+    body = resp.get_data(as_text=True)
+    assert body.startswith('event: project\ndata: {"project_id": 5}\n\n')
+    assert 'event: chunk\ndata: {"text": "# Plan"}\n\n' in body
+    assert body.endswith('event: done\ndata: {"project_id": 5, "prompt_id": 99}\n\n')
+
+
+def test_submit_project_stream_runs_outside_the_request(app_with_repo, monkeypatch):
+    from flask import g, has_app_context, has_request_context
+    client = app_with_repo.test_client()
+    monkeypatch.setattr(project_routes, "authenticate_token",
+                        lambda repo: (Mock(id=10), None, None))
+
+    seen = {}
+    def events():
+        # the request and the connection it borrowed are gone before Gemini runs
+        seen["request"] = has_request_context()
+        seen["app"] = has_app_context()
+        seen["pooled_db"] = "pooled_db" in g
+        yield "chunk", "# Plan"
+        yield "done", 99
+    app_with_repo.project_service.submit_project_stream.return_value = (5, events())
+
+    resp = client.post("/api/projects/submit/stream", json={"name": "Demo"})
+    assert resp.get_data(as_text=True).endswith('"prompt_id": 99}\n\n')
+    assert seen == {"request": False, "app": True, "pooled_db": False}
+
+
+def test_submit_project_stream_closes_events_when_client_leaves(app_with_repo, monkeypatch):
+    client = app_with_repo.test_client()
+    monkeypatch.setattr(project_routes, "authenticate_token",
+                        lambda repo: (Mock(id=10), None, None))
+
+    closed = []
+    def events():
+        try:
+            yield "chunk", "# Pl"
+            yield "chunk", "an"
+        finally:
+            closed.append(True)
+    app_with_repo.project_service.submit_project_stream.return_value = (5, events())
+
+    resp = client.post("/api/projects/submit/stream", json={"name": "Demo"}, buffered=False)
+    body = iter(resp.response)
+    next(body)  # project
+    next(body)  # first chunk
+    resp.close()
+    assert closed == [True]
+
+
+def test_submit_project_stream_reports_generation_error(app_with_repo, monkeypatch):
+    client = app_with_repo.test_client()
+    monkeypatch.setattr(project_routes, "authenticate_token",
+                        lambda repo: (Mock(id=10), None, None))
+
+    def events():
+        yield "chunk", "# Pl"
+        raise RuntimeError("Gemini down")
+    app_with_repo.project_service.submit_project_stream.return_value = (5, events())
+
+    resp = client.post("/api/projects/submit/stream", json={"name": "Demo"})
+    assert 'event: error\ndata: {"error": "Gemini down"}' in resp.get_data(as_text=True)
+
+
+def test_submit_project_stream_bad_request(app_with_repo, monkeypatch):
+    client = app_with_repo.test_client()
+    monkeypatch.setattr(project_routes, "authenticate_token",
+                        lambda repo: (Mock(id=10), None, None))
+
+    app_with_repo.project_service.submit_project_stream.side_effect = ValueError("bad project")
+
+    resp = client.post("/api/projects/submit/stream", json={})
+    assert resp.status_code == 400
+    assert resp.json["error"] == "bad project"
@@ -12,8 +12,12 @@ def mock_repo():
     return MagicMock()
 
 @pytest.fixture
-def service(mock_repo):
-    return ProjectService(mock_repo)
+def mock_jobs():
+    return MagicMock()
+
+@pytest.fixture
+def service(mock_repo, mock_jobs):
+    return ProjectService(mock_repo, mock_jobs)
 
 def test_validate_project_success(service):
     pd = ProjectDetailed(
@@ -99,7 +103,7 @@ def test_save_draft_calls_repo(service, mock_repo):
     mock_repo.save_project_complete.assert_called_once()
     assert project_id == 1
 
-def test_submit_project_calls_repo_and_generates_plan(service, mock_repo):
+def test_submit_project_saves_generating_and_enqueues_job(service, mock_repo, mock_jobs):
     future_start = (datetime.now() + timedelta(days=1)).isoformat()
     future_end = (datetime.now() + timedelta(days=2)).isoformat()
     data = {
@@ -111,27 +115,107 @@ def test_submit_project_calls_repo_and_generates_plan(service, mock_repo):
         "budget_ceiling": 100,
     }
 
+    mock_repo.save_project_complete.return_value = 1
+    mock_jobs.enqueue.return_value = 7
+
+    with patch("services.project_service.contains_invalid_phrase", return_value=False):
+        project_id, job_id = service.submit_project(data, user_id=42)
+
+    assert mock_repo.save_project_complete.call_args.kwargs["project_status"] == "generating"
+    mock_jobs.enqueue.assert_called_once_with(1, data)
+    mock_repo.save_prompt_version.assert_not_called()
+    assert project_id == 1
+    assert job_id == 7
+
+def _valid_submit_data():
+    return {
+        "name": "Proj",
+        "goal_description": "Goal",
+        "start_date": (datetime.now() + timedelta(days=1)).isoformat(),
+        "end_date": (datetime.now() + timedelta(days=2)).isoformat(),
+        "budget_floor": 50,
+        "budget_ceiling": 100,
+    }
+
+def test_submit_project_stream_saves_assembled_response(service, mock_repo):
     mock_repo.save_project_complete.return_value = 1
     mock_repo.save_prompt_version.return_value = 99
 
     with patch("services.project_service.contains_invalid_phrase", return_value=False), \
-         patch("services.project_service.generate_project_plan", return_value=("prompt_text", "llm_response")):
-
-        project_id, prompt_id, llm_text = service.submit_project(data, user_id=42)
+         patch("services.project_service.stream_project_plan", return_value=("prompt_text", iter(["# Plan", " body"]))):
+        project_id, events = service.submit_project_stream(_valid_submit_data(), user_id=42)
+        assert list(events) == [("chunk", "# Plan"), ("chunk", " body"), ("done", 99)]
 
-    mock_repo.save_project_complete.assert_called_once()
-    mock_repo.save_prompt_version.assert_called_once()
-    mock_repo.save_llm_history.assert_called_once()
     assert project_id == 1
-    assert prompt_id == 99
-    assert llm_text == "llm_response"
+    assert mock_repo.save_project_complete.call_args.kwargs["project_status"] == "generating"
+    mock_repo.save_prompt_version.assert_called_once_with(1, "prompt_text")
+    mock_repo.save_llm_history.assert_called_once_with(1, 99, "# Plan body")
+    mock_repo.update_project_status.assert_called_once_with(1, "submitted")
+
+def test_submit_project_stream_marks_project_failed_on_error(service, mock_repo):
+    mock_repo.save_project_complete.return_value = 1
+
+    def chunks():
+        yield "# Pl"
+        raise RuntimeError("Gemini down")
+
+    with patch("services.project_service.contains_invalid_phrase", return_value=False), \
+         patch("services.project_service.stream_project_plan", return_value=("prompt_text", chunks())):
+        _, events = service.submit_project_stream(_valid_submit_data(), user_id=42)
+        with pytest.raises(RuntimeError):
+            list(events)
+
+    mock_repo.save_llm_history.assert_not_called()
+    mock_repo.update_project_status.assert_called_once_with(1, "failed")
+
+def test_delete_project_soft_deletes_without_prior_read(service, mock_repo):
+    mock_repo.delete_project.return_value = True
+
+    service.delete_project(1, user_id=42)
+
+    mock_repo.delete_project.assert_called_once_with(1, 42)
+    mock_repo.get_project_by_id.assert_not_called()
 
 def test_delete_project_not_found_raises(service, mock_repo):
+    mock_repo.delete_project.return_value = False
     mock_repo.get_project_by_id.return_value = None
     with pytest.raises(FileNotFoundError):
         service.delete_project(1, user_id=42)
 
 def test_delete_project_wrong_user_raises(service, mock_repo):
+    mock_repo.delete_project.return_value = False
     mock_repo.get_project_by_id.return_value = Project(id=1, name="P", user_id=1, requirement_description=None, goal_description=None)
     with pytest.raises(PermissionError):
         service.delete_project(1, user_id=42)
+
+def test_get_project_details_builds_members_from_aggregated_rows(service, mock_repo):
+    mock_repo.get_project_details_parts.return_value = (
+        {'project_id': 3, 'name': 'P', 'goalDescription': 'G', 'requirementDescription': 'R',
+         'status': 'draft', 'budget_floor': 1, 'budget_ceiling': 2,
+         'project_start_date': None, 'project_end_date': None},
+        [{'member': 'Ada Lovelace', 'language': 'Python', 'framework': 'Flask'},
+         {'member': 'Alan Turing', 'language': None, 'framework': None}]
+    )
+
+    detailed = service.get_project_details(3, 9)
+
+    assert detailed.project.goal_description == 'G'
+    assert [m.first_name for m in detailed.team_members] == ['Ada', 'Alan']
+    assert detailed.team_members[0].language == 'Python'
+    assert detailed.team_members[0].framework == 'Flask'
+    mock_repo.get_latest_generation_response.assert_not_called()
+
+def test_get_project_details_not_found(service, mock_repo):
+    mock_repo.get_project_details_parts.return_value = (None, [])
+    assert service.get_project_details(3, 9) is None
+
+def test_get_generation_history_checks_ownership(service, mock_repo):
+    mock_repo.project_belongs_to.return_value = False
+    with pytest.raises(FileNotFoundError):
+        service.get_generation_history(3, 9, 20)
+    mock_repo.get_generation_history_page.assert_not_called()
+
+    mock_repo.project_belongs_to.return_value = True
+    mock_repo.get_generation_history_page.return_value = ([], None)
+    assert service.get_generation_history(3, 9, 20, cursor="c") == ([], None)
+    mock_repo.get_generation_history_page.assert_called_once_with(3, 20, cursor="c")
@@ -0,0 +1,143 @@
+# tests/test_purge_service.py
+import pytest
+from unittest.mock import MagicMock
+from repositories.purge_repository import PurgeRepository
+from services.purge_service import PurgeService
+
+
+class FakePurgeRepo:
+    """Project 1 has 25 history rows and 3 prompts; user 9 is waiting behind it."""
+
+    def __init__(self, locked=False):
+        self.locked = locked
+        self.rows = {1: {"GenerationHistory": 25, "Prompt": 3}}
+        self.users = [9]
+        self.released = False
+        self.batch_sizes = []
+
+    def try_lock(self):
+        return not self.locked
+
+    def release_lock(self):
+        self.released = True
+
+    def next_deleted_project(self):
+        return next(iter(self.rows), None)
+
+    def next_deleted_user(self):
+        return self.users[0] if self.users else None
+
+    def purge_project_batch(self, project_id, batch_size):
+        self.batch_sizes.append(batch_size)
+        for table, left in self.rows[project_id].items():
+            if left:
+                n = min(left, batch_size)
+                self.rows[project_id][table] -= n
+                return table, n
+        del self.rows[project_id]
+        return "Project", 1
+
+    def purge_user(self, user_id):
+        self.users.remove(user_id)
+        return 1
+
+
+class StepClock:
+    """Every read advances step_ms, so each timed batch takes step_ms."""
+
+    def __init__(self, step_ms):
+        self.now = 0.0
+        self.step = step_ms / 1000
+
+    def __call__(self):
+        self.now += self.step
+        return self.now
+
+
+def test_run_once_purges_children_then_project_then_user():
+    repo = FakePurgeRepo()
+    service = PurgeService(repo, batch_size=10, max_lock_ms=1000, clock=StepClock(1))
+
+    assert service.run_once() is True
+
+    stats = service.stats()
+    assert repo.rows == {} and repo.users == []
+    assert stats["projects_purged"] == 1
+    assert stats["users_purged"] == 1
+    assert stats["rows_deleted"] == 29
+    assert stats["current"] is None
+    assert repo.released
+
+
+def test_slow_batches_shrink_the_batch_size():
+    repo = FakePurgeRepo()
+    service = PurgeService(repo, batch_size=16, max_lock_ms=50, min_batch=2, clock=StepClock(100))
+
+    service.run_once(max_batches=3)
+
+    assert repo.batch_sizes == [16, 8, 4]
+    assert service.stats()["slow_batches"] == 3
+
+
+def test_fast_full_batches_grow_the_batch_size():
+    repo = FakePurgeRepo()
+    service = PurgeService(repo, batch_size=4, max_lock_ms=1000, max_batch=16, clock=StepClock(1))
+
+    service.run_once(max_batches=3)
+
+    assert repo.batch_sizes == [4, 8, 16]
+
+
+def test_progress_reports_current_project():
+    repo = FakePurgeRepo()
+    service = PurgeService(repo, batch_size=10, clock=StepClock(1))
+    seen = []
+
+    service.run_once(max_batches=2, on_progress=lambda s: seen.append(s["current"]))
+
+    assert seen[0] == {"project_id": 1, "table": "GenerationHistory", "rows_deleted": 10}
+    # the fast first batch doubled the size, so the second one drains the table
+    assert seen[1] == {"project_id": 1, "table": "GenerationHistory", "rows_deleted": 25}
+
+
+def test_run_once_skips_when_another_process_holds_the_lock():
+    repo = FakePurgeRepo(locked=True)
+    service = PurgeService(repo)
+
+    assert service.run_once() is False
+    assert repo.rows and not repo.released
+
+
+@pytest.fixture
+def mock_mysql():
+    mock_cursor = MagicMock()
+    mock_cursor.__enter__.return_value = mock_cursor
+    mock_cursor.__exit__.return_value = None
+    mock_mysql = MagicMock()
+    mock_mysql.connection.cursor.return_value = mock_cursor
+    return mock_mysql
+
+
+def test_purge_project_batch_deletes_first_non_empty_child(mock_mysql):
+    mock_cursor = mock_mysql.connection.cursor()
+    rowcounts = iter([0, 0, 7])  # GenerationJob, GenerationHistory empty
+    mock_cursor.execute.side_effect = lambda *a: setattr(mock_cursor, "rowcount", next(rowcounts))
+
+    result = PurgeRepository(mock_mysql).purge_project_batch(5, 100)
+
+    assert result == ("Prompt", 7)
+    sql, params = mock_cursor.execute.call_args[0]
+    assert sql == "DELETE FROM Prompt WHERE projectId=%s LIMIT %s"
+    assert params == (5, 100)
+    mock_mysql.connection.commit.assert_called_once()
+
+
+def test_purge_project_batch_removes_project_when_children_are_gone(mock_mysql):
+    mock_cursor = mock_mysql.connection.cursor()
+    mock_cursor.rowcount = 0
+
+    table, _ = PurgeRepository(mock_mysql).purge_project_batch(5, 100)
+
+    assert table == "Project"
+    sql, _ = mock_cursor.execute.call_args[0]
+    assert sql.startswith("DELETE FROM Project WHERE id=%s AND deletedAt IS NOT NULL")
@@ -0,0 +1,124 @@
+# tests/test_session_store.py
+import pytest
+from utils.session_store import MemorySessionStore, SQLiteSessionStore, create_session_store
+
+
+class FakeClock:
+    def __init__(self, now=1000.0):
+        self.now = now
+
+    def __call__(self):
+        return self.now
+
+
+def test_memory_store_put_get_and_counters():
+    store = MemorySessionStore(ttl=60, max_size=10)
+    store.put("tok", 5)
+
+    assert store.get("tok") == 5
+    assert store.get("missing") is None
+    stats = store.stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["size"] == 1
+
+
+def test_memory_store_enforces_size_cap():
+    store = MemorySessionStore(ttl=60, max_size=2)
+    for i in range(5):
+        store.put(f"tok{i}", i)
+
+    assert store.size() == 2
+    assert store.get("tok0") is None
+    assert store.stats()["evictions"] == 3
+
+
+def test_memory_store_sweeps_expired_sessions():
+    clock = FakeClock()
+    store = MemorySessionStore(ttl=10, max_size=10, sweep_interval=5, clock=clock)
+    store.put("old", 1)
+    clock.now += 11
+    store.put("new", 2)
+
+    assert store.size() == 1
+    assert store.get("new") == 2
+
+
+def test_sqlite_store_is_shared_between_instances(tmp_path):
+    path = str(tmp_path / "sessions.db")
+    writer = SQLiteSessionStore(path, ttl=60, max_size=10)
+    reader = SQLiteSessionStore(path, ttl=60, max_size=10)
+
+    writer.put("tok", 7)
+
+    assert reader.get("tok") == 7
+    assert reader.hits == 1
+
+
+def test_sqlite_store_expires_and_caps(tmp_path):
+    clock = FakeClock()
+    store = SQLiteSessionStore(str(tmp_path / "s.db"), ttl=10, max_size=2, sweep_interval=0, clock=clock)
+    store.put("a", 1)
+    store.put("b", 2)
+    store.put("c", 3)
+    assert store.size() == 2
+    assert store.get("a") is None
+
+    clock.now += 11
+    assert store.get("b") is None
+    store.put("d", 4)
+    assert store.size() == 1
+    assert store.evictions == 3
+
+
+def test_create_session_store_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        create_session_store("redis")
+
+
+def test_create_session_store_refuses_memory_with_several_workers():
+    with pytest.raises(ValueError):
+        create_session_store("memory", workers=2)
+    assert isinstance(create_session_store("memory", workers=1), MemorySessionStore)
+
+
+def test_create_session_store_defaults_to_sqlite(tmp_path):
+    store = create_session_store(path=str(tmp_path / "s.db"))
+    assert isinstance(store, SQLiteSessionStore)
+
+
+def test_session_store_is_abstract():
+    from utils.session_store import SessionStore
+    with pytest.raises(TypeError):
+        SessionStore()
+
+
+@pytest.mark.parametrize("make_store", [
+    lambda tmp_path, clock: MemorySessionStore(ttl=60, max_size=10, clock=clock),
+    lambda tmp_path, clock: SQLiteSessionStore(str(tmp_path / "s.db"), ttl=60, max_size=10, clock=clock),
+])
+def test_flags_expire_and_stay_out_of_session_stats(tmp_path, make_store):
+    clock = FakeClock()
+    store = make_store(tmp_path, clock)
+    store.put_flag("db-write:7", 5)
+
+    assert store.has_flag("db-write:7") is True
+    assert store.has_flag("db-write:8") is False
+    assert store.size() == 0
+    assert store.stats()["hits"] == 0 and store.stats()["misses"] == 0
+
+    clock.now += 6
+    assert store.has_flag("db-write:7") is False
+
+
+def test_sqlite_store_checks_cap_only_when_sweeping(tmp_path):
+    clock = FakeClock()
+    store = SQLiteSessionStore(str(tmp_path / "s.db"), ttl=600, max_size=2, sweep_interval=60, clock=clock)
+    store.put("a", 1)  # first put sweeps
+    store.put("b", 2)
+    store.put("c", 3)
+    assert store.size() == 3  # over the cap until the next sweep
+
+    clock.now += 60
+    store.put("d", 4)
+    assert store.size() == 2
@@ -0,0 +1,103 @@
+# tests/test_single_flight.py
+import threading
+import time
+from unittest.mock import MagicMock
+from utils.single_flight import SingleFlight
+
+
+def wait_until(predicate, timeout=2):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.001)
+
+
+def test_concurrent_callers_share_one_call():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+    calls = []
+
+    def slow():
+        calls.append(1)
+        started.set()
+        release.wait(2)
+        return "plan"
+
+    results = []
+    leader = threading.Thread(target=lambda: results.append(flight.do("p1", slow)))
+    leader.start()
+    started.wait(2)
+    followers = [threading.Thread(target=lambda: results.append(flight.do("p1", slow))) for _ in range(3)]
+    for t in followers:
+        t.start()
+    wait_until(lambda: flight.coalesced == 3)
+    release.set()
+    for t in [leader, *followers]:
+        t.join(2)
+
+    assert results == ["plan"] * 4
+    assert len(calls) == 1
+    assert flight.stats()["coalesced"] == 3
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_followers_get_the_leaders_exception():
+    flight = SingleFlight()
+    started = threading.Event()
+    release = threading.Event()
+
+    def failing():
+        started.set()
+        release.wait(2)
+        raise RuntimeError("Gemini down")
+
+    errors = []
+
+    def call():
+        try:
+            flight.do("p1", failing)
+        except RuntimeError as e:
+            errors.append(str(e))
+
+    leader = threading.Thread(target=call)
+    leader.start()
+    started.wait(2)
+    follower = threading.Thread(target=call)
+    follower.start()
+    wait_until(lambda: flight.coalesced == 1)
+    release.set()
+    leader.join(2)
+    follower.join(2)
+
+    assert errors == ["Gemini down", "Gemini down"]
+
+
+def test_different_keys_do_not_coalesce():
+    flight = SingleFlight()
+    assert flight.do("a", lambda: 1) == 1
+    assert flight.do("b", lambda: 2) == 2
+    assert flight.stats()["leaders"] == 2
+
+
+def test_waits_for_other_process_then_runs_after_wait():
+    store = MagicMock()
+    store.acquire.side_effect = [False, False, True]
+    flight = SingleFlight(lock_store=store, sleep=lambda s: None)
+
+    fn = MagicMock(return_value="fresh call")
+    result = flight.do("p1", fn, after_wait=lambda: "from cache")
+
+    assert result == "from cache"
+    fn.assert_not_called()
+    assert flight.stats()["remote_waits"] == 1
+    store.release.assert_called_once()
+
+
+def test_lock_store_errors_fall_back_to_running():
+    store = MagicMock()
+    store.acquire.side_effect = RuntimeError("db down")
+    flight = SingleFlight(lock_store=store)
+
+    assert flight.do("p1", lambda: "plan") == "plan"
+    assert flight.stats()["lock_errors"] == 1
@@ -61,6 +61,11 @@ def test_delete_user_success(repo, mock_mysql):
     result = repo.delete_user(1)
 
     assert result is True
+    user_sql, _ = mock_cursor.execute.call_args_list[0][0]
+    project_sql, project_params = mock_cursor.execute.call_args_list[1][0]
+    assert user_sql.startswith("UPDATE User SET deletedAt=NOW()")
+    assert project_sql.startswith("UPDATE Project SET deletedAt=NOW()")
+    assert project_params == (1,)
     mock_mysql.connection.commit.assert_called_once()
 
 def test_delete_user_failure(repo, mock_mysql):
@@ -83,3 +88,101 @@ def test_get_all_users_returns_list(repo, mock_mysql):
     assert len(users) == 2
     assert users[0].email == "a@test.com"
     assert users[1].role == "user"
+
+def test_update_password_invalidates_token_state(repo, mock_mysql):
+    from utils import auth_utils
+    auth_utils.token_state_cache.set(3, {"status": "active", "tokenVersion": 0})
+
+    repo.update_password(3, "new_hash")
+
+    assert auth_utils.token_state_cache.get(3) is None
+
+def test_revoke_tokens_bumps_version(repo, mock_mysql):
+    mock_cursor = mock_mysql.connection.cursor()
+    repo.revoke_tokens(4)
+
+    mock_cursor.execute.assert_called_once_with(
+        "UPDATE User SET tokenVersion = tokenVersion + 1 WHERE id=%s", (4,)
+    )
+    mock_mysql.connection.commit.assert_called_once()
+
+def test_get_users_page_returns_next_cursor(repo, mock_mysql):
+    from utils.pagination_utils import decode_cursor
+    mock_cursor = mock_mysql.connection.cursor()
+    mock_cursor.fetchall.return_value = [
+        {"id": 9, "firstName": "A", "lastName": "A", "email": "a@t.com", "role": "regular", "status": "active", "dateTimeCreated": "2025-01-03 00:00:00"},
+        {"id": 8, "firstName": "B", "lastName": "B", "email": "b@t.com", "role": "regular", "status": "active", "dateTimeCreated": "2025-01-02 00:00:00"},
+        {"id": 7, "firstName": "C", "lastName": "C", "email": "c@t.com", "role": "regular", "status": "active", "dateTimeCreated": "2025-01-01 00:00:00"},
+    ]
+
+    users, next_cursor = repo.get_users_page(2, role="regular", prefix="a_")
+
+    assert [u.id for u in users] == [9, 8]
+    assert decode_cursor(next_cursor, str, int) == ["2025-01-02 00:00:00", 8]
+    sql, params = mock_cursor.execute.call_args[0]
+    assert "ORDER BY dateTimeCreated DESC, id DESC" in sql
+    # one index range scan per column instead of an OR across them
+    assert "UNION SELECT id FROM User WHERE firstName LIKE %s" in sql
+    assert " OR firstName LIKE" not in sql
+    assert params == ("a\\_%", "a\\_%", "a\\_%", "regular", 3)
+
+def test_get_users_page_applies_cursor(repo, mock_mysql):
+    from utils.pagination_utils import encode_cursor
+    mock_cursor = mock_mysql.connection.cursor()
+    mock_cursor.fetchall.return_value = []
+
+    users, next_cursor = repo.get_users_page(5, cursor=encode_cursor("2025-01-02 00:00:00", 8))
+
+    assert users == [] and next_cursor is None
+    sql, params = mock_cursor.execute.call_args[0]
+    assert "dateTimeCreated < %s OR (dateTimeCreated = %s AND id < %s)" in sql
+    assert params == ("2025-01-02 00:00:00", "2025-01-02 00:00:00", 8, 6)
+
+def test_get_users_page_rejects_bad_cursor(repo):
+    from utils.pagination_utils import encode_cursor
+    with pytest.raises(ValueError):
+        repo.get_users_page(5, cursor="not-a-cursor")
+    # decodes fine but the values have the wrong shape or type
+    for crafted in (encode_cursor("2025-01-02 00:00:00", "8"), encode_cursor("2025-01-02 00:00:00", [8]),
+                    encode_cursor("2025-01-02 00:00:00"), encode_cursor(None, 8), encode_cursor("x", True)):
+        with pytest.raises(ValueError):
+            repo.get_users_page(5, cursor=crafted)
+
+def test_bulk_update_users_deactivates_in_one_transaction(repo, mock_mysql):
+    mock_cursor = mock_mysql.connection.cursor()
+    mock_cursor.fetchall.return_value = [
+        {"id": 1, "status": "active"},
+        {"id": 2, "status": "inactive"},
+    ]
+
+    results = repo.bulk_update_users("deactivate", [1, 2, 3])
+
+    assert results == {1: "updated", 2: "unchanged", 3: "not_found"}
+    assert mock_cursor.execute.call_count == 2
+    update_sql, update_params = mock_cursor.execute.call_args[0]
+    assert "UPDATE User SET status=%s" in update_sql
+    assert update_params == ("inactive", 1)
+    mock_mysql.connection.commit.assert_called_once()
+
+def test_bulk_update_users_deletes(repo, mock_mysql):
+    mock_cursor = mock_mysql.connection.cursor()
+    mock_cursor.fetchall.return_value = [{"id": 4, "status": "active"}]
+
+    results = repo.bulk_update_users("delete", [4, 5])
+
+    assert results == {4: "deleted", 5: "not_found"}
+    sqls = [c[0][0] for c in mock_cursor.execute.call_args_list]
+    assert not any(sql.lstrip().startswith("DELETE") for sql in sqls)
+    assert any("UPDATE User SET deletedAt=NOW()" in sql for sql in sqls)
+    project_sql, project_params = mock_cursor.execute.call_args[0]
+    assert "UPDATE Project SET deletedAt=NOW() WHERE userId IN (%s)" in project_sql
+    assert project_params == (4,)
+    mock_mysql.connection.commit.assert_called_once()
+
+def test_bulk_update_users_rolls_back_on_error(repo, mock_mysql):
+    mock_cursor = mock_mysql.connection.cursor()
+    mock_cursor.execute.side_effect = RuntimeError("db down")
+
+    with pytest.raises(RuntimeError):
+        repo.bulk_update_users("reactivate", [1])
+    mock_mysql.connection.rollback.assert_called_once()
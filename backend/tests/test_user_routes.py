@@ -64,6 +64,13 @@ def test_login_success(client, app_with_service):
     assert resp.json["token"] == token
     assert resp.json["user"]["email"] == "a@example.com"
 
+def test_login_busy_returns_503(client, app_with_service):
+    from utils.hash_pool import HashPoolSaturated
+    app_with_service.user_service.login_user.side_effect = HashPoolSaturated(retry_after=2)
+    resp = client.post("/api/login", json={"email": "a@example.com", "password": "pass"})
+    assert resp.status_code == 503
+    assert resp.headers["Retry-After"] == "2"
+
 def test_login_failure(client, app_with_service):
     app_with_service.user_service.login_user.return_value = (None, None, "Invalid credentials")
     data = {"email": "a@example.com", "password": "wrong"}
@@ -72,6 +79,23 @@ def test_login_failure(client, app_with_service):
     assert resp.json["error"] == "Invalid credentials"
 
 
+# ----- LOGOUT -----
+def test_logout_ends_the_session(client, monkeypatch):
+    ended = []
+    monkeypatch.setattr(user_routes, "authenticate_token",
+                        lambda repo: (Mock(id=1), None, None))
+    monkeypatch.setattr(user_routes, "end_session", ended.append)
+    resp = client.post("/api/logout", headers={"Authorization": "Bearer tok-1"})
+    assert resp.status_code == 200
+    assert ended == ["tok-1"]
+
+def test_logout_requires_auth(client, monkeypatch):
+    monkeypatch.setattr(user_routes, "authenticate_token",
+                        lambda repo: (None, {"error": "Unauthorized"}, 401))
+    resp = client.post("/api/logout")
+    assert resp.status_code == 401
+
+
 # ----- RESET PASSWORD -----
 def test_reset_password_missing_auth(client, monkeypatch):
     monkeypatch.setattr(user_routes, "authenticate_token",
@@ -14,16 +14,13 @@ def service(mock_repo):
 
 def test_register_user_success(service, mock_repo):
     # simulate no existing user
-    mock_repo.get_user_by_email.return_value = None
+    mock_repo.email_taken.return_value = False
     mock_repo.insert_user.return_value = None
     # after insertion, get_user_by_email returns a User
-    mock_repo.get_user_by_email.side_effect = [
-        None, 
-        User(id=1, first_name="Alice", last_name="Smith", email="a@test.com", role="regular", status="active", password="hashed_pw")
-    ]
+    mock_repo.get_user_by_email.return_value = User(id=1, first_name="Alice", last_name="Smith", email="a@test.com", role="regular", status="active", password="hashed_pw")
 
-    with patch("services.user_service.bcrypt.generate_password_hash") as mock_hash:
-        mock_hash.return_value = b"hashed_pw"
+    with patch("services.user_service.hash_password") as mock_hash:
+        mock_hash.return_value = "hashed_pw"
 
         user, error = service.register_user("Alice", "Smith", "a@test.com", "password123", "regular")
 
@@ -43,16 +40,26 @@ def test_register_user_invalid_role(service):
     assert error == "Invalid role"
 
 def test_register_user_email_exists(service, mock_repo):
-    mock_repo.get_user_by_email.return_value = User(id=1, first_name="Alice", last_name="Smith", email="a@test.com", role="regular", status="active", password="hashed_pw")
+    mock_repo.email_taken.return_value = True
+    user, error = service.register_user("Alice", "Smith", "a@test.com", "password123", "regular")
+    assert user is None
+    assert error == "Email already registered"
+
+def test_register_user_email_of_deleted_user(service, mock_repo):
+    # the soft-deleted row still holds the unique email until it is purged
+    mock_repo.get_user_by_email.return_value = None
+    mock_repo.email_taken.return_value = True
     user, error = service.register_user("Alice", "Smith", "a@test.com", "password123", "regular")
     assert user is None
     assert error == "Email already registered"
+    mock_repo.insert_user.assert_not_called()
 
 def test_login_user_success(service, mock_repo):
     user_obj = User(id=1, first_name="Alice", last_name="Smith", email="a@test.com", role="regular", status="active", password="hashed_pw")
     mock_repo.get_user_by_email.return_value = user_obj
 
-    with patch("services.user_service.bcrypt.check_password_hash") as mock_check, \
+    with patch("services.user_service.check_password") as mock_check, \
+         patch("services.user_service.needs_rehash", return_value=False), \
          patch("services.user_service.generate_token") as mock_token:
         mock_check.return_value = True
         mock_token.return_value = "FAKE_TOKEN"
@@ -62,6 +69,20 @@ def test_login_user_success(service, mock_repo):
     assert error is None
     assert token == "FAKE_TOKEN"
     assert user.email == "a@test.com"
+    mock_repo.update_password.assert_not_called()
+
+def test_login_user_rehashes_outdated_hash(service, mock_repo):
+    user_obj = User(id=1, first_name="Alice", last_name="Smith", email="a@test.com", role="regular", status="active", password="$2b$10$old")
+    mock_repo.get_user_by_email.return_value = user_obj
+
+    with patch("services.user_service.check_password", return_value=True), \
+         patch("services.user_service.needs_rehash", return_value=True), \
+         patch("services.user_service.hash_password", return_value="$2b$12$new"), \
+         patch("services.user_service.generate_token", return_value="FAKE_TOKEN"):
+        user, token, error = service.login_user("a@test.com", "password123")
+
+    assert error is None
+    mock_repo.update_password.assert_called_once_with(1, "$2b$12$new", revoke_tokens=False)
 
 def test_login_user_invalid_credentials(service, mock_repo):
     # no user found
@@ -78,10 +99,10 @@ def test_reset_password_success(service, mock_repo):
     user_obj = User(id=1, first_name="Alice", last_name="Smith", email="a@test.com", role="regular", status="active", password="old_hash")
     mock_repo.get_user_by_email.return_value = user_obj
 
-    with patch("services.user_service.bcrypt.check_password_hash") as mock_check, \
-         patch("services.user_service.bcrypt.generate_password_hash") as mock_hash:
+    with patch("services.user_service.check_password") as mock_check, \
+         patch("services.user_service.hash_password") as mock_hash:
         mock_check.return_value = True
-        mock_hash.return_value = b"new_hash"
+        mock_hash.return_value = "new_hash"
 
         error = service.reset_password("a@test.com", "old_pw", "new_pw")
 
@@ -92,7 +113,7 @@ def test_reset_password_incorrect_old_pw(service, mock_repo):
     user_obj = User(id=1, first_name="Alice", last_name="Smith", email="a@test.com", role="regular", status="active", password="old_hash")
     mock_repo.get_user_by_email.return_value = user_obj
 
-    with patch("services.user_service.bcrypt.check_password_hash") as mock_check:
+    with patch("services.user_service.check_password") as mock_check:
         mock_check.return_value = False
 
         error = service.reset_password("a@test.com", "wrong_pw", "new_pw")
@@ -103,7 +124,7 @@ def test_update_profile_success(service, mock_repo):
     user_obj = User(id=1, first_name="Alice", last_name="Smith", email="a@test.com", role="regular", status="active", password="pw_hash")
     mock_repo.get_user_by_email.return_value = user_obj
 
-    with patch("services.user_service.bcrypt.check_password_hash") as mock_check:
+    with patch("services.user_service.check_password") as mock_check:
         mock_check.return_value = True
         error = service.update_profile("a@test.com", "password", first_name="Alicia")
 
@@ -114,7 +135,7 @@ def test_update_profile_wrong_password(service, mock_repo):
     user_obj = User(id=1, first_name="Alice", last_name="Smith", email="a@test.com", role="regular", status="active", password="pw_hash")
     mock_repo.get_user_by_email.return_value = user_obj
 
-    with patch("services.user_service.bcrypt.check_password_hash") as mock_check:
+    with patch("services.user_service.check_password") as mock_check:
         mock_check.return_value = False
         error = service.update_profile("a@test.com", "wrong_pw", first_name="Alicia")
 
@@ -4,21 +4,97 @@
 from flask import g
 from itsdangerous import URLSafeTimedSerializer
 from flask import request, jsonify
+from utils.cache_utils import TTLCache
+from utils.session_store import MemorySessionStore
+from models.user import User
 
 serializer = None
-tokens = {}
+# signed tokens are refused after this many seconds even if their session lingers
+token_max_age = None
+# token -> user id for live sessions, checked on every request; swap for a
+# shared backend with configure_session_store when running several workers
+session_store = MemorySessionStore()
 
-def configure_serializer(secret_key):
-    global serializer
+# user id -> {'status', 'tokenVersion'}; the only per-request lookup for claim tokens
+token_state_cache = TTLCache(max_size=4096, ttl=30)
+
+def configure_serializer(secret_key, max_age=None):
+    global serializer, token_max_age
     serializer = URLSafeTimedSerializer(secret_key)
+    token_max_age = max_age
+
+def configure_session_store(store):
+    global session_store
+    session_store = store
+
+def configure_token_state_cache(max_size=4096, ttl=30):
+    global token_state_cache
+    token_state_cache = TTLCache(max_size=max_size, ttl=ttl)
+
+def get_cached_token_state(user_id, user_repo):
+    state = token_state_cache.get(user_id)
+    if state is None:
+        state = user_repo.get_token_state(user_id)
+        if state:
+            token_state_cache.set(user_id, state)
+    return state
+
+def invalidate_token_state(user_id):
+    """Drop the cached status/tokenVersion after the underlying User row changes."""
+    token_state_cache.pop(user_id)
 
-def generate_token(user):
+def _field(user, name):
+    return user.get(name) if isinstance(user, dict) else getattr(user, name, None)
+
+def generate_token(user, token_version=0):
     if serializer is None:
         raise RuntimeError("Serializer not configured. Call configure_serializer(secret_key) first.")
-    token = serializer.dumps(user['email'])
-    tokens[token] = user['id']
+    claims = {
+        'id': user['id'],
+        'email': user['email'],
+        'role': user.get('role'),
+        'status': user.get('status'),
+        'ver': token_version,
+    }
+    token = serializer.dumps(claims)
+    session_store.put(token, user['id'])
     return token
 
+def _user_from_claims(claims, user_repo):
+    # Reject the token once the user is gone, inactive, or has bumped tokenVersion
+    state = get_cached_token_state(claims.get('id'), user_repo)
+    if not state or state['tokenVersion'] != claims.get('ver'):
+        return None
+    if state['status'] != 'active':
+        return None
+    return User(
+        id=claims['id'],
+        first_name=None,
+        last_name=None,
+        email=claims['email'],
+        role=claims.get('role'),
+        status=state['status'],
+    )
+
+def end_session(token):
+    """Logout: the token stops working everywhere the session store is shared."""
+    session_store.delete(token)
+
+def resolve_token_user(token, user_repo):
+    claims = serializer.loads(token, max_age=token_max_age)
+    if not isinstance(claims, dict):
+        # tokens issued before claims were added only carry the email, so they
+        # can't be checked against tokenVersion; make their holders log in again
+        return None
+    # a signed token is only honoured while its session is live, so logout
+    # and session expiry take effect before the signature would
+    session_user_id = session_store.get(token)
+    if session_user_id is None:
+        return None
+    if claims.get('id') != session_user_id:
+        return None
+    return _user_from_claims(claims, user_repo)
+
 
 def verify_token(token, user_repo):
     # (Move print to the very top to test raw input)
@@ -29,19 +105,17 @@ def verify_token(token, user_repo):
         return False
     try:
         # Check if the token can be loaded
-        email = serializer.loads(token)
+        user = resolve_token_user(token, user_repo)
     except Exception as e:
         # --- NEW: Print the actual exception ---
         print(f"1.2 Token loading failed/expired: {e}") 
         return False
-        
-    user = user_repo.get_user_by_email(email)
     
-    print(f"2. User retrieved from DB: {user}")
+    print(f"2. User resolved from token: {user}")
 
-    if user and user.get('status') == 'active':
+    if user and _field(user, 'status') == 'active':
         g.current_user = user
-        print(f"3. User authenticated and g.current_user set to {user['email']}")
+        print(f"3. User authenticated and g.current_user set to {_field(user, 'email')}")
         return True
     
     print("4. User not found or inactive.")
@@ -56,14 +130,14 @@ def authenticate_token(user_repo):
     token = auth_header[len('Bearer '):]
 
     try:
-        email = serializer.loads(token)
+        user = resolve_token_user(token, user_repo)
     except Exception as e:
         print(f"Token decode error: {e}")
         return None, jsonify({'error': 'Unauthorized'}), 401
 
-    user = user_repo.get_user_by_email(email)
     if not user:
         return None, jsonify({'error': 'Unauthorized'}), 401
 
+    g.auth_user_id = _field(user, 'id')  # read-your-writes routing (utils/db_router.py)
     return user, None, None
 
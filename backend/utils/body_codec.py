@@ -0,0 +1,73 @@
+# body_codec.py
+import zlib
+
+try:
+    import zstandard as _zstd
+except ImportError:  # optional; zlib is always available
+    _zstd = None
+
+# Stored bodies start with a two-byte marker naming the format. NUL never
+# appears in prompts or Markdown, so unmarked bytes are plain UTF-8 text
+# (rows written before compression, or bodies too small to bother with).
+ZLIB_MARKER = b"\x00z"
+ZSTD_MARKER = b"\x00s"
+CODECS = ("zlib", "zstd", "none")
+
+
+class BodyCodec:
+    """
+    Compresses prompt and LLM response bodies on write and restores them on
+    read. Bodies shorter than min_size, or that don't shrink, stay plain.
+    """
+
+    def __init__(self, codec="zlib", level=6, min_size=256):
+        if codec not in CODECS:
+            raise ValueError(f"Unknown body codec: {codec}")
+        if codec == "zstd" and _zstd is None:
+            raise ValueError("BODY_CODEC=zstd requires the zstandard package")
+        self.codec = codec
+        self.level = level
+        self.min_size = min_size
+
+    def encode(self, text):
+        raw = text.encode("utf-8")
+        if self.codec == "none" or len(raw) < self.min_size:
+            return raw
+        if self.codec == "zstd":
+            packed = ZSTD_MARKER + _zstd.ZstdCompressor(level=self.level).compress(raw)
+        else:
+            packed = ZLIB_MARKER + zlib.compress(raw, self.level)
+        return packed if len(packed) < len(raw) else raw
+
+    def decode(self, value):
+        if value is None or isinstance(value, str):
+            return value
+        value = bytes(value)
+        if value.startswith(ZLIB_MARKER):
+            return zlib.decompress(value[2:]).decode("utf-8")
+        if value.startswith(ZSTD_MARKER):
+            if _zstd is None:
+                raise RuntimeError("zstd-compressed body found but zstandard is not installed")
+            return _zstd.ZstdDecompressor().decompress(value[2:]).decode("utf-8")
+        return value.decode("utf-8")
+
+
+def is_compressed(value):
+    return isinstance(value, (bytes, bytearray)) and bytes(value[:2]) in (ZLIB_MARKER, ZSTD_MARKER)
+
+
+body_codec = BodyCodec()
+
+
+def configure_body_codec(codec="zlib", level=6, min_size=256):
+    global body_codec
+    body_codec = BodyCodec(codec, level, min_size)
+    return body_codec
+
+
+def encode_body(text):
+    return body_codec.encode(text)
+
+
+def decode_body(value):
+    return body_codec.decode(value)
@@ -0,0 +1,272 @@
+# db_pool.py
+import threading
+import time
+from collections import deque
+from flask import g, has_app_context
+
+
+class PoolTimeout(Exception):
+    """No connection became free within the acquisition timeout."""
+
+
+class _Entry:
+    __slots__ = ("conn", "created_at", "last_used")
+
+    def __init__(self, conn, now):
+        self.conn = conn
+        self.created_at = now
+        self.last_used = now
+
+
+class ConnectionPool:
+    """
+    Bounded pool of DB-API connections. Idle connections are reused
+    most-recently-used first, closed once idle longer than max_idle or
+    older than max_lifetime, and pinged before being handed out when they
+    have sat idle for at least ping_interval seconds.
+    Callers beyond max_size wait up to timeout seconds, then get PoolTimeout.
+    """
+
+    def __init__(self, connect, min_size=1, max_size=10, max_idle=300, max_lifetime=3600,
+                 timeout=5, pre_ping=True, ping_interval=1.0, clock=time.monotonic):
+        if max_size < 1 or min_size > max_size:
+            raise ValueError("pool requires 1 <= max_size and min_size <= max_size")
+        self._connect = connect
+        self.min_size = min_size
+        self.max_size = max_size
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.timeout = timeout
+        self.pre_ping = pre_ping
+        self.ping_interval = ping_interval
+        self._clock = clock
+
+        self._idle = deque()
+        self._in_use = {}  # id(conn) -> _Entry
+        self._size = 0
+        self._cond = threading.Condition()
+        self._prefilled = False
+
+        self.waiters = 0
+        self.acquired = 0
+        self.created = 0
+        self.recycled = 0
+        self.ping_failures = 0
+        self.timeouts = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+
+    def _open(self):
+        conn = self._connect()
+        self.created += 1
+        return _Entry(conn, self._clock())
+
+    def _close(self, entry):
+        try:
+            entry.conn.close()
+        except Exception:
+            pass
+
+    def _expired(self, entry, now):
+        return (now - entry.last_used > self.max_idle
+                or now - entry.created_at > self.max_lifetime)
+
+    def _prefill(self):
+        # lazily, so pre-fork servers don't share sockets between workers
+        self._prefilled = True
+        while self._size < self.min_size:
+            self._idle.append(self._open())
+            self._size += 1
+
+    def _take_idle(self):
+        """Pop a usable idle connection or None; caller holds the lock."""
+        now = self._clock()
+        while self._idle:
+            entry = self._idle.pop()
+            if self._expired(entry, now):
+                self.recycled += 1
+                self._size -= 1
+                self._close(entry)
+                continue
+            return entry
+        return None
+
+    def acquire(self, timeout=None):
+        timeout = self.timeout if timeout is None else timeout
+        started = self._clock()
+        deadline = started + timeout
+
+        with self._cond:
+            if not self._prefilled:
+                self._prefill()
+            while True:
+                entry = self._take_idle()
+                if entry is not None:
+                    self._in_use[id(entry.conn)] = entry
+                    break
+                if self._size < self.max_size:
+                    # reserve the slot; connect outside the lock
+                    self._size += 1
+                    break
+
+                remaining = deadline - self._clock()
+                if remaining <= 0:
+                    self.timeouts += 1
+                    raise PoolTimeout(f"No database connection free within {timeout}s")
+                self.waiters += 1
+                try:
+                    self._cond.wait(remaining)
+                finally:
+                    self.waiters -= 1
+
+        if entry is None:
+            try:
+                entry = self._open()
+            except Exception:
+                with self._cond:
+                    self._size -= 1
+                    self._cond.notify()
+                raise
+            with self._cond:
+                self._in_use[id(entry.conn)] = entry
+        elif (self.pre_ping and self._clock() - entry.last_used >= self.ping_interval
+              and not self._ping(entry)):
+            return self.acquire(max(0.0, deadline - self._clock()))
+
+        waited = self._clock() - started
+        with self._cond:
+            self.acquired += 1
+            self.total_wait += waited
+            self.max_wait = max(self.max_wait, waited)
+        return entry.conn
+
+    def _ping(self, entry):
+        try:
+            entry.conn.ping()
+            return True
+        except Exception:
+            self.ping_failures += 1
+            self._discard(entry)
+            return False
+
+    def _discard(self, entry):
+        with self._cond:
+            self._in_use.pop(id(entry.conn), None)
+            self._size -= 1
+            self._cond.notify()
+        self._close(entry)
+
+    def release(self, conn, discard=False):
+        with self._cond:
+            entry = self._in_use.pop(id(conn), None)
+        if entry is None:
+            return
+        if not discard:
+            try:
+                # never hand the next borrower an open transaction
+                conn.rollback()
+            except Exception:
+                discard = True
+        if discard:
+            with self._cond:
+                self._size -= 1
+                self._cond.notify()
+            self._close(entry)
+            return
+        with self._cond:
+            entry.last_used = self._clock()
+            self._idle.append(entry)
+            self._cond.notify()
+
+    def close(self):
+        with self._cond:
+            idle, self._idle = list(self._idle), deque()
+            self._size -= len(idle)
+        for entry in idle:
+            self._close(entry)
+
+    def stats(self):
+        acquired = self.acquired
+        return {
+            "size": self._size,
+            "idle": len(self._idle),
+            "in_use": len(self._in_use),
+            "waiters": self.waiters,
+            "min_size": self.min_size,
+            "max_size": self.max_size,
+            "acquired": acquired,
+            "created": self.created,
+            "recycled": self.recycled,
+            "ping_failures": self.ping_failures,
+            "timeouts": self.timeouts,
+            "avg_wait_ms": round(self.total_wait / acquired * 1000, 2) if acquired else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 2),
+        }
+
+
+def mysql_connector(host="localhost", port=3306, user=None, password=None, db=None,
+                    cursorclass=None, charset="utf8mb4", connect_timeout=10):
+    """Factory for MySQLdb connections; the driver is imported on first use."""
+    def connect():
+        import MySQLdb
+        import MySQLdb.cursors
+
+        kwargs = {"host": host, "port": port, "charset": charset, "connect_timeout": connect_timeout}
+        if user:
+            kwargs["user"] = user
+        if password:
+            kwargs["passwd"] = password
+        if db:
+            kwargs["db"] = db
+        if cursorclass:
+            kwargs["cursorclass"] = getattr(MySQLdb.cursors, cursorclass)
+        return MySQLdb.connect(**kwargs)
+    return connect
+
+
+class PooledMySQL:
+    """
+    Drop-in replacement for flask_mysqldb.MySQL: .connection is borrowed
+    from a ConnectionPool once per app context and returned (rolled back)
+    on teardown instead of being closed.
+    """
+
+    def __init__(self, app=None):
+        self.pool = None
+        if app is not None:
+            self.init_app(app)
+
+    def init_app(self, app):
+        c = app.config
+        self.pool = ConnectionPool(
+            mysql_connector(
+                host=c.get("MYSQL_HOST") or "localhost",
+                port=int(c.get("MYSQL_PORT") or 3306),
+                user=c.get("MYSQL_USER"),
+                password=c.get("MYSQL_PASSWORD"),
+                db=c.get("MYSQL_DB"),
+                cursorclass=c.get("MYSQL_CURSORCLASS"),
+            ),
+            min_size=c.get("DB_POOL_MIN_SIZE", 1),
+            max_size=c.get("DB_POOL_MAX_SIZE", 10),
+            max_idle=c.get("DB_POOL_MAX_IDLE", 300),
+            max_lifetime=c.get("DB_POOL_MAX_LIFETIME", 3600),
+            timeout=c.get("DB_POOL_TIMEOUT", 5),
+        )
+        app.teardown_appcontext(self.teardown)
+
+    @property
+    def connection(self):
+        if not has_app_context():
+            return None
+        if "pooled_db" not in g:
+            g.pooled_db = self.pool.acquire()
+        return g.pooled_db
+
+    def teardown(self, exception):
+        conn = g.pop("pooled_db", None)
+        if conn is not None:
+            self.pool.release(conn)
+
+    def stats(self):
+        return self.pool.stats() if self.pool else None
@@ -0,0 +1,190 @@
+# db_router.py
+import itertools
+import threading
+from contextvars import ContextVar
+from functools import wraps
+from flask import g, has_app_context, has_request_context
+from utils.cache_utils import TTLCache
+from utils.db_pool import ConnectionPool, mysql_connector
+
+READ = "read"
+WRITE = "write"
+
+_intent = ContextVar("db_intent", default=None)
+
+# user id -> True for a few seconds after that user wrote something, so their
+# next requests read from the primary instead of a lagging replica
+_recent_writers = TTLCache(max_size=10000, ttl=5)
+
+
+def reads(fn):
+    """Repository method that may be served by a replica."""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        if _intent.get() is not None:
+            # nested inside another repository call; keep its routing
+            return fn(*args, **kwargs)
+        token = _intent.set(READ)
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            _intent.reset(token)
+    return wrapper
+
+
+def writes(fn):
+    """Repository method that must run on the primary."""
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        token = _intent.set(WRITE)
+        try:
+            result = fn(*args, **kwargs)
+        finally:
+            _intent.reset(token)
+        _note_write()
+        return result
+    return wrapper
+
+
+def _note_write():
+    if not has_request_context():
+        return
+    g.db_wrote = True
+    user_id = g.get("auth_user_id")
+    if user_id is not None:
+        _recent_writers.set(user_id, True)
+
+
+def _is_sticky():
+    if not has_request_context():
+        return False
+    if g.get("db_wrote"):
+        return True
+    user_id = g.get("auth_user_id")
+    return user_id is not None and _recent_writers.get(user_id) is not None
+
+
+class SharedRecentWriters:
+    """
+    Recent writers kept in a session store that every worker shares (see
+    utils.session_store), so a write served by one process also pins the
+    user's next reads on the others. Same get/set surface as TTLCache.
+    """
+
+    def __init__(self, store, ttl=5):
+        self.store = store
+        self.ttl = ttl
+
+    @staticmethod
+    def _key(user_id):
+        return f"db-write:{user_id}"
+
+    def set(self, user_id, value):
+        # flags live apart from sessions: no effect on the session cap or stats
+        self.store.put_flag(self._key(user_id), self.ttl)
+
+    def get(self, user_id):
+        return True if self.store.has_flag(self._key(user_id)) else None
+
+
+def configure_stickiness(seconds=5, store=None):
+    """Pass a shared session store to make stickiness hold across worker processes."""
+    global _recent_writers
+    if store is not None:
+        _recent_writers = SharedRecentWriters(store, ttl=seconds)
+    else:
+        _recent_writers = TTLCache(max_size=10000, ttl=seconds)
+
+
+class ReplicaPool:
+    """
+    Round-robin set of read replicas, each behind its own ConnectionPool.
+    Like the primary, one connection is borrowed per app context and
+    returned on teardown.
+    """
+
+    def __init__(self, hosts, user=None, password=None, db=None, cursorclass=None,
+                 connect_timeout=2, max_size=10, timeout=5):
+        self.hosts = [self._parse_host(h) for h in hosts]
+        self.pools = [
+            ConnectionPool(
+                mysql_connector(host=host, port=port, user=user, password=password, db=db,
+                                cursorclass=cursorclass, connect_timeout=connect_timeout),
+                min_size=0,
+                max_size=max_size,
+                timeout=timeout,
+            )
+            for host, port in self.hosts
+        ]
+        self._next = itertools.cycle(range(len(self.hosts))) if self.hosts else None
+        self._lock = threading.Lock()
+        self.failures = 0
+
+    @staticmethod
+    def _parse_host(value):
+        host, _, port = value.strip().partition(":")
+        return host, int(port) if port else 3306
+
+    def init_app(self, app):
+        app.teardown_appcontext(self.teardown)
+
+    @property
+    def connection(self):
+        if not has_app_context():
+            return None
+        if "replica_db" not in g:
+            with self._lock:
+                pool = self.pools[next(self._next)]
+            g.replica_db = (pool, pool.acquire())
+        return g.replica_db[1]
+
+    def teardown(self, exception):
+        borrowed = g.pop("replica_db", None)
+        if borrowed is not None:
+            pool, conn = borrowed
+            pool.release(conn)
+
+    def stats(self):
+        return [dict(pool.stats(), host=f"{host}:{port}") for (host, port), pool in zip(self.hosts, self.pools)]
+
+
+class DBRouter:
+    """
+    Stands in for the flask_mysqldb object handed to repositories: its
+    .connection is a replica connection inside @reads methods (unless the
+    current user wrote recently) and the primary connection otherwise.
+    """
+
+    def __init__(self, primary, replicas=None):
+        self.primary = primary
+        self.replicas = replicas if replicas and replicas.hosts else None
+        self.routed = {"primary": 0, "replica": 0, "sticky": 0, "fallback": 0}
+
+    @property
+    def connection(self):
+        if self.replicas is None or _intent.get() != READ:
+            self.routed["primary"] += 1
+            return self.primary.connection
+        if _is_sticky():
+            self.routed["sticky"] += 1
+            return self.primary.connection
+        try:
+            conn = self.replicas.connection
+        except Exception as e:
+            print("Replica unavailable, reading from primary:", e)
+            self.replicas.failures += 1
+            conn = None
+        if conn is None:
+            self.routed["fallback"] += 1
+            return self.primary.connection
+        self.routed["replica"] += 1
+        return conn
+
+    def stats(self):
+        return {
+            "replicas": len(self.replicas.hosts) if self.replicas else 0,
+            "replica_failures": self.replicas.failures if self.replicas else 0,
+            "replica_pools": self.replicas.stats() if self.replicas else [],
+            "sticky_seconds": _recent_writers.ttl,
+            **self.routed,
+        }
@@ -1,33 +1,198 @@
+import threading
+import time
+import httpx
 from flask import current_app
 from google import genai
 from google.genai import types
 from utils.prompt_utils import build_team_summary, build_project_prompt
+from utils.llm_cache import cache_key, cached_response, cache_response
 
-def generate_project_plan(data):
+MODEL = "gemini-2.5-flash"
+SYSTEM_INSTRUCTION = "You are an expert AI Project Manager. Respond with a structured Markdown plan only."
+
+
+class GeminiClientHolder:
     """
-    Generates a project plan using the Gemini API.
+    One genai.Client per process, created on first use and shared by all
+    threads so its HTTP connections stay open between calls. A different
+    API key (rotation) closes the old client and builds a new one.
+    Also keeps timings that split client setup from model latency.
     """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._client = None
+        self._api_key = None
+
+        self.clients_created = 0
+        self.calls = 0
+        self.setup_ms_total = 0.0
+        self.model_ms_total = 0.0
+        self.last_setup_ms = 0.0
+        self.last_model_ms = 0.0
+        self.streams = 0
+        self.first_chunk_ms_total = 0.0
+        self.last_first_chunk_ms = 0.0
+
+    def get(self, api_key, max_connections=10, keepalive_seconds=120):
+        """Return (client, setup_ms); setup_ms is ~0 once the client exists."""
+        started = time.perf_counter()
+        with self._lock:
+            if self._client is None or self._api_key != api_key:
+                self._close(self._client)
+                self._client = genai.Client(
+                    api_key=api_key,
+                    http_options=types.HttpOptions(client_args={
+                        "limits": httpx.Limits(
+                            max_connections=max_connections,
+                            max_keepalive_connections=max_connections,
+                            keepalive_expiry=keepalive_seconds,
+                        ),
+                    }),
+                )
+                self._api_key = api_key
+                self.clients_created += 1
+            client = self._client
+        return client, (time.perf_counter() - started) * 1000
+
+    def record(self, setup_ms, model_ms, first_chunk_ms=None):
+        with self._lock:
+            self.calls += 1
+            self.setup_ms_total += setup_ms
+            self.model_ms_total += model_ms
+            self.last_setup_ms = round(setup_ms, 2)
+            self.last_model_ms = round(model_ms, 2)
+            if first_chunk_ms is not None:
+                self.streams += 1
+                self.first_chunk_ms_total += first_chunk_ms
+                self.last_first_chunk_ms = round(first_chunk_ms, 2)
+
+    @staticmethod
+    def _close(client):
+        if client is None:
+            return
+        try:
+            client.close()
+        except Exception as e:
+            print("Failed to close Gemini client:", e)
+
+    def reset(self):
+        with self._lock:
+            client, self._client, self._api_key = self._client, None, None
+        self._close(client)
+
+    def stats(self):
+        calls = self.calls
+        return {
+            "client_ready": self._client is not None,
+            "clients_created": self.clients_created,
+            "calls": calls,
+            "last_setup_ms": self.last_setup_ms,
+            "last_model_ms": self.last_model_ms,
+            "avg_setup_ms": round(self.setup_ms_total / calls, 2) if calls else 0.0,
+            "avg_model_ms": round(self.model_ms_total / calls, 2) if calls else 0.0,
+            "streams": self.streams,
+            "last_first_chunk_ms": self.last_first_chunk_ms,
+            "avg_first_chunk_ms": round(self.first_chunk_ms_total / self.streams, 2) if self.streams else 0.0,
+        }
+
+
+gemini_client = GeminiClientHolder()
+
+
+def reset_client():
+    """Drop the shared client, e.g. after rotating GEMINI_API_KEY."""
+    gemini_client.reset()
+
+
+def _build_prompt(data):
+    team_members = data.get('team_members') or data.get('teamMembers') or []
+    team_summary = build_team_summary(team_members)
+    return build_project_prompt(data, team_summary)
+
+
+def _get_client():
     api_key = current_app.config.get('GEMINI_API_KEY')
     if not api_key:
         raise RuntimeError("GEMINI_API_KEY not configured")
 
     try:
-        client = genai.Client(api_key=api_key)
+        return gemini_client.get(
+            api_key,
+            max_connections=current_app.config.get('GEMINI_MAX_CONNECTIONS', 10),
+            keepalive_seconds=current_app.config.get('GEMINI_KEEPALIVE_SECONDS', 120),
+        )
     except Exception as e:
         raise RuntimeError(f"Gemini Client Initialization Error: {str(e)}")
 
-    team_members = data.get('team_members') or data.get('teamMembers') or []
-    team_summary = build_team_summary(team_members)
-    prompt = build_project_prompt(data, team_summary)
+
+def plan_prompt_key(data):
+    """Cache/coalescing key of the prompt generate_project_plan would send."""
+    return cache_key(_build_prompt(data), MODEL, SYSTEM_INSTRUCTION)
+
+
+def generate_project_plan(data):
+    """
+    Generates a project plan using the Gemini API.
+    An identical earlier prompt is answered from the LLM response cache
+    unless data['bypass_cache'] is set.
+    """
+    prompt = _build_prompt(data)
+    key = cache_key(prompt, MODEL, SYSTEM_INSTRUCTION)
+    cached = cached_response(key, bypass=bool(data.get('bypass_cache')))
+    if cached is not None:
+        return prompt, cached
+
+    client, setup_ms = _get_client()
 
     try:
+        started = time.perf_counter()
         response = client.models.generate_content(
-            model="gemini-2.5-flash",
+            model=MODEL,
             contents=prompt,
-            config=types.GenerateContentConfig(
-                system_instruction="You are an expert AI Project Manager. Respond with a structured Markdown plan only."
-            )
+            config=types.GenerateContentConfig(system_instruction=SYSTEM_INSTRUCTION)
         )
-        return prompt, response.text
+        gemini_client.record(setup_ms, (time.perf_counter() - started) * 1000)
     except Exception as e:
         raise RuntimeError(f"Failed to generate plan from Gemini API: {str(e)}")
+    cache_response(key, MODEL, response.text)
+    return prompt, response.text
+
+
+def stream_project_plan(data):
+    """
+    Streaming variant of generate_project_plan: returns (prompt, chunks)
+    where chunks yields the plan text as Gemini produces it. A cached
+    plan comes back as a single chunk.
+    """
+    prompt = _build_prompt(data)
+    key = cache_key(prompt, MODEL, SYSTEM_INSTRUCTION)
+    cached = cached_response(key, bypass=bool(data.get('bypass_cache')))
+    if cached is not None:
+        return prompt, iter([cached])
+
+    client, setup_ms = _get_client()
+
+    def chunks():
+        started = time.perf_counter()
+        first_chunk_ms = None
+        parts = []
+        try:
+            stream = client.models.generate_content_stream(
+                model=MODEL,
+                contents=prompt,
+                config=types.GenerateContentConfig(system_instruction=SYSTEM_INSTRUCTION)
+            )
+            for chunk in stream:
+                if not chunk.text:
+                    continue
+                if first_chunk_ms is None:
+                    first_chunk_ms = (time.perf_counter() - started) * 1000
+                parts.append(chunk.text)
+                yield chunk.text
+        except Exception as e:
+            raise RuntimeError(f"Failed to generate plan from Gemini API: {str(e)}")
+        gemini_client.record(setup_ms, (time.perf_counter() - started) * 1000, first_chunk_ms)
+        cache_response(key, MODEL, ''.join(parts))
+
+    return prompt, chunks()
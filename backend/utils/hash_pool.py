@@ -0,0 +1,204 @@
+# hash_pool.py
+import multiprocessing
+import statistics
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor, TimeoutError as FutureTimeoutError
+import bcrypt as _bcrypt
+
+DEFAULT_ROUNDS = 12  # flask_bcrypt's BCRYPT_LOG_ROUNDS default
+HASH_PREFIX = "$2b$"
+
+
+class HashPoolSaturated(Exception):
+    """Raised when too many hash jobs are already queued; callers should answer 503."""
+
+    def __init__(self, retry_after=1):
+        super().__init__("Password hashing is saturated, retry later")
+        self.retry_after = retry_after
+
+
+class LatencyStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.count = 0
+        self.total_seconds = 0.0
+        self.max_seconds = 0.0
+
+    def record(self, seconds):
+        with self._lock:
+            self.count += 1
+            self.total_seconds += seconds
+            self.max_seconds = max(self.max_seconds, seconds)
+
+    def to_dict(self):
+        avg = self.total_seconds / self.count if self.count else 0.0
+        return {
+            "count": self.count,
+            "avg_ms": round(avg * 1000, 2),
+            "max_ms": round(self.max_seconds * 1000, 2),
+        }
+
+
+def _mp_context():
+    # never fork: the app process holds DB connections and running threads
+    # that a forked child would inherit half-copied
+    methods = multiprocessing.get_all_start_methods()
+    return multiprocessing.get_context("forkserver" if "forkserver" in methods else "spawn")
+
+
+# --- worker functions (run inside the pool processes) ---
+def _hash_worker(password, rounds):
+    return _bcrypt.hashpw(password.encode('utf-8'), _bcrypt.gensalt(rounds)).decode('utf-8')
+
+
+def _check_worker(pw_hash, password):
+    try:
+        return _bcrypt.checkpw(password.encode('utf-8'), pw_hash.encode('utf-8'))
+    except ValueError:
+        # malformed or non-bcrypt hash
+        return False
+
+
+class HashPool:
+    """
+    Runs bcrypt in a small process pool so a burst of logins cannot starve
+    the request threads. At most max_pending jobs may be queued or running;
+    beyond that submit fails fast with HashPoolSaturated, as does a job
+    that takes longer than timeout to come back.
+    workers=0 runs every job inline on the calling thread.
+    """
+
+    def __init__(self, workers=2, max_pending=16, timeout=10, retry_after=1, rounds=DEFAULT_ROUNDS):
+        self.workers = workers
+        self.max_pending = max_pending
+        self.timeout = timeout
+        self.retry_after = retry_after
+        self.rounds = rounds
+        self._slots = threading.BoundedSemaphore(max_pending)
+        self._executor = None
+        self._executor_lock = threading.Lock()
+        self._count_lock = threading.Lock()
+        self.pending = 0
+        self.rejected = 0
+        self.latency = {"hash": LatencyStats(), "check": LatencyStats()}
+
+    def _get_executor(self):
+        # created lazily so pre-fork servers don't share a pool between workers
+        if self._executor is None:
+            with self._executor_lock:
+                if self._executor is None:
+                    self._executor = ProcessPoolExecutor(max_workers=self.workers, mp_context=_mp_context())
+        return self._executor
+
+    def _release(self, _future=None):
+        with self._count_lock:
+            self.pending -= 1
+        self._slots.release()
+
+    def _run(self, op, fn, *args):
+        if not self._slots.acquire(blocking=False):
+            with self._count_lock:
+                self.rejected += 1
+            raise HashPoolSaturated(self.retry_after)
+
+        with self._count_lock:
+            self.pending += 1
+        started = time.perf_counter()
+        if self.workers <= 0:
+            try:
+                return fn(*args)
+            finally:
+                self.latency[op].record(time.perf_counter() - started)
+                self._release()
+
+        try:
+            future = self._get_executor().submit(fn, *args)
+        except Exception:
+            self._release()
+            raise
+        # the slot stays taken until the worker is really done, even if we stop waiting
+        future.add_done_callback(self._release)
+        try:
+            return future.result(timeout=self.timeout)
+        except FutureTimeoutError:
+            raise HashPoolSaturated(self.retry_after)
+        finally:
+            self.latency[op].record(time.perf_counter() - started)
+
+    def hash(self, password, rounds=None):
+        return self._run("hash", _hash_worker, password, rounds or self.rounds)
+
+    def check(self, pw_hash, password):
+        if not pw_hash:
+            return False
+        return self._run("check", _check_worker, pw_hash, password)
+
+    def stats(self):
+        return {
+            "workers": self.workers,
+            "max_pending": self.max_pending,
+            "pending": self.pending,
+            "rejected": self.rejected,
+            "rounds": self.rounds,
+            "hash": self.latency["hash"].to_dict(),
+            "check": self.latency["check"].to_dict(),
+        }
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False)
+            self._executor = None
+
+
+hash_pool = HashPool(workers=0)
+
+
+def configure_hash_pool(workers=2, max_pending=16, timeout=10, retry_after=1, rounds=DEFAULT_ROUNDS):
+    global hash_pool
+    hash_pool.shutdown()
+    hash_pool = HashPool(workers, max_pending, timeout, retry_after, rounds)
+    return hash_pool
+
+
+def hash_password(password):
+    return hash_pool.hash(password)
+
+
+def check_password(pw_hash, password):
+    return hash_pool.check(pw_hash, password)
+
+
+def hash_cost(pw_hash):
+    """Return (prefix, rounds) for a bcrypt hash such as '$2b$12$...', or (None, None)."""
+    parts = (pw_hash or "").split("$")
+    if len(parts) < 4 or not parts[2].isdigit():
+        return None, None
+    return f"${parts[1]}$", int(parts[2])
+
+
+def needs_rehash(pw_hash, rounds=None):
+    """True when the stored hash uses another bcrypt variant or cost than configured."""
+    prefix, cost = hash_cost(pw_hash)
+    return prefix != HASH_PREFIX or cost != (rounds or hash_pool.rounds)
+
+
+def calibrate_rounds(target_ms=250, min_rounds=10, max_rounds=16, samples=3, timer=time.perf_counter):
+    """
+    Benchmark bcrypt on this host and pick the highest cost whose median
+    hash time stays within target_ms (never below min_rounds).
+    Returns (rounds, {rounds: median_ms}).
+    """
+    timings = {}
+    chosen = min_rounds
+    for rounds in range(min_rounds, max_rounds + 1):
+        runs = []
+        for _ in range(samples):
+            started = timer()
+            _hash_worker("calibration-password", rounds)
+            runs.append((timer() - started) * 1000)
+        timings[rounds] = round(statistics.median(runs), 1)
+        if timings[rounds] > target_ms:
+            break
+        chosen = rounds
+    return chosen, timings
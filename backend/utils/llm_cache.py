@@ -0,0 +1,122 @@
+# llm_cache.py
+import hashlib
+import json
+import re
+import unicodedata
+from utils.cache_utils import TTLCache
+
+_TRAILING_SPACE = re.compile(r"[ \t]+\n")
+_BLANK_LINES = re.compile(r"\n{3,}")
+
+
+def normalize_prompt(prompt):
+    """Strip differences that don't change what the model is asked."""
+    text = unicodedata.normalize("NFC", prompt).replace("\r\n", "\n")
+    text = _TRAILING_SPACE.sub("\n", text)
+    return _BLANK_LINES.sub("\n\n", text).strip()
+
+
+def cache_key(prompt, model, system_instruction):
+    material = json.dumps([model, system_instruction, normalize_prompt(prompt)], ensure_ascii=False)
+    return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Content-addressed cache of LLM responses: an in-process TTLCache in
+    front of an optional shared store (LLMCacheRepository). Store errors
+    count as misses so the cache can never fail a generation.
+    """
+
+    def __init__(self, store=None, max_size=256, ttl=86400, max_rows=10000,
+                 trim_every=50, enabled=True):
+        self.store = store
+        self.ttl = ttl
+        self.max_rows = max_rows
+        self.trim_every = trim_every
+        self.enabled = enabled
+        self._memory = TTLCache(max_size=max_size, ttl=ttl)
+
+        self.memory_hits = 0
+        self.store_hits = 0
+        self.misses = 0
+        self.bypassed = 0
+        self.writes = 0
+        self.errors = 0
+
+    def get(self, key, bypass=False):
+        if not self.enabled:
+            return None
+        if bypass:
+            self.bypassed += 1
+            return None
+
+        value = self._memory.get(key)
+        if value is not None:
+            self.memory_hits += 1
+            return value
+
+        if self.store is not None:
+            try:
+                value = self.store.get(key, self.ttl)
+            except Exception as e:
+                print("LLM cache read failed:", e)
+                self.errors += 1
+                value = None
+            if value is not None:
+                self.store_hits += 1
+                self._memory.set(key, value)
+                return value
+
+        self.misses += 1
+        return None
+
+    def put(self, key, model, response):
+        if not self.enabled or not response:
+            return
+        self._memory.set(key, response)
+        self.writes += 1
+        if self.store is None:
+            return
+        try:
+            self.store.put(key, model, response)
+            if self.writes % self.trim_every == 0:
+                self.store.trim(self.ttl, self.max_rows)
+        except Exception as e:
+            print("LLM cache write failed:", e)
+            self.errors += 1
+
+    def clear(self):
+        self._memory.clear()
+
+    def stats(self):
+        lookups = self.memory_hits + self.store_hits + self.misses
+        hits = self.memory_hits + self.store_hits
+        return {
+            "enabled": self.enabled,
+            "memory": self._memory.stats(),
+            "memory_hits": self.memory_hits,
+            "store_hits": self.store_hits,
+            "misses": self.misses,
+            "hit_ratio": round(hits / lookups, 3) if lookups else 0.0,
+            "bypassed": self.bypassed,
+            "writes": self.writes,
+            "errors": self.errors,
+        }
+
+
+llm_cache = LLMResponseCache()
+
+
+def configure_llm_cache(store=None, max_size=256, ttl=86400, max_rows=10000, enabled=True):
+    global llm_cache
+    llm_cache = LLMResponseCache(store, max_size=max_size, ttl=ttl, max_rows=max_rows, enabled=enabled)
+    return llm_cache
+
+
+def cached_response(key, bypass=False):
+    return llm_cache.get(key, bypass=bypass)
+
+
+def cache_response(key, model, response):
+    llm_cache.put(key, model, response)
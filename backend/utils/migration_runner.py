@@ -0,0 +1,184 @@
+# migration_runner.py
+import hashlib
+import os
+import re
+import time
+
+MIGRATIONS_DIR = os.path.abspath(
+    os.path.join(os.path.dirname(__file__), '..', '..', 'sql', 'migrations')
+)
+LOCK_NAME = "schema_migrations"
+_FILENAME = re.compile(r"^(\d{4})_([A-Za-z0-9_]+)\.sql$")
+
+CREATE_TRACKING_TABLE = """
+    CREATE TABLE IF NOT EXISTS SchemaMigration (
+        version INT NOT NULL PRIMARY KEY,
+        name VARCHAR(255) NOT NULL,
+        checksum CHAR(64) NOT NULL,
+        durationMs INT NOT NULL,
+        appliedAt DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+    )
+"""
+
+
+class MigrationError(Exception):
+    pass
+
+
+class Migration:
+    def __init__(self, version, name, path, sql):
+        self.version = version
+        self.name = name
+        self.path = path
+        self.sql = sql
+        self.checksum = hashlib.sha256(sql.encode('utf-8')).hexdigest()
+
+    def statements(self):
+        return split_statements(self.sql)
+
+    def __repr__(self):
+        return f"Migration({self.version:04d}_{self.name})"
+
+
+def split_statements(sql):
+    """Strip '--' comment lines and split on ';'. Migrations must not use
+    semicolons inside string literals or define procedures."""
+    lines = [line for line in sql.splitlines() if not line.strip().startswith('--')]
+    return [stmt.strip() for stmt in "\n".join(lines).split(';') if stmt.strip()]
+
+
+def load_migrations(directory=MIGRATIONS_DIR):
+    migrations = []
+    seen = {}
+    for filename in sorted(os.listdir(directory)):
+        if not filename.endswith('.sql'):
+            continue
+        match = _FILENAME.match(filename)
+        if not match:
+            raise MigrationError(f"Bad migration filename: {filename} (expected NNNN_name.sql)")
+        version = int(match.group(1))
+        if version in seen:
+            raise MigrationError(f"Duplicate migration version {version}: {seen[version]}, {filename}")
+        seen[version] = filename
+        path = os.path.join(directory, filename)
+        with open(path, encoding='utf-8') as f:
+            migrations.append(Migration(version, match.group(2), path, f.read()))
+    return migrations
+
+
+class MigrationRunner:
+    """
+    Forward-only runner for the numbered files in sql/migrations.
+    Applied versions are tracked in SchemaMigration together with a
+    checksum of the file and how long it took to apply. A MySQL named
+    lock keeps two deploys from migrating the same database at once.
+    """
+
+    def __init__(self, connection, directory=MIGRATIONS_DIR, lock_timeout=10, clock=time.perf_counter):
+        self.connection = connection
+        self.directory = directory
+        self.lock_timeout = lock_timeout
+        self._clock = clock
+
+    def _ensure_tracking_table(self, cur):
+        cur.execute(CREATE_TRACKING_TABLE)
+
+    def applied(self, cur):
+        cur.execute("SELECT version, name, checksum, durationMs, appliedAt FROM SchemaMigration ORDER BY version")
+        return {row['version']: row for row in cur.fetchall()}
+
+    def status(self):
+        """Return [(migration, applied_row_or_None)] for every file on disk."""
+        cur = self.connection.cursor()
+        try:
+            self._ensure_tracking_table(cur)
+            applied = self.applied(cur)
+        finally:
+            cur.close()
+        return [(m, applied.get(m.version)) for m in load_migrations(self.directory)]
+
+    def pending(self, applied, target=None):
+        migrations = load_migrations(self.directory)
+        for m in migrations:
+            row = applied.get(m.version)
+            if row and row['checksum'] != m.checksum:
+                raise MigrationError(
+                    f"Migration {m.version:04d}_{m.name} was edited after it was applied; "
+                    "add a new migration instead"
+                )
+        known = {m.version for m in migrations}
+        missing = sorted(set(applied) - known)
+        if missing:
+            raise MigrationError(f"Database has migrations not present on disk: {missing}")
+        return [m for m in migrations
+                if m.version not in applied and (target is None or m.version <= target)]
+
+    def _acquire_lock(self, cur):
+        cur.execute("SELECT GET_LOCK(%s, %s) AS acquired", (LOCK_NAME, self.lock_timeout))
+        row = cur.fetchone()
+        if not row or row['acquired'] != 1:
+            raise MigrationError("Another process is running migrations")
+
+    def _release_lock(self, cur):
+        cur.execute("SELECT RELEASE_LOCK(%s)", (LOCK_NAME,))
+        cur.fetchone()
+
+    def migrate(self, target=None, dry_run=False, on_applied=None):
+        """
+        Apply pending migrations in version order up to target (inclusive).
+        Each migration is recorded as soon as it finishes, so a failure
+        leaves every earlier migration in place and the next run resumes.
+        Returns [(migration, duration_ms)] for what was (or would be) applied.
+        """
+        cur = self.connection.cursor()
+        try:
+            self._ensure_tracking_table(cur)
+            self._acquire_lock(cur)
+            try:
+                todo = self.pending(self.applied(cur), target)
+                if dry_run:
+                    return [(m, None) for m in todo]
+
+                done = []
+                for m in todo:
+                    started = self._clock()
+                    try:
+                        for statement in m.statements():
+                            cur.execute(statement)
+                    except Exception as e:
+                        self.connection.rollback()
+                        raise MigrationError(f"Migration {m.version:04d}_{m.name} failed: {e}") from e
+                    duration_ms = int((self._clock() - started) * 1000)
+                    self._record(cur, m, duration_ms)
+                    self.connection.commit()
+                    done.append((m, duration_ms))
+                    if on_applied:
+                        on_applied(m, duration_ms)
+                return done
+            finally:
+                self._release_lock(cur)
+        finally:
+            cur.close()
+
+    def stamp(self, target=None):
+        """Mark migrations as applied without running them (for databases built from tables.sql)."""
+        cur = self.connection.cursor()
+        try:
+            self._ensure_tracking_table(cur)
+            self._acquire_lock(cur)
+            try:
+                todo = self.pending(self.applied(cur), target)
+                for m in todo:
+                    self._record(cur, m, 0)
+                self.connection.commit()
+                return todo
+            finally:
+                self._release_lock(cur)
+        finally:
+            cur.close()
+
+    def _record(self, cur, migration, duration_ms):
+        cur.execute(
+            "INSERT INTO SchemaMigration (version, name, checksum, durationMs) VALUES (%s, %s, %s, %s)",
+            (migration.version, migration.name, migration.checksum, duration_ms)
+        )
@@ -0,0 +1,236 @@
+# session_store.py
+import os
+from abc import ABC, abstractmethod
+import sqlite3
+import threading
+import time
+from utils.cache_utils import TTLCache
+
+
+class SessionStore(ABC):
+    """
+    Token -> user id mapping with expiry and a size cap, plus short-lived
+    flags (put_flag/has_flag) kept apart from sessions so they never count
+    toward the cap or the session stats.
+    """
+
+    def __init__(self, ttl=86400, max_size=10000):
+        self.ttl = ttl
+        self.max_size = max_size
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @abstractmethod
+    def put(self, token, user_id, ttl=None):
+        ...
+
+    @abstractmethod
+    def get(self, token):
+        ...
+
+    @abstractmethod
+    def delete(self, token):
+        ...
+
+    @abstractmethod
+    def sweep(self):
+        ...
+
+    @abstractmethod
+    def size(self):
+        ...
+
+    @abstractmethod
+    def put_flag(self, key, ttl):
+        ...
+
+    @abstractmethod
+    def has_flag(self, key):
+        ...
+
+    def stats(self):
+        return {
+            "backend": type(self).__name__,
+            "size": self.size(),
+            "max_size": self.max_size,
+            "ttl": self.ttl,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class MemorySessionStore(SessionStore):
+    """
+    Per-process store; fine for a single worker or for tests. Every request
+    checks its token here, so run several workers on the sqlite backend.
+    """
+
+    def __init__(self, ttl=86400, max_size=10000, sweep_interval=60, clock=time.monotonic):
+        super().__init__(ttl, max_size)
+        self.sweep_interval = sweep_interval
+        self._clock = clock
+        self._cache = TTLCache(max_size=max_size, ttl=ttl, clock=clock)
+        self._flags = TTLCache(max_size=max_size, ttl=ttl, clock=clock)
+        self._last_sweep = clock()
+
+    def put(self, token, user_id, ttl=None):
+        self._cache.set(token, user_id, ttl)
+        if self._clock() - self._last_sweep >= self.sweep_interval:
+            self.sweep()
+        self.evictions = self._cache.evictions + self._cache.expirations
+
+    def get(self, token):
+        user_id = self._cache.get(token)
+        if user_id is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return user_id
+
+    def delete(self, token):
+        self._cache.pop(token)
+
+    def put_flag(self, key, ttl):
+        self._flags.set(key, True, ttl)
+
+    def has_flag(self, key):
+        return self._flags.get(key) is not None
+
+    def sweep(self):
+        self._flags.sweep()
+        removed = self._cache.sweep()
+        self._last_sweep = self._clock()
+        self.evictions = self._cache.evictions + self._cache.expirations
+        return removed
+
+    def size(self):
+        return len(self._cache)
+
+
+class SQLiteSessionStore(SessionStore):
+    """
+    Store backed by a local SQLite file so every gunicorn worker on the
+    host sees the same sessions. Expired rows are swept, and the size cap
+    enforced, at most once per sweep_interval seconds, piggybacking on
+    writes; between sweeps the table may run past max_size.
+    """
+
+    def __init__(self, path, ttl=86400, max_size=10000, sweep_interval=60, clock=time.time):
+        super().__init__(ttl, max_size)
+        self.path = path
+        self.sweep_interval = sweep_interval
+        self._clock = clock
+        self._local = threading.local()
+        self._last_sweep = 0.0
+
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS session (
+                    token TEXT PRIMARY KEY,
+                    userId INTEGER NOT NULL,
+                    expiresAt REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_session_expires ON session (expiresAt)")
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS flag (
+                    flagKey TEXT PRIMARY KEY,
+                    expiresAt REAL NOT NULL
+                )
+            """)
+
+    def _connect(self):
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    def put(self, token, user_id, ttl=None):
+        ttl = self.ttl if ttl is None else ttl
+        now = self._clock()
+        conn = self._connect()
+        conn.execute(
+            "INSERT OR REPLACE INTO session (token, userId, expiresAt) VALUES (?, ?, ?)",
+            (token, user_id, now + ttl)
+        )
+        if now - self._last_sweep >= self.sweep_interval:
+            self.sweep()
+            self._enforce_cap(conn)
+
+    def _enforce_cap(self, conn):
+        overflow = self.size() - self.max_size
+        if overflow <= 0:
+            return
+        # drop the sessions closest to expiry first
+        cur = conn.execute(
+            """
+            DELETE FROM session WHERE token IN (
+                SELECT token FROM session ORDER BY expiresAt LIMIT ?
+            )
+            """,
+            (overflow,)
+        )
+        self.evictions += cur.rowcount
+
+    def get(self, token):
+        row = self._connect().execute(
+            "SELECT userId FROM session WHERE token=? AND expiresAt > ?",
+            (token, self._clock())
+        ).fetchone()
+        if row is None:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return row[0]
+
+    def delete(self, token):
+        self._connect().execute("DELETE FROM session WHERE token=?", (token,))
+
+    def put_flag(self, key, ttl):
+        self._connect().execute(
+            "INSERT OR REPLACE INTO flag (flagKey, expiresAt) VALUES (?, ?)",
+            (key, self._clock() + ttl)
+        )
+
+    def has_flag(self, key):
+        row = self._connect().execute(
+            "SELECT 1 FROM flag WHERE flagKey=? AND expiresAt > ?",
+            (key, self._clock())
+        ).fetchone()
+        return row is not None
+
+    def sweep(self):
+        now = self._clock()
+        conn = self._connect()
+        conn.execute("DELETE FROM flag WHERE expiresAt <= ?", (now,))
+        cur = conn.execute("DELETE FROM session WHERE expiresAt <= ?", (now,))
+        self._last_sweep = now
+        self.evictions += cur.rowcount
+        return cur.rowcount
+
+    def size(self):
+        return self._connect().execute("SELECT COUNT(*) FROM session").fetchone()[0]
+
+
+def create_session_store(backend="sqlite", path=None, ttl=86400, max_size=10000, workers=1):
+    """
+    Every request checks its token against this store, so it must be shared
+    by all worker processes: the memory backend is refused with more than one.
+    """
+    if backend == "memory":
+        if workers > 1:
+            raise ValueError("SESSION_STORE=memory is per process; use sqlite with more than one worker")
+        return MemorySessionStore(ttl=ttl, max_size=max_size)
+    if backend == "sqlite":
+        if not path:
+            raise ValueError("SESSION_STORE_PATH is required for the sqlite session store")
+        return SQLiteSessionStore(path, ttl=ttl, max_size=max_size)
+    raise ValueError(f"Unknown session store backend: {backend}")
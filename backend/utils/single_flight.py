@@ -0,0 +1,103 @@
+# single_flight.py
+import hashlib
+import threading
+import time
+import uuid
+from concurrent.futures import Future
+
+
+class SingleFlight:
+    """
+    Coalesces concurrent calls that share a key: the first caller runs fn,
+    callers arriving while it runs wait on the same future and get its
+    result (or exception).
+
+    With a lock_store (GenerationLockRepository) the leader also takes a
+    row lock shared by every app process. When another process holds it,
+    the leader waits for that flight to finish and then runs after_wait,
+    which is expected to pick the result up from a shared cache.
+    """
+
+    def __init__(self, lock_store=None, lock_ttl=120, poll_interval=0.5, wait_timeout=180,
+                 clock=time.monotonic, sleep=time.sleep):
+        self.lock_store = lock_store
+        self.lock_ttl = lock_ttl
+        self.poll_interval = poll_interval
+        self.wait_timeout = wait_timeout
+        self._clock = clock
+        self._sleep = sleep
+        self._lock = threading.Lock()
+        self._flights = {}  # key -> Future
+
+        self.leaders = 0
+        self.coalesced = 0
+        self.remote_waits = 0
+        self.lock_errors = 0
+
+    def do(self, key, fn, after_wait=None):
+        with self._lock:
+            future = self._flights.get(key)
+            leader = future is None
+            if leader:
+                future = Future()
+                self._flights[key] = future
+                self.leaders += 1
+            else:
+                self.coalesced += 1
+
+        if not leader:
+            return future.result(timeout=self.wait_timeout)
+
+        try:
+            result = self._lead(key, fn, after_wait or fn)
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            with self._lock:
+                self._flights.pop(key, None)
+
+    def _lead(self, key, fn, after_wait):
+        if self.lock_store is None:
+            return fn()
+
+        lock_key = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        owner = uuid.uuid4().hex
+        deadline = self._clock() + self.wait_timeout
+        waited = False
+        try:
+            while not self.lock_store.acquire(lock_key, owner, self.lock_ttl):
+                if self._clock() >= deadline:
+                    # never fail a generation over the lock; run it anyway
+                    print(f"Gave up waiting for generation lock {lock_key[:12]}")
+                    return fn()
+                waited = True
+                self._sleep(self.poll_interval)
+        except Exception as e:
+            print("Generation lock unavailable, running without it:", e)
+            self.lock_errors += 1
+            return fn()
+
+        if waited:
+            self.remote_waits += 1
+        try:
+            return after_wait() if waited else fn()
+        finally:
+            try:
+                self.lock_store.release(lock_key, owner)
+            except Exception as e:
+                # the row expires after lock_ttl anyway
+                print("Failed to release generation lock:", e)
+                self.lock_errors += 1
+
+    def stats(self):
+        return {
+            "in_flight": len(self._flights),
+            "leaders": self.leaders,
+            "coalesced": self.coalesced,
+            "remote_waits": self.remote_waits,
+            "lock_errors": self.lock_errors,
+        }
@@ -19,6 +19,7 @@ import UserProfilePage from "./features/user/UserProfilePage";
 import ProjectEditWrapper from "./features/projects/ProjectEditWrapper";
 import ResetPassword from "./features/user/ResetPassword";
 import RegisterForm from "./features/auth/RegisterForm";
+import { logoutUser } from "./api/authApi";
 
 export const AuthContext = createContext(null);
 
@@ -37,6 +38,7 @@ const useAuth = () => {
   };
 
   const logout = () => {
+    if (token) logoutUser(token);
     localStorage.removeItem("token");
     localStorage.removeItem("user");
     setToken(null);
@@ -25,6 +25,22 @@ export const loginUser = async (email, password) => {
   }
 };
 
+// End the session on the server so the token stops working; clearing
+// localStorage alone would leave it valid until it expires
+export const logoutUser = async (token) => {
+  try {
+    await fetch(`${API_BASE_URL}/logout`, {
+      method: "POST",
+      headers: {
+        "Content-Type": "application/json",
+        Authorization: `Bearer ${token}`,
+      },
+    });
+  } catch (error) {
+    console.error("API Logout Error:", error);
+  }
+};
+
 // User registration
 export const registerUser = async (userData) => {
   try {
@@ -1 +1,4 @@
 export const API_BASE_URL = "http://localhost:5050/api";
+
+// Stream plans over Server-Sent Events instead of the default background job
+export const STREAM_PLANS = process.env.REACT_APP_STREAM_PLANS === "true";
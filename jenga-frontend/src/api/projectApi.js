@@ -26,6 +26,110 @@ export const submitProject = async (projectData) => {
   }
 };
 
+// Submit and stream the plan as it is generated (Server-Sent Events over a
+// POST, so EventSource can't be used). Calls onProject(projectId) first, then
+// onChunk(text) per piece; resolves with { projectId, promptId, text }.
+export const submitProjectStream = async (projectData, { onProject, onChunk } = {}) => {
+  const token = localStorage.getItem("token");
+
+  const response = await fetch(`${API_BASE_URL}/projects/submit/stream`, {
+    method: "POST",
+    headers: {
+      "Content-Type": "application/json",
+      Accept: "text/event-stream",
+      ...(token ? { Authorization: `Bearer ${token}` } : {}),
+    },
+    body: JSON.stringify(projectData),
+  });
+
+  if (!response.ok) {
+    const data = await response.json();
+    throw new Error(data.error || "Failed to submit project");
+  }
+
+  const reader = response.body.getReader();
+  const decoder = new TextDecoder();
+  const result = { projectId: null, promptId: null, text: "" };
+  let buffer = "";
+
+  const handleEvent = (block) => {
+    let event = "message";
+    let data = "";
+    block.split("\n").forEach((line) => {
+      if (line.startsWith("event: ")) event = line.slice(7);
+      else if (line.startsWith("data: ")) data += line.slice(6);
+    });
+    const payload = data ? JSON.parse(data) : {};
+
+    if (event === "project") {
+      result.projectId = payload.project_id;
+      onProject && onProject(payload.project_id);
+    } else if (event === "chunk") {
+      result.text += payload.text;
+      onChunk && onChunk(payload.text, result.text);
+    } else if (event === "done") {
+      result.promptId = payload.prompt_id;
+    } else if (event === "error") {
+      throw new Error(payload.error || "Plan generation failed");
+    }
+  };
+
+  while (true) {
+    const { done, value } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+
+    let boundary;
+    while ((boundary = buffer.indexOf("\n\n")) !== -1) {
+      handleEvent(buffer.slice(0, boundary));
+      buffer = buffer.slice(boundary + 2);
+    }
+  }
+
+  return result;
+};
+
+// Get the status of a plan generation job; includes llm_response once done
+export const getGenerationJob = async (jobId) => {
+  const token = localStorage.getItem("token");
+
+  const response = await fetch(`${API_BASE_URL}/projects/jobs/${jobId}`, {
+    method: "GET",
+    headers: {
+      "Content-Type": "application/json",
+      Authorization: `Bearer ${token}`,
+    },
+  });
+
+  const data = await response.json();
+
+  if (!response.ok) {
+    throw new Error(data.error || "Failed to fetch generation job");
+  }
+
+  return data.job;
+};
+
+// Poll a generation job until it is done or failed (submit returns before
+// the plan exists). Resolves with the finished job.
+export const waitForGenerationJob = async (jobId, { interval = 2000, timeout = 180000 } = {}) => {
+  const deadline = Date.now() + timeout;
+
+  while (true) {
+    const job = await getGenerationJob(jobId);
+    if (job.status === "done") {
+      return job;
+    }
+    if (job.status === "failed") {
+      throw new Error(job.error || "Plan generation failed");
+    }
+    if (Date.now() + interval > deadline) {
+      throw new Error("Plan generation is taking longer than expected");
+    }
+    await new Promise((resolve) => setTimeout(resolve, interval));
+  }
+};
+
 export const saveProjectDraft = async (projectData) => {
   try {
     const res = await fetch(`${API_BASE_URL}/projects/save`, {
@@ -95,12 +199,21 @@ export const getProjectDetailsById = async (projectId) => {
 };
 
 
-// Get all projects for a specific user by user ID
-export const getProjectsByUserId = async (userId) => {
-   const token = localStorage.getItem("token");
+// Fetch one keyset page from a project list endpoint.
+// options: { limit, cursor, status, sort } -> { projects, nextCursor }
+const fetchProjectPage = async (path, options = {}) => {
+  const token = localStorage.getItem("token");
+
+  const params = new URLSearchParams();
+  Object.entries(options).forEach(([key, value]) => {
+    if (value !== undefined && value !== null && value !== "") {
+      params.append(key, value);
+    }
+  });
+  const query = params.toString() ? `?${params.toString()}` : "";
 
   try {
-    const response = await fetch(`${API_BASE_URL}/projects/user/${userId}`, {
+    const response = await fetch(`${API_BASE_URL}${path}${query}`, {
       method: "GET",
       headers: {
         "Content-Type": "application/json",
@@ -114,9 +227,24 @@ export const getProjectsByUserId = async (userId) => {
 
     const data = await response.json();
 
-    return data.projects; // Return the array of projects
+    return { projects: data.projects, nextCursor: data.next_cursor || null };
   } catch (error) {
     console.error("API Fetch Projects Error:", error);
     throw error;
   }
-};
\ No newline at end of file
+};
+
+// Get one page of project summaries (id, name, status, timestamps) for a user.
+export const getProjectsPage = (userId, options = {}) =>
+  fetchProjectPage(`/projects/user/${userId}`, options);
+
+// Get one page of dashboard cards: summaries plus budget, dates, team size
+// and last generation time, without a detail call per project.
+export const getProjectDashboardPage = (userId, options = {}) =>
+  fetchProjectPage(`/projects/user/${userId}/dashboard`, options);
+
+// Get the first page of projects for a specific user by user ID
+export const getProjectsByUserId = async (userId, options = {}) => {
+  const { projects } = await getProjectsPage(userId, options);
+  return projects; // Return the array of projects
+};
@@ -1,4 +1,4 @@
-import { loginUser, registerUser, updateUserProfile, getAllUsers, deleteUserById } from '../authApi';
+import { loginUser, logoutUser, registerUser, updateUserProfile, getAllUsers, deleteUserById } from '../authApi';
 
 // Mock global fetch
 beforeEach(() => {
@@ -30,6 +30,20 @@ test('loginUser throws error on failure', async () => {
 });
 
 
+test('logoutUser posts the token to /logout', async () => {
+  fetch.mockResolvedValueOnce({ ok: true, json: async () => ({}) });
+  await logoutUser("tok-1");
+  expect(fetch).toHaveBeenCalledWith(
+    expect.stringContaining("/logout"),
+    expect.objectContaining({ method: "POST", headers: expect.objectContaining({ Authorization: "Bearer tok-1" }) })
+  );
+});
+
+test('logoutUser swallows network errors', async () => {
+  fetch.mockRejectedValueOnce(new Error("offline"));
+  await expect(logoutUser("tok-1")).resolves.toBeUndefined();
+});
+
 test('registerUser throws error when not ok', async () => {
   fetch.mockResolvedValueOnce({
     ok: false,
@@ -3,7 +3,8 @@ import {
   saveProjectDraft,
   deleteProject,
   getProjectDetailsById,
-  getProjectsByUserId
+  getProjectsByUserId,
+  waitForGenerationJob
 } from "../projectApi";
 
 // Mock fetch and token
@@ -37,6 +38,25 @@ test("submitProject throws error when not ok", async () => {
   await expect(submitProject({})).rejects.toThrow("Bad request");
 });
 
+test("waitForGenerationJob polls until the job is done", async () => {
+  fetch
+    .mockResolvedValueOnce({ ok: true, json: async () => ({ job: { id: 7, status: "running" } }) })
+    .mockResolvedValueOnce({ ok: true, json: async () => ({ job: { id: 7, status: "done", llm_response: "Plan" } }) });
+
+  const job = await waitForGenerationJob(7, { interval: 0 });
+  expect(fetch).toHaveBeenCalledTimes(2);
+  expect(fetch).toHaveBeenCalledWith(
+    expect.stringContaining("/projects/jobs/7"),
+    expect.objectContaining({ method: "GET" })
+  );
+  expect(job.llm_response).toBe("Plan");
+});
+
+test("waitForGenerationJob throws when the job failed", async () => {
+  fetch.mockResolvedValueOnce({ ok: true, json: async () => ({ job: { id: 7, status: "failed", error: "Gemini down" } }) });
+  await expect(waitForGenerationJob(7, { interval: 0 })).rejects.toThrow("Gemini down");
+});
+
 test("saveProjectDraft returns ok: true and result", async () => {
   fetch.mockResolvedValueOnce({
     ok: true,
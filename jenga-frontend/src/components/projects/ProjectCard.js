@@ -3,6 +3,14 @@ import { useNavigate } from "react-router-dom";
 import { deleteProject } from "../../api/projectApi";
 import "./ProjectCard.css";
 
+// either end of the budget range may be unset
+const formatBudget = (floor, ceiling) => {
+  if (floor != null && ceiling != null) return `$${floor} - $${ceiling}`;
+  if (ceiling != null) return `Up to $${ceiling}`;
+  if (floor != null) return `From $${floor}`;
+  return null;
+};
+
 const ProjectCard = ({ project, onDelete }) => {
   const [isMenuOpen, setIsMenuOpen] = useState(false);
   const [deleting, setDeleting] = useState(false);
@@ -12,7 +20,13 @@ const ProjectCard = ({ project, onDelete }) => {
     ? project.status.toLowerCase()
     : "draft";
   const statusClass =
-    statusKey === "draft" ? "status-draft" : "status-submitted";
+    {
+      draft: "status-draft",
+      generating: "status-generating",
+      failed: "status-failed",
+    }[statusKey] || "status-submitted";
+
+  const budget = formatBudget(project.budgetFloor, project.budgetCeiling);
 
   const handleCardClick = () => {
     navigate(`/projects/${project.id}`);
@@ -92,9 +106,17 @@ const ProjectCard = ({ project, onDelete }) => {
           {project.status || "Draft"}
         </div>
 
-        {project.goalDescription && (
+        {project.memberCount !== undefined && (
+          <p className="status-note">
+            Team: {project.memberCount}
+            {budget && ` | Budget: ${budget}`}
+            {project.endDate &&
+              ` | Due ${new Date(project.endDate).toLocaleDateString()}`}
+          </p>
+        )}
+        {project.dateTimeUpdated && (
           <p className="status-note">
-            {project.goalDescription.substring(0, 50)}...
+            Updated {new Date(project.dateTimeUpdated).toLocaleDateString()}
           </p>
         )}
       </div>
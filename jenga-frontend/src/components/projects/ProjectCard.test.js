@@ -79,3 +79,13 @@ test("delete canceled by user", () => {
   expect(deleteProject).not.toHaveBeenCalled();
   expect(onDeleteMock).not.toHaveBeenCalled();
 });
+
+test.each([
+  [{ budgetFloor: 100, budgetCeiling: 500 }, "Team: 2 | Budget: $100 - $500"],
+  [{ budgetFloor: null, budgetCeiling: 500 }, "Team: 2 | Budget: Up to $500"],
+  [{ budgetFloor: 100, budgetCeiling: null }, "Team: 2 | Budget: From $100"],
+  [{ budgetFloor: null, budgetCeiling: null }, "Team: 2"],
+])("renders budget %j", (budget, expected) => {
+  renderCard({ memberCount: 2, ...budget });
+  expect(screen.getByText(expected)).toBeInTheDocument();
+});
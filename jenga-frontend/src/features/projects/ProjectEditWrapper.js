@@ -3,6 +3,9 @@ import { useParams } from "react-router-dom";
 import ProjectForm from "./ProjectForm";
 import { getProjectDetailsById } from "../../api/projectApi";
 
+// how often to re-fetch a project whose plan is still being generated
+const GENERATING_POLL_INTERVAL = 2000;
+
 const ProjectEditWrapper = () => {
   const { id } = useParams();
   const [projectData, setProjectData] = useState(null);
@@ -10,19 +13,32 @@ const ProjectEditWrapper = () => {
   const [error, setError] = useState(null);
 
   useEffect(() => {
+    let cancelled = false;
+    let timer = null;
+
     const fetchProject = async () => {
-      setLoading(true);
       try {
         const data = await getProjectDetailsById(id);
+        if (cancelled) return;
         setProjectData(data);
+        // the plan is generated in the background; keep checking until it lands
+        if (data && data.status === "generating") {
+          timer = setTimeout(fetchProject, GENERATING_POLL_INTERVAL);
+        }
       } catch (err) {
-        setError(err.message || "Failed to load project");
+        if (!cancelled) setError(err.message || "Failed to load project");
       } finally {
-        setLoading(false);
+        if (!cancelled) setLoading(false);
       }
     };
 
+    setLoading(true);
     fetchProject();
+
+    return () => {
+      cancelled = true;
+      clearTimeout(timer);
+    };
   }, [id]);
 
   if (loading) return <p>Loading…</p>;
@@ -2,7 +2,8 @@ import React, { useState, useEffect } from 'react';
 import './ProjectForm.css';
 import { useNavigate } from 'react-router-dom';
 import { saveProjectDraft } from '../../api/projectApi';
-import { submitProject } from '../../api/projectApi';
+import { submitProject, submitProjectStream, waitForGenerationJob } from '../../api/projectApi';
+import { STREAM_PLANS } from '../../api/config';
 import SuggestionsArea from './SuggestionsArea';
 
 const initialMemberRow = {
@@ -54,6 +55,7 @@ const ProjectForm = ({ initialData = null, isEditMode = false }) => {
             : [initialMemberRow],
       });
       setLlmSuggestions(initialData.llm_response||null);
+      setProjectStatus(initialData.status || '');
     } else {
       setFormData(emptyFormData);
       setLlmSuggestions(null);
@@ -63,6 +65,8 @@ const ProjectForm = ({ initialData = null, isEditMode = false }) => {
   // Use projectId from initialData if present, else null (for new projects)
   const [projectId, setProjectId] = useState(initialData?.id || null);  
   const [projectStatus, setProjectStatus] = useState(initialData?.status || '');
+  // no edits once submitted or while the plan is still streaming in
+  const isLocked = projectStatus === 'submitted' || projectStatus === 'generating';
   const handleInputChange = (e) => {
     const { name, value } = e.target;
     setFormData((prevData) => ({
@@ -153,22 +157,68 @@ const ProjectForm = ({ initialData = null, isEditMode = false }) => {
     };
 
     try {
-      const data = await submitProject(payload);
-
-      if (!projectId) {
-        setProjectId(data.project_id);
-        navigate(`/projects/${data.project_id}`);
+      if (STREAM_PLANS) {
+        await submitStreaming(payload);
+      } else {
+        await submitAsJob(payload);
       }
-      setLlmSuggestions(data.llm_response || null);
-      setProjectStatus("submitted");
-      alert("Project submitted successfully!");
     } catch (error) {
+      setProjectStatus((current) => (current === "generating" ? "failed" : current));
       alert("Failed to submit project");
     } finally {
       setLoading(false);
     }
   };
 
+  // Default: submit returns 202 with a job id and the plan is generated in
+  // the background
+  const submitAsJob = async (payload) => {
+    const data = await submitProject(payload);
+    setProjectStatus("generating");
+
+    if (!projectId) {
+      // the new project's page keeps re-fetching until the plan lands
+      alert("Project submitted! The plan is being generated.");
+      navigate(`/projects/${data.project_id}`);
+      return;
+    }
+
+    const job = await waitForGenerationJob(data.job_id);
+    setLlmSuggestions(job.llm_response || null);
+    setProjectStatus("submitted");
+    alert("Project submitted successfully!");
+  };
+
+  // Opt-in (REACT_APP_STREAM_PLANS=true): the plan streams in as Gemini
+  // writes it. A new project gets its own URL only once the plan is in:
+  // navigating remounts the route and would drop the chunks still arriving.
+  const submitStreaming = async (payload) => {
+    let newProjectId = null;
+    try {
+      const result = await submitProjectStream(payload, {
+        onProject: (createdId) => {
+          setProjectStatus("generating");
+          if (!projectId) {
+            newProjectId = createdId;
+            setProjectId(createdId);
+            window.history.replaceState(window.history.state, "", `/projects/${createdId}`);
+          }
+        },
+        onChunk: (_text, soFar) => {
+          setLoading(false);
+          setLlmSuggestions(soFar);
+        },
+      });
+      setLlmSuggestions(result.text || null);
+      setProjectStatus("submitted");
+      alert("Project submitted successfully!");
+    } finally {
+      if (newProjectId) {
+        navigate(`/projects/${newProjectId}`, { replace: true });
+      }
+    }
+  };
+
 
   // Render form
   return (
@@ -253,7 +303,7 @@ const ProjectForm = ({ initialData = null, isEditMode = false }) => {
                     {formData.team_members.length > 1 && (
                       <button
                         type="button"
-                        disabled={loading || projectStatus === 'submitted'} 
+                        disabled={loading || isLocked} 
                         onClick={() => removeMemberRow(index)}
                         className="remove-row-button"
                       >
@@ -265,7 +315,7 @@ const ProjectForm = ({ initialData = null, isEditMode = false }) => {
               ))}
             </tbody>
           </table>
-          <button type="button" disabled={loading || projectStatus === 'submitted'} onClick={addMemberRow} className="add-member-button">
+          <button type="button" disabled={loading || isLocked} onClick={addMemberRow} className="add-member-button">
             + Add Member
           </button>
         </div>
@@ -320,7 +370,7 @@ const ProjectForm = ({ initialData = null, isEditMode = false }) => {
             type="button"
             onClick={handleSaveDraft}
             className="draft-button"
-            disabled={loading || projectStatus === 'submitted'}
+            disabled={loading || isLocked}
           >
             {loading && status === 'draft' ? 'Saving...' : 'Save as Draft'}
           </button>
@@ -328,7 +378,7 @@ const ProjectForm = ({ initialData = null, isEditMode = false }) => {
             type="button"
             onClick={handleSubmit}
             className="submit-button"
-           disabled={loading || projectStatus === 'submitted'}
+           disabled={loading || isLocked}
           >
             {loading && status !== 'draft' ? 'Submitting...' : 'Submit'}
           </button>
@@ -1,6 +1,6 @@
 import React, { useState, useEffect, useContext } from "react";
 import ProjectCard from "../../components/projects/ProjectCard";
-import { getProjectsByUserId } from "../../api/projectApi";
+import { getProjectDashboardPage } from "../../api/projectApi";
 import { AuthContext } from "../../Router";
 import "./ProjectsDashboard.css";
 
@@ -8,7 +8,9 @@ const ProjectsDashboard = () => {
   const { user } = useContext(AuthContext);
 
   const [projects, setProjects] = useState([]);
+  const [nextCursor, setNextCursor] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [loadingMore, setLoadingMore] = useState(false);
   const [error, setError] = useState(null);
 
   useEffect(() => {
@@ -24,8 +26,9 @@ const ProjectsDashboard = () => {
       setLoading(true);
       setError(null);
       try {
-        const userProjects = await getProjectsByUserId(userId);
-        setProjects(userProjects);
+        const page = await getProjectDashboardPage(userId);
+        setProjects(page.projects);
+        setNextCursor(page.nextCursor);
       } catch (err) {
         setError("Could not load your projects. Please try again.");
         console.error("Fetch Projects Error:", err);
@@ -37,6 +40,20 @@ const ProjectsDashboard = () => {
     fetchProjects();
   }, [user]);
 
+  const handleLoadMore = async () => {
+    setLoadingMore(true);
+    try {
+      const page = await getProjectDashboardPage(user.id, { cursor: nextCursor });
+      setProjects((prev) => [...prev, ...page.projects]);
+      setNextCursor(page.nextCursor);
+    } catch (err) {
+      setError("Could not load your projects. Please try again.");
+      console.error("Fetch Projects Error:", err);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const handleProjectDelete = (deletedProjectId) => {
     setProjects((prev) => prev.filter((p) => p.id !== deletedProjectId));
   };
@@ -59,6 +76,15 @@ const ProjectsDashboard = () => {
           You have not created any projects yet.
         </p>
       )}
+      {nextCursor && (
+        <button
+          className="load-more-button"
+          onClick={handleLoadMore}
+          disabled={loadingMore}
+        >
+          {loadingMore ? "Loading..." : "Load more"}
+        </button>
+      )}
     </div>
   );
 };
@@ -19,6 +19,7 @@ jest.mock("../ProjectForm", () => ({ initialData, isEditMode }) => (
     PROJECT FORM LOADED
     <span data-testid="edit-mode">{isEditMode ? "Edit" : "New"}</span>
     <span data-testid="project-name">{initialData?.name}</span>
+    <span data-testid="project-status">{initialData?.status}</span>
   </div>
 ));
 
@@ -43,3 +44,18 @@ test("shows error message when fetch fails", async () => {
   await waitFor(() => screen.getByText(/api error/i));
   expect(screen.getByText(/api error/i)).toBeInTheDocument();
 });
+
+test("re-fetches a generating project until its plan is ready", async () => {
+  jest.useFakeTimers();
+  getProjectDetailsById
+    .mockResolvedValueOnce({ id: "123", name: "Test Project", status: "generating" })
+    .mockResolvedValueOnce({ id: "123", name: "Test Project", status: "submitted" });
+  render(<ProjectEditWrapper />);
+  await waitFor(() => expect(screen.getByTestId("project-status").textContent).toBe("generating"));
+
+  jest.advanceTimersByTime(2000);
+  await waitFor(() => expect(screen.getByTestId("project-status").textContent).toBe("submitted"));
+  jest.advanceTimersByTime(2000);
+  expect(getProjectDetailsById).toHaveBeenCalledTimes(2);
+  jest.useRealTimers();
+});
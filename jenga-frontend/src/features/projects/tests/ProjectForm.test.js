@@ -12,8 +12,14 @@ jest.mock("react-router-dom", () => ({
 jest.mock("../../../api/projectApi", () => ({
   saveProjectDraft: jest.fn(),
   submitProject: jest.fn(),
+  submitProjectStream: jest.fn(),
+  waitForGenerationJob: jest.fn(),
 }));
-import { saveProjectDraft, submitProject } from "../../../api/projectApi";
+import { saveProjectDraft, submitProject, submitProjectStream, waitForGenerationJob } from "../../../api/projectApi";
+
+// Streaming is opt-in; tests flip it per case
+jest.mock("../../../api/config", () => ({ API_BASE_URL: "", STREAM_PLANS: false }));
+import * as config from "../../../api/config";
 
 // Mock SuggestionsArea (since it may use react-markdown, which can cause Jest ESM errors)
 jest.mock("../SuggestionsArea", () => () => <div data-testid="suggestions-area" />);
@@ -71,12 +77,51 @@ test("shows error alert on draft API failure", async () => {
   await waitFor(() => expect(window.alert).toHaveBeenCalledWith("Error: Save failed"));
 });
 
-test("handleSubmit calls API and navigates", async () => {
-  submitProject.mockResolvedValueOnce({ project_id: "456", llm_response: "LLM" });
+test("handleSubmit queues a job and opens the new project", async () => {
+  window.alert = jest.fn();
+  submitProject.mockResolvedValueOnce({ project_id: "456", job_id: 7, status: "queued" });
   render(<ProjectForm />);
   fillBaseFields();
   fireEvent.click(screen.getByRole("button", { name: /submit/i }));
   await waitFor(() => expect(submitProject).toHaveBeenCalled());
+  // the project page polls until the plan lands
   await waitFor(() => expect(mockNavigate).toHaveBeenCalledWith("/projects/456"));
+  expect(waitForGenerationJob).not.toHaveBeenCalled();
+  expect(submitProjectStream).not.toHaveBeenCalled();
+});
+
+test("handleSubmit on an existing project waits for its job", async () => {
+  window.alert = jest.fn();
+  submitProject.mockResolvedValueOnce({ project_id: "456", job_id: 7, status: "queued" });
+  waitForGenerationJob.mockResolvedValueOnce({ status: "done", llm_response: "LLM" });
+  render(<ProjectForm initialData={{ id: "456", name: "Demo", status: "draft" }} isEditMode={true} />);
+  fillBaseFields();
+  fireEvent.click(screen.getByRole("button", { name: /submit/i }));
+  await waitFor(() => expect(waitForGenerationJob).toHaveBeenCalledWith(7));
   await waitFor(() => expect(window.alert).toHaveBeenCalledWith("Project submitted successfully!"));
+  expect(mockNavigate).not.toHaveBeenCalled();
+});
+
+test("handleSubmit streams the plan when streaming is enabled", async () => {
+  window.alert = jest.fn();
+  config.STREAM_PLANS = true;
+  submitProjectStream.mockImplementationOnce(async (payload, { onProject, onChunk }) => {
+    onProject("456");
+    onChunk("LLM", "LLM");
+    // still on the form while the plan streams in
+    expect(mockNavigate).not.toHaveBeenCalled();
+    expect(window.location.pathname).toBe("/projects/456");
+    return { projectId: "456", promptId: 9, text: "LLM" };
+  });
+  try {
+    render(<ProjectForm />);
+    fillBaseFields();
+    fireEvent.click(screen.getByRole("button", { name: /submit/i }));
+    await waitFor(() => expect(submitProjectStream).toHaveBeenCalled());
+    await waitFor(() => expect(window.alert).toHaveBeenCalledWith("Project submitted successfully!"));
+    await waitFor(() => expect(mockNavigate).toHaveBeenCalledWith("/projects/456", { replace: true }));
+    expect(submitProject).not.toHaveBeenCalled();
+  } finally {
+    config.STREAM_PLANS = false;
+  }
 });
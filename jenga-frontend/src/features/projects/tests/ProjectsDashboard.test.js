@@ -1,14 +1,14 @@
 jest.mock("react-markdown", () => () => <div />);
 import React from "react";
-import { render, screen, waitFor } from "@testing-library/react";
+import { render, screen, waitFor, fireEvent } from "@testing-library/react";
 import ProjectsDashboard from "../ProjectsDashboard";
 import { AuthContext } from "../../../Router";
 
-// Mock getProjectsByUserId API
+// Mock getProjectDashboardPage API
 jest.mock("../../../api/projectApi", () => ({
-  getProjectsByUserId: jest.fn(),
+  getProjectDashboardPage: jest.fn(),
 }));
-import { getProjectsByUserId } from "../../../api/projectApi";
+import { getProjectDashboardPage } from "../../../api/projectApi";
 
 // Mock ProjectCard to focus on dashboard logic
 jest.mock("../../../components/projects/ProjectCard", () => ({ project }) => (
@@ -27,7 +27,7 @@ function renderWithAuthContext(ui, user = userMock) {
 
 test("shows loading spinner initially", () => {
   // Mock unresolved promise to keep loading state
-  getProjectsByUserId.mockReturnValue(new Promise(() => {}));
+  getProjectDashboardPage.mockReturnValue(new Promise(() => {}));
   renderWithAuthContext(<ProjectsDashboard />);
   expect(screen.getByText(/loading projects/i)).toBeInTheDocument();
 });
@@ -38,7 +38,7 @@ test("shows error if user is missing", () => {
 });
 
 test("shows error message if API fails", async () => {
-  getProjectsByUserId.mockRejectedValueOnce(new Error("API Error"));
+  getProjectDashboardPage.mockRejectedValueOnce(new Error("API Error"));
   renderWithAuthContext(<ProjectsDashboard />);
   await waitFor(() =>
     expect(screen.getByText(/could not load your projects/i)).toBeInTheDocument()
@@ -46,7 +46,7 @@ test("shows error message if API fails", async () => {
 });
 
 test("shows empty projects message if none exist", async () => {
-  getProjectsByUserId.mockResolvedValueOnce([]);
+  getProjectDashboardPage.mockResolvedValueOnce({ projects: [], nextCursor: null });
   renderWithAuthContext(<ProjectsDashboard />);
   await waitFor(() =>
     expect(screen.getByText(/You have not created any projects yet./i)).toBeInTheDocument()
@@ -54,12 +54,28 @@ test("shows empty projects message if none exist", async () => {
 });
 
 test("renders ProjectCard for each project", async () => {
-  getProjectsByUserId.mockResolvedValueOnce([
-    { id: "p1", name: "Alpha" },
-    { id: "p2", name: "Beta" },
-  ]);
+  getProjectDashboardPage.mockResolvedValueOnce({
+    projects: [
+      { id: "p1", name: "Alpha" },
+      { id: "p2", name: "Beta" },
+    ],
+    nextCursor: null,
+  });
   renderWithAuthContext(<ProjectsDashboard />);
   await waitFor(() => expect(screen.getAllByTestId("project-card").length).toBe(2));
   expect(screen.getByText("Alpha")).toBeInTheDocument();
   expect(screen.getByText("Beta")).toBeInTheDocument();
 });
+
+test("loads the next page when Load more is clicked", async () => {
+  getProjectDashboardPage
+    .mockResolvedValueOnce({ projects: [{ id: "p1", name: "Alpha" }], nextCursor: "c1" })
+    .mockResolvedValueOnce({ projects: [{ id: "p2", name: "Beta" }], nextCursor: null });
+  renderWithAuthContext(<ProjectsDashboard />);
+
+  fireEvent.click(await screen.findByText(/load more/i));
+
+  await waitFor(() => expect(screen.getAllByTestId("project-card").length).toBe(2));
+  expect(getProjectDashboardPage).toHaveBeenLastCalledWith("u1", { cursor: "c1" });
+  expect(screen.queryByText(/load more/i)).not.toBeInTheDocument();
+});
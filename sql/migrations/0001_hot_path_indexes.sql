@@ -0,0 +1,12 @@
+-- Indexes for the hottest lookups that only had foreign-key indexes
+-- _get_or_create_members: (firstName, lastName) IN (...)
+CREATE INDEX idx_member_name ON Member (firstName, lastName);
+
+-- get_latest_generation_response: WHERE projectId ORDER BY dateTimeCreated DESC LIMIT 1
+CREATE INDEX idx_generation_history_project_created ON GenerationHistory (projectId, dateTimeCreated);
+
+-- save_prompt_version: MAX(version) WHERE projectId
+CREATE INDEX idx_prompt_project_version ON Prompt (projectId, version);
+
+-- project listings filtered by owner and status
+CREATE INDEX idx_project_user_status ON Project (userId, status);
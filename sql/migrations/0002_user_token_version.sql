@@ -0,0 +1,3 @@
+-- Per-user token version; bumping it revokes every token issued before
+ALTER TABLE User
+ADD COLUMN tokenVersion INT NOT NULL DEFAULT 0 AFTER role;
@@ -0,0 +1,7 @@
+-- Keyset pagination and filters for the admin user listing
+ALTER TABLE User
+ADD INDEX idx_user_created (dateTimeCreated, id),
+ADD INDEX idx_user_role_status_created (role, status, dateTimeCreated, id),
+ADD INDEX idx_user_status_created (status, dateTimeCreated, id),
+ADD INDEX idx_user_first_name (firstName),
+ADD INDEX idx_user_last_name (lastName);
@@ -0,0 +1,13 @@
+-- One Budget / Timeframe row per project so saves can upsert in one statement.
+-- Keep the newest row where concurrent saves already left duplicates.
+DELETE older FROM Budget older
+JOIN Budget newer ON older.projectId = newer.projectId AND older.id < newer.id;
+
+DELETE older FROM Timeframe older
+JOIN Timeframe newer ON older.projectId = newer.projectId AND older.id < newer.id;
+
+ALTER TABLE Budget
+ADD UNIQUE KEY uq_budget_project (projectId);
+
+ALTER TABLE Timeframe
+ADD UNIQUE KEY uq_timeframe_project (projectId);
@@ -0,0 +1,6 @@
+-- Project list views: WHERE userId [AND status] ORDER BY dateTimeUpdated DESC, id DESC
+CREATE INDEX idx_project_user_status_updated ON Project (userId, status, dateTimeUpdated);
+CREATE INDEX idx_project_user_updated ON Project (userId, dateTimeUpdated);
+
+-- covered by idx_project_user_status_updated
+DROP INDEX idx_project_user_status ON Project;
@@ -0,0 +1,23 @@
+-- Per-project prompt version counter, allocated with
+-- UPDATE Project SET promptVersion = LAST_INSERT_ID(promptVersion + 1)
+ALTER TABLE Project
+ADD COLUMN promptVersion INT NOT NULL DEFAULT 0 COMMENT 'Last allocated Prompt.version' AFTER status;
+
+-- Renumber versions per project (keeps their order) so concurrent
+-- MAX()+1 collisions from before cannot block the unique key
+UPDATE Prompt P
+JOIN (
+    SELECT id, ROW_NUMBER() OVER (PARTITION BY projectId ORDER BY version, id) AS rn
+    FROM Prompt
+) R ON P.id = R.id
+SET P.version = R.rn, P.dateTimeUpdated = P.dateTimeUpdated;
+
+-- Seed the counter without touching dateTimeUpdated
+UPDATE Project P
+JOIN (SELECT projectId, MAX(version) AS maxVersion FROM Prompt GROUP BY projectId) V
+    ON P.id = V.projectId
+SET P.promptVersion = V.maxVersion, P.dateTimeUpdated = P.dateTimeUpdated;
+
+ALTER TABLE Prompt
+DROP INDEX idx_prompt_project_version,
+ADD UNIQUE KEY uq_prompt_project_version (projectId, version);
@@ -0,0 +1,7 @@
+-- History listings report the body size without reading llmResponse
+ALTER TABLE GenerationHistory
+ADD COLUMN responseSize INT NULL COMMENT 'Bytes in llmResponse, so listings skip the body' AFTER llmResponse;
+
+UPDATE GenerationHistory
+SET responseSize = LENGTH(llmResponse), dateTimeUpdated = dateTimeUpdated
+WHERE responseSize IS NULL;
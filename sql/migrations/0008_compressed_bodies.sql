@@ -0,0 +1,9 @@
+-- Prompt and response bodies become bytes so the app can store them
+-- compressed (marker-prefixed zlib/zstd, see backend/utils/body_codec.py).
+-- Existing rows keep their UTF-8 bytes and still read back as plain text;
+-- run `flask storage compress` afterwards to compress them.
+ALTER TABLE Prompt
+MODIFY prompt MEDIUMBLOB NOT NULL COMMENT 'UTF-8, optionally compressed (utils/body_codec.py)';
+
+ALTER TABLE GenerationHistory
+MODIFY llmResponse MEDIUMBLOB NOT NULL COMMENT 'UTF-8, optionally compressed (utils/body_codec.py)';
@@ -0,0 +1,9 @@
+-- Deletes mark rows first; the purge worker removes them and their
+-- children later in small batches instead of one long cascading DELETE
+ALTER TABLE User
+ADD COLUMN deletedAt DATETIME NULL COMMENT 'Soft delete; rows are purged in the background',
+ADD INDEX idx_user_deleted (deletedAt);
+
+ALTER TABLE Project
+ADD COLUMN deletedAt DATETIME NULL COMMENT 'Soft delete; rows are purged in the background',
+ADD INDEX idx_project_deleted (deletedAt);
@@ -0,0 +1,22 @@
+-- Submits enqueue a job and return at once; app workers run the Gemini
+-- call. Jobs live in the database so a restart picks them back up.
+ALTER TABLE Project
+MODIFY COLUMN status ENUM('draft', 'submitted', 'generating', 'failed') NOT NULL DEFAULT 'draft';
+
+CREATE TABLE GenerationJob (
+    id BIGINT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    projectId BIGINT NOT NULL,
+    status ENUM('queued', 'running', 'done', 'failed') NOT NULL DEFAULT 'queued',
+    payload MEDIUMBLOB NOT NULL COMMENT 'Submitted project JSON, optionally compressed (utils/body_codec.py)',
+    attempts INT NOT NULL DEFAULT 0,
+    lockedBy VARCHAR(64) NULL COMMENT 'Claim token of the worker running the job',
+    lockedAt DATETIME NULL,
+    promptId BIGINT NULL,
+    error TEXT NULL,
+    dateTimeCreated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    dateTimeUpdated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    INDEX idx_generation_job_status (status, id),
+    INDEX idx_generation_job_locked (lockedBy),
+    INDEX idx_generation_job_project (projectId, id),
+    FOREIGN KEY (projectId) REFERENCES Project(id) ON DELETE CASCADE
+);
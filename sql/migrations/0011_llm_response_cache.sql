@@ -0,0 +1,13 @@
+-- Shared tier of the LLM response cache (utils/llm_cache.py); identical
+-- prompts reuse the stored plan instead of calling Gemini again
+CREATE TABLE LLMResponseCache (
+    cacheKey CHAR(64) NOT NULL PRIMARY KEY COMMENT 'sha256 of model, system instruction and normalized prompt',
+    model VARCHAR(100) NOT NULL,
+    response MEDIUMBLOB NOT NULL COMMENT 'UTF-8, optionally compressed (utils/body_codec.py)',
+    responseSize INT NOT NULL,
+    hits INT NOT NULL DEFAULT 0,
+    dateTimeCreated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    lastUsedAt DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_llm_cache_created (dateTimeCreated),
+    INDEX idx_llm_cache_last_used (lastUsedAt)
+);
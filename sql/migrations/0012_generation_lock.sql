@@ -0,0 +1,8 @@
+-- Cross-process single-flight for plan generation (utils/single_flight.py):
+-- one row per in-flight project + prompt hash; expired rows can be taken over
+CREATE TABLE GenerationLock (
+    lockKey CHAR(64) NOT NULL PRIMARY KEY COMMENT 'sha256 of project id and prompt hash',
+    owner VARCHAR(64) NOT NULL,
+    expiresAt DATETIME NOT NULL,
+    dateTimeCreated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
@@ -0,0 +1,4 @@
+-- Admin user listing filtered by role alone: (role, status, ...) can't give
+-- dateTimeCreated order without a status, so that query fell back to a filesort
+ALTER TABLE User
+ADD INDEX idx_user_role_created (role, dateTimeCreated, id);
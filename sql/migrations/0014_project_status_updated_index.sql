@@ -0,0 +1,4 @@
+-- The generation recovery sweep looks for projects stuck in 'generating'
+-- across all users; without this it scans Project on every pass
+ALTER TABLE Project
+ADD INDEX idx_project_status_updated (status, dateTimeUpdated);
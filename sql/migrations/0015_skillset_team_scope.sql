@@ -0,0 +1,18 @@
+-- Member rows are shared by name across projects, so Language/Framework skills
+-- keyed by memberId alone let saving one project's team rewrite another's.
+-- Scope them to the team; teamId stays NULL for skills that belong to the
+-- member everywhere (the seed data).
+ALTER TABLE Skillset
+ADD COLUMN teamId BIGINT NULL AFTER memberId,
+ADD INDEX idx_skillset_team_member (teamId, memberId),
+ADD FOREIGN KEY (teamId) REFERENCES Team(id) ON DELETE CASCADE;
+
+-- Give every team its members' current skills, then drop the unscoped copies.
+INSERT INTO Skillset (memberId, teamId, skill, category, description, level)
+SELECT S.memberId, TM.teamId, S.skill, S.category, S.description, S.level
+FROM Skillset S
+JOIN TeamMember TM ON TM.memberId = S.memberId
+WHERE S.teamId IS NULL AND S.category IN ('Language', 'Framework');
+
+DELETE FROM Skillset
+WHERE teamId IS NULL AND category IN ('Language', 'Framework');
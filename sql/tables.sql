@@ -9,8 +9,17 @@ CREATE TABLE User (
     email VARCHAR(255) NOT NULL UNIQUE,
     status VARCHAR(50) NOT NULL DEFAULT 'active',
     role ENUM('regular', 'admin') NOT NULL DEFAULT 'regular',
+    tokenVersion INT NOT NULL DEFAULT 0,
     dateTimeCreated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
-    dateTimeUpdated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    dateTimeUpdated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    deletedAt DATETIME NULL COMMENT 'Soft delete; rows are purged in the background',
+    INDEX idx_user_deleted (deletedAt),
+    INDEX idx_user_created (dateTimeCreated, id),
+    INDEX idx_user_role_created (role, dateTimeCreated, id),
+    INDEX idx_user_role_status_created (role, status, dateTimeCreated, id),
+    INDEX idx_user_status_created (status, dateTimeCreated, id),
+    INDEX idx_user_first_name (firstName),
+    INDEX idx_user_last_name (lastName)
 );
 
 DROP TABLE IF EXISTS Member;
@@ -19,7 +28,8 @@ CREATE TABLE Member (
     firstName VARCHAR(100) NOT NULL,
     lastName VARCHAR(100) NOT NULL,
     dateTimeCreated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
-    dateTimeUpdated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP
+    dateTimeUpdated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    INDEX idx_member_name (firstName, lastName)
 );
 
 DROP TABLE IF EXISTS Project;
@@ -28,10 +38,16 @@ CREATE TABLE Project (
     name VARCHAR(255) NOT NULL,
     requirementDescription TEXT,
     goalDescription TEXT,
-    status ENUM('draft', 'submitted') NOT NULL DEFAULT 'draft',
+    status ENUM('draft', 'submitted', 'generating', 'failed') NOT NULL DEFAULT 'draft',
+    promptVersion INT NOT NULL DEFAULT 0 COMMENT 'Last allocated Prompt.version',
     userId BIGINT NOT NULL,
     dateTimeCreated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     dateTimeUpdated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    deletedAt DATETIME NULL COMMENT 'Soft delete; rows are purged in the background',
+    INDEX idx_project_deleted (deletedAt),
+    INDEX idx_project_user_status_updated (userId, status, dateTimeUpdated),
+    INDEX idx_project_user_updated (userId, dateTimeUpdated),
+    INDEX idx_project_status_updated (status, dateTimeUpdated),
     FOREIGN KEY (userId) REFERENCES User(id) ON DELETE CASCADE
 );
 
@@ -43,6 +59,7 @@ CREATE TABLE Budget (
     ceiling DECIMAL(10, 2) NOT NULL,
     dateTimeCreated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     dateTimeUpdated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    UNIQUE KEY uq_budget_project (projectId),
     FOREIGN KEY (projectId) REFERENCES Project(id) ON DELETE CASCADE
 );
 
@@ -54,6 +71,7 @@ CREATE TABLE Timeframe (
     endTime DATETIME NOT NULL,
     dateTimeCreated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     dateTimeUpdated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    UNIQUE KEY uq_timeframe_project (projectId),
     FOREIGN KEY (projectId) REFERENCES Project(id) ON DELETE CASCADE
 );
 
@@ -80,23 +98,27 @@ DROP TABLE IF EXISTS Skillset;
 CREATE TABLE Skillset (
     id BIGINT NOT NULL AUTO_INCREMENT PRIMARY KEY,
     memberId BIGINT NOT NULL,
+    teamId BIGINT NULL COMMENT 'set for skills given within one project team',
     skill VARCHAR(100) NOT NULL,
     category VARCHAR(100),
     description TEXT,
     level VARCHAR(50),
     dateTimeCreated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     dateTimeUpdated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-    FOREIGN KEY (memberId) REFERENCES Member(id) ON DELETE CASCADE
+    INDEX idx_skillset_team_member (teamId, memberId),
+    FOREIGN KEY (memberId) REFERENCES Member(id) ON DELETE CASCADE,
+    FOREIGN KEY (teamId) REFERENCES Team(id) ON DELETE CASCADE
 );
 
 DROP TABLE IF EXISTS Prompt;
 CREATE TABLE Prompt (
     id BIGINT NOT NULL AUTO_INCREMENT PRIMARY KEY,
     projectId BIGINT NOT NULL,
-    prompt TEXT NOT NULL,
+    prompt MEDIUMBLOB NOT NULL COMMENT 'UTF-8, optionally compressed (utils/body_codec.py)',
     version INT NOT NULL DEFAULT 0,
     dateTimeCreated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     dateTimeUpdated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    UNIQUE KEY uq_prompt_project_version (projectId, version),
     FOREIGN KEY (projectId) REFERENCES Project(id) ON DELETE CASCADE
 );
 
@@ -105,9 +127,60 @@ CREATE TABLE GenerationHistory (
     id BIGINT NOT NULL AUTO_INCREMENT PRIMARY KEY,
     projectId BIGINT NOT NULL,
     promptId BIGINT NOT NULL,
-    llmResponse TEXT NOT NULL,
+    llmResponse MEDIUMBLOB NOT NULL COMMENT 'UTF-8, optionally compressed (utils/body_codec.py)',
+    responseSize INT NULL COMMENT 'Bytes in llmResponse, so listings skip the body',
     dateTimeCreated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
     dateTimeUpdated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    INDEX idx_generation_history_project_created (projectId, dateTimeCreated),
     FOREIGN KEY (projectId) REFERENCES Project(id) ON DELETE CASCADE,
     FOREIGN KEY (promptId) REFERENCES Prompt(id) ON DELETE CASCADE
-);
\ No newline at end of file
+);
+
+DROP TABLE IF EXISTS GenerationJob;
+CREATE TABLE GenerationJob (
+    id BIGINT NOT NULL AUTO_INCREMENT PRIMARY KEY,
+    projectId BIGINT NOT NULL,
+    status ENUM('queued', 'running', 'done', 'failed') NOT NULL DEFAULT 'queued',
+    payload MEDIUMBLOB NOT NULL COMMENT 'Submitted project JSON, optionally compressed (utils/body_codec.py)',
+    attempts INT NOT NULL DEFAULT 0,
+    lockedBy VARCHAR(64) NULL COMMENT 'Claim token of the worker running the job',
+    lockedAt DATETIME NULL,
+    promptId BIGINT NULL,
+    error TEXT NULL,
+    dateTimeCreated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    dateTimeUpdated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+    INDEX idx_generation_job_status (status, id),
+    INDEX idx_generation_job_locked (lockedBy),
+    INDEX idx_generation_job_project (projectId, id),
+    FOREIGN KEY (projectId) REFERENCES Project(id) ON DELETE CASCADE
+);
+
+DROP TABLE IF EXISTS LLMResponseCache;
+CREATE TABLE LLMResponseCache (
+    cacheKey CHAR(64) NOT NULL PRIMARY KEY COMMENT 'sha256 of model, system instruction and normalized prompt',
+    model VARCHAR(100) NOT NULL,
+    response MEDIUMBLOB NOT NULL COMMENT 'UTF-8, optionally compressed (utils/body_codec.py)',
+    responseSize INT NOT NULL,
+    hits INT NOT NULL DEFAULT 0,
+    dateTimeCreated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    lastUsedAt DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    INDEX idx_llm_cache_created (dateTimeCreated),
+    INDEX idx_llm_cache_last_used (lastUsedAt)
+);
+
+DROP TABLE IF EXISTS GenerationLock;
+CREATE TABLE GenerationLock (
+    lockKey CHAR(64) NOT NULL PRIMARY KEY COMMENT 'sha256 of project id and prompt hash',
+    owner VARCHAR(64) NOT NULL,
+    expiresAt DATETIME NOT NULL,
+    dateTimeCreated DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+DROP TABLE IF EXISTS SchemaMigration;
+CREATE TABLE SchemaMigration (
+    version INT NOT NULL PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    checksum CHAR(64) NOT NULL,
+    durationMs INT NOT NULL,
+    appliedAt DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP
+);